@@ -1,12 +1,19 @@
 import fitz  # PyMuPDF
 from docx import Document
-import pytesseract
 from PIL import Image
 from io import BytesIO
 from pathlib import Path
+import multiprocessing
+import os
 import re
-from typing import Dict, List, Optional, Union
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from caching import ParseCache
+from experience_rules import TITLE_WORDS
+from ocr_engine import OcrBackend, TesseractOcr
 
 SUPPORTED_TYPES = {
     '.pdf': 'pdf',
@@ -16,8 +23,181 @@ SUPPORTED_TYPES = {
     '.jpeg': 'image'
 }
 
+# Bump when extraction or section splitting changes so cached parses are not reused
+PARSER_VERSION = "6"
+
+# Parse workers are started from a fresh server process, never forked from the
+# (multithreaded) web server, where a lock held by another thread would be copied locked
+POOL_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+PdfSource = Union[str, Path, bytes, bytearray, memoryview]
+# Loaded file content, or a Path the extractors open themselves
+FileSource = Union[bytes, memoryview, Path]
+
+
+def _unwrap_bytes(data: Union[bytes, bytearray, memoryview]) -> Union[bytes, bytearray, memoryview]:
+    """The underlying bytes object of a view covering all of it, so it can be shared rather than copied"""
+    if isinstance(data, memoryview) and isinstance(data.obj, bytes) and data.nbytes == len(data.obj):
+        return data.obj
+    return data
+
+
+def _open_source(source: FileSource) -> Union[Path, BytesIO]:
+    # BytesIO shares an initial bytes object until it is written to
+    return source if isinstance(source, Path) else BytesIO(_unwrap_bytes(source))
+
+
+class PdfPageStream:
+    """Lazy, single-pass iterator over the text of each PDF page.
+
+    Opens the document from a path or directly from an in-memory buffer and
+    stops once max_pages pages or max_chars characters have been produced.
+    After iteration, `truncated` tells whether content was left unread.
+
+    With ocr_min_chars set, pages whose text layer has fewer non-space
+    characters than that but which contain images are rendered at ocr_dpi and
+    collected in `scanned` as (page index, grayscale PIL image) for OCR.
+    """
+
+    def __init__(
+        self,
+        source: PdfSource,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        ocr_min_chars: Optional[int] = None,
+        ocr_dpi: int = 200
+    ):
+        self.source = source
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.ocr_min_chars = ocr_min_chars
+        self.ocr_dpi = ocr_dpi
+        self.page_count = 0
+        self.pages_read = 0
+        self.chars_read = 0
+        self.truncated = False
+        self.scanned: List[Tuple[int, Image.Image]] = []
+
+    def _open(self):
+        if isinstance(self.source, (str, Path)):
+            return fitz.open(str(self.source), filetype="pdf")
+        stream = _unwrap_bytes(self.source)
+        if isinstance(stream, memoryview):
+            stream = stream.tobytes()
+        return fitz.open(stream=stream, filetype="pdf")
+
+    def __iter__(self) -> Iterator[str]:
+        doc = self._open()
+        try:
+            self.page_count = doc.page_count
+            for page in doc:
+                if self.max_pages is not None and self.pages_read >= self.max_pages:
+                    self.truncated = True
+                    break
+                text = page.get_text()
+                if self.ocr_min_chars is not None and self._needs_ocr(page, text):
+                    self.scanned.append((self.pages_read, self._rasterize(page)))
+                self.pages_read += 1
+                if self.max_chars is not None and self.chars_read + len(text) > self.max_chars:
+                    text = text[:self.max_chars - self.chars_read]
+                    self.chars_read += len(text)
+                    self.truncated = True
+                    yield text
+                    break
+                self.chars_read += len(text)
+                yield text
+        finally:
+            doc.close()
+
+    def _needs_ocr(self, page, text: str) -> bool:
+        return len(''.join(text.split())) < self.ocr_min_chars and bool(page.get_images())
+
+    def _rasterize(self, page) -> Image.Image:
+        pix = page.get_pixmap(dpi=self.ocr_dpi, colorspace=fitz.csGRAY, alpha=False)
+        return Image.frombytes("L", (pix.width, pix.height), pix.samples)
+
+
+# Contact extraction patterns
+EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[A-Za-z]{2,}')
+PHONE_RE = re.compile(r'(?<![\w/.])(?:\+|00)?\(?\d[\d \t().-]{5,}\d(?![\w/])')
+DATE_RANGE_RE = re.compile(r'^\(?\d{4}\)?\s*[-–]\s*\(?\d{2,4}\)?$|^\d{1,2}[./-]\d{1,2}[./-]\d{2,4}$')
+LINKEDIN_RE = re.compile(r'(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/in/[\w%-]+/?', re.IGNORECASE)
+GITHUB_RE = re.compile(r'(?:https?://)?(?:www\.)?github\.com/[A-Za-z0-9][A-Za-z0-9-]{0,38}/?', re.IGNORECASE)
+NAME_TOKEN_RE = re.compile(r"^[^\W\d_][^\W\d_'.-]*(?:['.-][^\W\d_]*)*\.?$")
+NAME_SPLIT_RE = re.compile(r'\s*[|•·,;]\s*|\s{3,}|\s+[-–]\s+')
+NOT_NAME_WORDS = {'RESUME', 'CV', 'CURRICULUM', 'VITAE', 'BIODATA', 'PROFILE', 'CONTACT', 'ADDRESS', 'PHONE', 'EMAIL'}
+# Headline words: "Data Analyst" or "Aspiring Developer" under the name is not the name
+ROLE_WORDS = TITLE_WORDS | {
+    'student', 'graduate', 'undergraduate', 'fresher', 'professional', 'enthusiast', 'expert', 'aspiring',
+    'freelancer', 'candidate', 'postgraduate', 'data', 'software', 'full-stack', 'fullstack', 'backend', 'frontend'
+}
+
+# National significant number lengths for common dial codes; others use the E.164 range
+PHONE_REGIONS = {
+    '1': (10, 10),     # US / Canada
+    '44': (9, 10),     # UK
+    '91': (10, 10),    # India
+    '61': (9, 9),      # Australia
+    '49': (6, 13),     # Germany
+    '33': (9, 9),      # France
+    '971': (8, 9),     # UAE
+    '65': (8, 8),      # Singapore
+    '92': (9, 10),     # Pakistan
+    '880': (10, 10),   # Bangladesh
+    '234': (8, 10),    # Nigeria
+}
+
+
+# Per-process parser used by ResumeParser.parse_resumes_process workers
+_worker_parser = None
+
+
+def _init_worker(parser_kwargs: Dict):
+    global _worker_parser
+    _worker_parser = ResumeParser(**parser_kwargs)
+
+
+def _parse_in_worker(file_input) -> Tuple[Dict, Optional[str]]:
+    return _worker_parser._parse_uncached(file_input)
+
+
 class ResumeParser:
-    def __init__(self):
+    def __init__(
+        self,
+        process_workers: Optional[int] = None,
+        cache: Optional[ParseCache] = None,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        ocr_min_chars: Optional[int] = 25,
+        ocr_dpi: int = 200,
+        ocr_backend: Optional[OcrBackend] = None,
+        phone_region: Optional[str] = None
+    ):
+        self.cache = cache
+        # Dial code (e.g. '91') assumed for phone numbers written without one
+        self.phone_region = phone_region.lstrip('+') if phone_region else None
+        # PDF budgets; longer documents are cut off and reported as truncated
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        # PDF pages with less native text than ocr_min_chars are OCRed (None disables).
+        # 200 DPI is enough for body-size resume text and is much cheaper than 300.
+        self.ocr_min_chars = ocr_min_chars
+        self.ocr_dpi = ocr_dpi
+        self.ocr_backend = ocr_backend or TesseractOcr()
+        # Keyword arguments used to build an identical parser in each pool worker.
+        # Workers run without the cache; lookups and stores happen in this process.
+        self._worker_kwargs = {
+            'max_pages': max_pages,
+            'max_chars': max_chars,
+            'ocr_min_chars': ocr_min_chars,
+            'ocr_dpi': ocr_dpi,
+            'ocr_backend': self.ocr_backend,
+            'phone_region': self.phone_region
+        }
+        self.process_workers = process_workers or os.cpu_count() or 1
+        self._process_pool = None
+        self._process_pool_workers = 0
+        self._pool_lock = threading.Lock()
         self.section_headers = [
     # Education
     'EDUCATION', 'ACADEMIC BACKGROUND', 'ACADEMIC QUALIFICATIONS', 'EDUCATIONAL QUALIFICATIONS',
@@ -62,115 +242,469 @@ class ResumeParser:
     'PORTFOLIO', 'PROFESSIONAL AFFILIATIONS', 'MEMBERSHIPS', 'PAPERS', 'CONTACT INFORMATION', 'PERSONAL INFORMATION',
     'BIOGRAPHY', 'DECLARATION'
 ]
+        self._build_header_matcher()
 
-    def extract_text(self, file_input: Union[str, Path, BytesIO, object]) -> Optional[str]:
-        """Universal text extractor"""
+    def _build_header_matcher(self):
+        """Precompile section header lookup used by extract_sections.
+
+        A line can only be a header if, with whitespace removed and an optional
+        trailing ':' or '-' dropped, it equals a header with its spaces removed,
+        so a set lookup rejects nearly every line. Candidates are confirmed with
+        one compiled alternation that keeps the original per-header patterns in
+        list order, so the first matching header still wins.
+        """
+        self._header_keys = {header.replace(' ', '').upper() for header in self.section_headers}
+        alternatives = '|'.join(
+            '(' + ''.join(rf'{re.escape(char)}\s*' for char in header) + ')'
+            for header in self.section_headers
+        )
+        self._header_regex = re.compile(rf'^(?:{alternatives})\s*[:-]?\s*$', re.IGNORECASE)
+
+    def match_section_header(self, line: str) -> Optional[str]:
+        """Return the section header a stripped line matches, or None"""
+        if line.isascii():
+            key = ''.join(line.split()).upper()
+            if key not in self._header_keys and not (key[-1:] in (':', '-') and key[:-1] in self._header_keys):
+                return None
+        match = self._header_regex.match(line)
+        if not match:
+            return None
+        return self.section_headers[match.lastindex - 1]
+
+    def _read_input(
+        self,
+        file_input: Union[str, Path, BytesIO, object],
+        load: bool = True
+    ) -> Tuple[FileSource, Optional[str]]:
+        """Return the input's content and file type.
+
+        With load=False a path input is returned as a Path so the extractors
+        can open the file themselves instead of going through an in-memory copy.
+        In-memory inputs (e.g. a BytesIO with a `filename` attribute) come back
+        as a memoryview over their buffer without copying it.
+        """
         if isinstance(file_input, (str, Path)):
             file_path = Path(file_input)
             suffix = file_path.suffix.lower()
             if suffix not in SUPPORTED_TYPES:
                 raise ValueError(f"Unsupported file type: {suffix}")
+            if not load:
+                return file_path, SUPPORTED_TYPES[suffix]
             with open(file_path, 'rb') as f:
-                file_content = f.read()
-            return self._process_content(file_content, SUPPORTED_TYPES[suffix])
-        
+                return f.read(), SUPPORTED_TYPES[suffix]
+
         elif hasattr(file_input, 'read'):
-            file_content = file_input.read()
-            file_input.seek(0)
-            suffix = Path(file_input.filename).suffix.lower()
-            return self._process_content(file_content, SUPPORTED_TYPES.get(suffix))
-        
+            if hasattr(file_input, 'getvalue'):
+                # No copy: BytesIO hands back its bytes object while it is unmodified
+                file_content = file_input.getvalue()
+            else:
+                file_content = file_input.read()
+                file_input.seek(0)
+            filename = getattr(file_input, 'filename', None) or getattr(file_input, 'name', '')
+            suffix = Path(str(filename)).suffix.lower()
+            return memoryview(file_content), SUPPORTED_TYPES.get(suffix)
+
         raise TypeError("Input must be a path, file-like object, or stream")
 
-    def _process_content(self, content: bytes, file_type: str) -> str:
+    def _cache_key(self, content: FileSource) -> Optional[str]:
+        if self.cache is None or isinstance(content, Path):
+            return None
+        # Budgets and OCR settings change the extracted text, so they are part of the key
+        return ParseCache.key(
+            content,
+            f"{PARSER_VERSION}:{self.max_pages}:{self.max_chars}:{self.ocr_min_chars}:{self.ocr_dpi}"
+        )
+
+    def extract_text(self, file_input: Union[str, Path, BytesIO, object]) -> Optional[str]:
+        """Universal text extractor"""
+        source, file_type = self._read_input(file_input, load=self.cache is not None)
+        key = self._cache_key(source)
+        if key:
+            entry = self.cache.get(key)
+            if entry is not None:
+                return entry['text']
+        text, truncated = self._extract_content(source, file_type)
+        if key and text:
+            self.cache.put(key, {'text': text, 'result': None, 'truncated': truncated})
+        return text
+
+    def _extract_content(self, source: FileSource, file_type: Optional[str]) -> Tuple[str, bool]:
+        """Extract text from file content or a path, returning (text, truncated)"""
         try:
             if file_type == 'pdf':
-                return self._extract_pdf(BytesIO(content))
+                return self._extract_pdf(source)
             elif file_type == 'docx':
-                return self._extract_docx(BytesIO(content))
+                return self._extract_docx(source), False
             elif file_type == 'image':
-                return self._extract_image(BytesIO(content))
+                return self._extract_image(source), False
             else:
                 raise ValueError(f"Unsupported type: {file_type}")
         except Exception as e:
             raise RuntimeError(f"Text extraction failed: {str(e)}")
 
-    def _extract_pdf(self, file_stream: BytesIO) -> str:
-        doc = fitz.open(stream=file_stream, filetype="pdf")
-        return "\n".join(page.get_text() for page in doc)
+    def iter_pdf_pages(
+        self,
+        source: PdfSource,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ) -> PdfPageStream:
+        """Page-wise PDF text (native text layer only), limited by the given budgets or the parser's defaults.
+
+        The stream can be passed straight to extract_sections, which then stops
+        reading pages as soon as a budget is exhausted.
+        """
+        return PdfPageStream(
+            source,
+            max_pages=max_pages if max_pages is not None else self.max_pages,
+            max_chars=max_chars if max_chars is not None else self.max_chars
+        )
+
+    def _extract_pdf(self, source: PdfSource) -> Tuple[str, bool]:
+        """Native text for pages that have it, OCR only for scanned pages"""
+        pages = PdfPageStream(
+            source,
+            max_pages=self.max_pages,
+            max_chars=self.max_chars,
+            ocr_min_chars=self.ocr_min_chars,
+            ocr_dpi=self.ocr_dpi
+        )
+        texts = list(pages)
+        truncated = pages.truncated
+        if pages.scanned:
+            ocr_texts = self._ocr_images([image for _, image in pages.scanned], close=True)
+            for (index, _), ocr_text in zip(pages.scanned, ocr_texts):
+                if index < len(texts):
+                    texts[index] = ocr_text
+        text = "\n".join(texts)
+        if self.max_chars is not None and len(text) > self.max_chars:
+            text = text[:self.max_chars]
+            truncated = True
+        return text, truncated
+
+    def _ocr_images(self, images: List[Image.Image], close: bool = False) -> List[str]:
+        """OCR images through the configured backend, preserving order"""
+        try:
+            return self.ocr_backend.recognize(images)
+        finally:
+            if close:
+                for image in images:
+                    image.close()
 
-    def _extract_docx(self, file_stream: BytesIO) -> str:
-        return "\n".join(p.text for p in Document(file_stream).paragraphs if p.text)
+    def _extract_docx(self, source: FileSource) -> str:
+        return "\n".join(p.text for p in Document(_open_source(source)).paragraphs if p.text)
 
-    def _extract_image(self, file_stream: BytesIO) -> str:
-        with Image.open(file_stream) as img:
-            return pytesseract.image_to_string(img)
+    def _extract_image(self, source: FileSource) -> str:
+        with Image.open(_open_source(source)) as img:
+            return self._ocr_images([img])[0]
 
-    def extract_sections(self, text: str) -> Dict[str, str]:
+    def extract_sections(self, text: Union[str, Iterable[str]]) -> Dict[str, str]:
+        """Split resume text into sections.
+
+        `text` is either the full text or an iterable of chunks such as a
+        PdfPageStream, which is consumed lazily page by page.
+        """
         sections = {}
         current_section = "HEADER"
         current_content = []
-        
-        for line in text.split('\n'):
+        chunks = [text] if isinstance(text, str) else text
+
+        for line in (line for chunk in chunks for line in chunk.split('\n')):
             line = line.strip()
             if not line:
                 continue
-            is_header = False
-            for header in self.section_headers:
-                pattern = r'^' + ''.join(f'{char}\s*' for char in header) + r'\s*[:-]?\s*$'
-                if re.match(pattern, line, re.IGNORECASE):
-                    if current_content:
-                        sections[current_section] = '\n'.join(current_content)
-                    current_section = header
-                    current_content = []
-                    is_header = True
-                    break
-            if not is_header:
+            header = self.match_section_header(line)
+            if header:
+                if current_content:
+                    sections[current_section] = '\n'.join(current_content)
+                current_section = header
+                current_content = []
+            else:
                 current_content.append(line)
         if current_content:
             sections[current_section] = '\n'.join(current_content)
         return sections
 
 
-    def extract_contact_info(self, text: str) -> Dict[str, str]:
-        contact_info = {}
+    def _match_phone(self, candidate: str) -> Tuple[Optional[str], float]:
+        """Validate a phone candidate; returns (number, score) with score 0 if rejected"""
+        candidate = candidate.strip(' .-')
+        if candidate.count('(') != candidate.count(')'):
+            candidate = candidate.strip('()')
+        if DATE_RANGE_RE.match(candidate):
+            return None, 0.0
+        digits = re.sub(r'\D', '', candidate)
+        international = candidate.startswith(('+', '00'))
+        if candidate.startswith('00'):
+            digits = digits[2:]
+        if not 7 <= len(digits) <= 15:
+            return None, 0.0
 
-        # Basic name extraction from HEADER
-        for line in text.split('\n'):
-            line = line.strip()
-            if line:
-                contact_info['name'] = line
-                break  # First non-empty line
+        if international:
+            for code_len in (1, 2, 3):
+                code = digits[:code_len]
+                if code in PHONE_REGIONS:
+                    low, high = PHONE_REGIONS[code]
+                    if low <= len(digits) - code_len <= high:
+                        return candidate, 1.0
+            return candidate, 0.7
 
-        # Email and phone patterns
-        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-        phone_pattern = r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}'
+        national = digits[1:] if digits.startswith('0') else digits
+        if self.phone_region in PHONE_REGIONS:
+            low, high = PHONE_REGIONS[self.phone_region]
+            return (candidate, 1.0) if low <= len(national) <= high else (None, 0.0)
+        return candidate, 0.8 if 8 <= len(digits) <= 12 else 0.5
 
-        if match := re.search(email_pattern, text):
-            contact_info['email'] = match.group()
-        if match := re.search(phone_pattern, text):
-            contact_info['phone'] = match.group()
+    def _match_name(self, lines: List[str]) -> Tuple[Optional[str], float]:
+        """Name heuristic over the first lines of the resume, before its first section"""
+        single_word = None
+        for position, line in enumerate(lines[:5]):
+            if '@' in line or 'http' in line.lower() or 'www.' in line.lower():
+                continue
+            candidate = NAME_SPLIT_RE.split(line)[0].strip()
+            if self.match_section_header(line) or self.match_section_header(candidate):
+                break
+            words = candidate.split()
+            if not 1 <= len(words) <= 4 or not all(NAME_TOKEN_RE.match(w) for w in words):
+                continue
+            if any(w.upper().strip('.') in NOT_NAME_WORDS or w.lower().strip('.') in ROLE_WORDS for w in words):
+                continue
+            if not (candidate.isupper() or all(w[0].isupper() for w in words)):
+                continue
+            if len(words) == 1:
+                # A lone word is a weak guess ("PRIYANKA"); keep looking for a full name
+                if position == 0:
+                    single_word = candidate
+                continue
+            score = 1.0 if position == 0 else 0.8
+            if len(words) == 4:
+                score -= 0.2
+            return candidate, score
+        if single_word:
+            return single_word, 0.5
+        return None, 0.0
+
+    def extract_contact_info(self, text: str) -> Dict[str, Union[str, float, None]]:
+        """Local contact extraction: name, email, phone, LinkedIn and GitHub URLs.
 
-        return contact_info
+        `confidence` (0.0 to 1.0) weighs the name heuristic most, then email,
+        then phone, and never exceeds the name score, so an uncertain name is
+        not trusted however complete the rest is; callers can skip LLM contact
+        extraction above a threshold.
+        """
+        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        name, name_score = self._match_name(lines)
 
+        email_match = EMAIL_RE.search(text)
+        email = email_match.group().rstrip('.') if email_match else None
+
+        phone, phone_score = None, 0.0
+        for match in PHONE_RE.finditer(text):
+            phone, phone_score = self._match_phone(match.group())
+            if phone:
+                break
+
+        linkedin = LINKEDIN_RE.search(text)
+        github = GITHUB_RE.search(text)
+        confidence = min(name_score, 0.5 * name_score + (0.35 if email else 0.0) + 0.15 * phone_score)
+        return {
+            'name': name,
+            'email': email,
+            'phone': phone,
+            'linkedin': linkedin.group() if linkedin else None,
+            'github': github.group() if github else None,
+            'confidence': round(confidence, 2)
+        }
+
+    def _parse_text(self, text: str, truncated: bool = False) -> Dict:
+        result = {
+            'sections': self.extract_sections(text),
+            'contact_info': self.extract_contact_info(text),
+          }
+        if truncated:
+            result['truncated'] = True
+        return result
+
+    def _parse_content(self, source: FileSource, file_type: Optional[str]) -> Tuple[Dict, Optional[str]]:
+        """Parse file content or a path, returning the parse result and the extracted text"""
+        text, truncated = self._extract_content(source, file_type)
+        if not text:
+            return {'error': 'No text extracted'}, None
+        return self._parse_text(text, truncated), text
+
+    def _parse_uncached(self, file_input) -> Tuple[Dict, Optional[str]]:
+        try:
+            source, file_type = self._read_input(file_input, load=False)
+            return self._parse_content(source, file_type)
+        except Exception as e:
+            return {'error': str(e)}, None
+
+    def _cached_parse(self, key: Optional[str]) -> Optional[Dict]:
+        if not key:
+            return None
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        if entry.get('result') is None:
+            # Text was cached by extract_text; only the text parsing is left
+            entry = dict(entry, result=self._parse_text(entry['text'], entry.get('truncated', False)))
+            self.cache.put(key, entry)
+        return {k: dict(v) if isinstance(v, dict) else v for k, v in entry['result'].items()}
+
+    def _store_parse(self, key: Optional[str], result: Dict, text: Optional[str]):
+        if key and text and 'sections' in result:
+            self.cache.put(key, {
+                'text': text,
+                'result': result,
+                'truncated': result.get('truncated', False)
+            })
+
+    def _parse_loaded(self, source: FileSource, file_type: Optional[str]) -> Dict:
+        key = self._cache_key(source)
+        cached = self._cached_parse(key)
+        if cached is not None:
+            return cached
+        result, text = self._parse_content(source, file_type)
+        self._store_parse(key, result, text)
+        return result
 
     def parse_resume(self, file_input) -> Dict:
         try:
-            text = self.extract_text(file_input)
-            if not text:
-                return {'error': 'No text extracted'}
-            return {
-                'sections': self.extract_sections(text),
-                #'contact_info': self.extract_contact_info(text),
-              }
+            source, file_type = self._read_input(file_input, load=self.cache is not None)
+            return self._parse_loaded(source, file_type)
         except Exception as e:
             return {'error': str(e)}
 
+    def _parse_image_batch(self, jobs: List[Tuple[int, FileSource]], results: List[Optional[Dict]]):
+        """OCR several image resumes in one backend call and fill in their results"""
+        pending = []
+        for i, source in jobs:
+            key = self._cache_key(source)
+            cached = self._cached_parse(key)
+            if cached is not None:
+                results[i] = cached
+                continue
+            try:
+                image = Image.open(_open_source(source))
+                image.load()
+            except Exception as e:
+                results[i] = {'error': f"Text extraction failed: {str(e)}"}
+                continue
+            pending.append((i, key, image))
+        if not pending:
+            return
+
+        try:
+            texts = self._ocr_images([image for _, _, image in pending], close=True)
+        except Exception as e:
+            for i, _, _ in pending:
+                results[i] = {'error': f"Text extraction failed: {str(e)}"}
+            return
+
+        for (i, key, _), text in zip(pending, texts):
+            try:
+                result = self._parse_text(text) if text else {'error': 'No text extracted'}
+                self._store_parse(key, result, text)
+                results[i] = result
+            except Exception as e:
+                results[i] = {'error': str(e)}
+
     def parse_resumes(self, file_inputs: List) -> List[Dict]:
-        """Sequential batch parser"""
-        return [self.parse_resume(file_input) for file_input in file_inputs]
+        """Sequential batch parser; image resumes are OCRed together in one batch"""
+        results: List[Optional[Dict]] = [None] * len(file_inputs)
+        image_jobs = []
+        for i, file_input in enumerate(file_inputs):
+            try:
+                source, file_type = self._read_input(file_input, load=self.cache is not None)
+                if file_type == 'image':
+                    image_jobs.append((i, source))
+                else:
+                    results[i] = self._parse_loaded(source, file_type)
+            except Exception as e:
+                results[i] = {'error': str(e)}
+        if image_jobs:
+            self._parse_image_batch(image_jobs, results)
+        return results
 
     def parse_resumes_parallel(self, file_inputs: List, max_workers: int = 4) -> List[Dict]:
         """Parallel batch parser using threads"""
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             return list(executor.map(self.parse_resume, file_inputs))
+
+    def _get_process_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._process_pool is not None and self._process_pool_workers != max_workers:
+                self._process_pool.shutdown(wait=False)
+                self._process_pool = None
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context(POOL_START_METHOD),
+                    initializer=_init_worker,
+                    initargs=(self._worker_kwargs,)
+                )
+                self._process_pool_workers = max_workers
+            return self._process_pool
+
+    def shutdown_process_pool(self, wait: bool = True):
+        with self._pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=wait)
+                self._process_pool = None
+                self._process_pool_workers = 0
+
+    def parse_resumes_process(
+        self,
+        file_inputs: List,
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None
+    ) -> List[Dict]:
+        """Parallel batch parser using a long-lived process pool.
+
+        Paths and in-memory BytesIO uploads are sent to the workers; other
+        inputs (open files, streams) are parsed in this process. Results keep
+        the input order.
+        """
+        max_workers = max_workers or self.process_workers
+        results: List[Optional[Dict]] = [None] * len(file_inputs)
+        keys: Dict[int, Optional[str]] = {}
+        pooled = []
+        for i, file_input in enumerate(file_inputs):
+            if not isinstance(file_input, (str, Path, BytesIO)):
+                results[i] = self.parse_resume(file_input)
+                continue
+            if self.cache is not None:
+                try:
+                    content, _ = self._read_input(file_input)
+                except Exception as e:
+                    results[i] = {'error': str(e)}
+                    continue
+                keys[i] = self._cache_key(content)
+                cached = self._cached_parse(keys[i])
+                if cached is not None:
+                    results[i] = cached
+                    continue
+            pooled.append(i)
+
+        if len(pooled) <= 1 or max_workers <= 1:
+            for i in pooled:
+                result, text = self._parse_uncached(file_inputs[i])
+                self._store_parse(keys.get(i), result, text)
+                results[i] = result
+            return results
+
+        if chunksize is None:
+            # A few chunks per worker balances IPC overhead against stragglers
+            chunksize = max(1, len(pooled) // (max_workers * 4))
+
+        pool = self._get_process_pool(max_workers)
+        try:
+            parsed = pool.map(_parse_in_worker, [file_inputs[i] for i in pooled], chunksize=chunksize)
+            for i, (result, text) in zip(pooled, parsed):
+                self._store_parse(keys.get(i), result, text)
+                results[i] = result
+        except BrokenProcessPool as e:
+            self.shutdown_process_pool(wait=False)
+            for i in pooled:
+                if results[i] is None:
+                    results[i] = {'error': f"Parser worker crashed: {e}"}
+        return results
@@ -1,19 +1,49 @@
-import requests
+import asyncio
 import json
+import logging
 import re
-import os
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+
+from experience_rules import RuleBasedExperienceParser
+from llm_client import LLMClient, get_llm_client
+from llm_scheduler import LLMScheduler, get_llm_scheduler
+from token_budget import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+CONTACT_FIELDS = ("name", "email", "phone")
+EXPERIENCE_MODES = ("llm", "hybrid", "local")
+
+# Bump when the extraction prompt changes so cached LLM responses are not reused
+PROMPT_VERSION = "1"
+
+# Prompt tokens charged per resume for its marker line and JSON wrapper
+PACK_ITEM_OVERHEAD_TOKENS = 20
 
-from dotenv import load_dotenv
-load_dotenv()  # Optional: only if using .env
 
 class ExperienceExtractorAndParser:
-    def __init__(self):
-        self.api_key = os.getenv("GROQ_API_KEY")
-        if not self.api_key:
-            raise ValueError("Missing GROQ_API_KEY in environment variables")
-        self.api_url = "https://api.groq.com/openai/v1/chat/completions"
-        self.model = "meta-llama/llama-4-scout-17b-16e-instruct"
+    def __init__(
+        self,
+        contact_confidence_threshold: float = 0.8,
+        timeout: float = 60.0,
+        client: Optional[LLMClient] = None,
+        scheduler: Optional[LLMScheduler] = None,
+        mode: str = "llm",
+        local_confidence_threshold: float = 0.8
+    ):
+        # Local contact info (ResumeParser.extract_contact_info) at or above this
+        # confidence is trusted and not requested from the LLM
+        self.contact_confidence_threshold = contact_confidence_threshold
+        # "llm": experience always comes from the LLM; "local": from RuleBasedExperienceParser only;
+        # "hybrid": the local parse is used when its confidence reaches local_confidence_threshold
+        if mode not in EXPERIENCE_MODES:
+            raise ValueError(f"Unknown experience mode {mode!r}; expected one of {EXPERIENCE_MODES}")
+        self.mode = mode
+        self.local_confidence_threshold = local_confidence_threshold
+        self.rule_parser = RuleBasedExperienceParser()
+        self.client = client or get_llm_client()
+        self.scheduler = scheduler or get_llm_scheduler()
+        self.timeout = timeout
 
         self.default_priority = [
             {'PROFESSIONAL EXPERIENCE', 'EXPERIENCE', 'WORK EXPERIENCE', 'EMPLOYMENT HISTORY',
@@ -57,21 +87,37 @@ class ExperienceExtractorAndParser:
         cleaned_json = match.group(1)
         return json.loads(cleaned_json)
 
-    def parse_contact_and_experience(self, combined_text: str) -> Dict:
-        prompt = [
+    @staticmethod
+    def _field_spec(include_contact: bool, include_experience: bool, nullable: bool = False) -> str:
+        """Field list for the extraction prompt"""
+        kind = "string or null" if nullable else "string"
+        contact_fields = (
+            f"- name ({kind})\n"
+            f"- email ({kind})\n"
+            f"- phone ({kind})\n"
+        ) if include_contact else ""
+        experience_fields = (
+            "- experience: a list of objects with\n"
+            "   - job_title (string)\n"
+            "   - company (string)\n"
+            "   - duration: {start, end}\n"
+            "   - location (string)\n"
+            "   - responsibilities: list of strings\n"
+        ) if include_experience else ""
+        return contact_fields + experience_fields
+
+    def _build_messages(
+        self,
+        combined_text: str,
+        include_contact: bool = True,
+        include_experience: bool = True
+    ) -> List[Dict[str, str]]:
+        return [
             {
                 "role": "system",
                 "content": (
                     "You are an expert resume parser. Extract and return a structured JSON with these fields:\n"
-                    "- name (string)\n"
-                    "- email (string)\n"
-                    "- phone (string)\n"
-                    "- experience: a list of objects with\n"
-                    "   - job_title (string)\n"
-                    "   - company (string)\n"
-                    "   - duration: {start, end}\n"
-                    "   - location (string)\n"
-                    "   - responsibilities: list of strings\n"
+                    f"{self._field_spec(include_contact, include_experience)}"
                     "Return only valid JSON without explanation."
                 )
             },
@@ -81,47 +127,209 @@ class ExperienceExtractorAndParser:
             }
         ]
 
-        response = requests.post(
-            self.api_url,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
+    def _build_packed_messages(
+        self,
+        items: List[Tuple[str, str]],
+        include_contact: bool = True,
+        include_experience: bool = True
+    ) -> List[Dict[str, str]]:
+        """One prompt for several resumes that all need the same fields"""
+        resumes = "\n\n".join(f"=== RESUME {item_id} ===\n{text}" for item_id, text in items)
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "You are an expert resume parser. You will get several resumes, each starting with a line "
+                    "'=== RESUME <id> ==='. Return a JSON array with one object per resume, in the same order, "
+                    "each with these fields:\n"
+                    "- id (string, copied from the resume's marker line)\n"
+                    f"{self._field_spec(include_contact, include_experience, nullable=True)}"
+                    "Never mix information between resumes. Return only valid JSON without explanation."
+                )
             },
-            json={
-                "model": self.model,
-                "messages": prompt,
-                "temperature": 0.2
+            {
+                "role": "user",
+                "content": f"Here is the relevant text from {len(items)} resumes:\n\n{resumes}\n\n"
+                           "Return the JSON array as specified."
             }
+        ]
+
+    def _to_result(self, data: Dict, include_contact: bool) -> Dict:
+        result = {"experience": data.get("experience", [])}
+        if include_contact:
+            result["contact_info"] = {field: data.get(field) for field in CONTACT_FIELDS}
+        return result
+
+    def _parse_output(self, raw_output: str, messages: List[Dict[str, str]], include_contact: bool) -> Dict:
+        try:
+            data = self._clean_response(raw_output)
+        except ValueError:
+            # Don't keep serving an unparseable answer from the response cache
+            self.client.evict_cached(messages, PROMPT_VERSION, temperature=0.2)
+            raise
+        return self._to_result(data, include_contact)
+
+    def _parse_packed_output(self, raw_output: str, messages: List[Dict[str, str]], ids: List[str]) -> Dict[str, Dict]:
+        """Split a packed response into {id: entry}; ids missing from it are left out"""
+        try:
+            match = re.search(r"```json\s*(.*?)```", raw_output, re.DOTALL) or re.search(r"(\[.*\])", raw_output, re.DOTALL)
+            if not match:
+                raise ValueError("No JSON array found in model output")
+            data = json.loads(match.group(1))
+            if isinstance(data, dict):
+                data = data.get("results", data.get("resumes"))
+            if not isinstance(data, list):
+                raise ValueError("Packed model output is not a JSON array")
+        except ValueError:
+            self.client.evict_cached(messages, PROMPT_VERSION, temperature=0.2)
+            raise
+
+        entries = {}
+        for entry in data:
+            if not isinstance(entry, dict) or not isinstance(entry.get("experience", []), list):
+                continue
+            item_id = str(entry.get("id", "")).strip()
+            if item_id in ids and item_id not in entries:
+                entries[item_id] = entry
+        return entries
+
+    def parse_contact_and_experience(
+        self,
+        combined_text: str,
+        include_contact: bool = True,
+        use_cache: bool = True,
+        include_experience: bool = True
+    ) -> Dict:
+        messages = self._build_messages(combined_text, include_contact, include_experience)
+        raw_output = self.client.chat(
+            messages,
+            temperature=0.2,
+            timeout=self.timeout,
+            prompt_version=PROMPT_VERSION,
+            use_cache=use_cache
         )
+        return self._parse_output(raw_output, messages, include_contact)
 
-        if response.status_code != 200:
-            raise Exception(f"Groq API error {response.status_code}: {response.text}")
+    async def parse_contact_and_experience_async(
+        self,
+        combined_text: str,
+        include_contact: bool = True,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+        include_experience: bool = True
+    ) -> Dict:
+        messages = self._build_messages(combined_text, include_contact, include_experience)
+        raw_output = await self.client.achat(
+            messages,
+            temperature=0.2,
+            timeout=timeout or self.timeout,
+            prompt_version=PROMPT_VERSION,
+            use_cache=use_cache
+        )
+        return self._parse_output(raw_output, messages, include_contact)
 
-        raw_output = response.json()["choices"][0]["message"]["content"]
-        data = self._clean_response(raw_output)
-        return {
-            "contact_info": {
-                "name": data.get("name"),
-                "email": data.get("email"),
-                "phone": data.get("phone")
-            },
-            "experience": data.get("experience", [])
-        }
+    def local_contact(self, parsed_resume: Dict[str, Union[str, Dict]]) -> Dict:
+        """Contact info found by ResumeParser, or an empty dict"""
+        return parsed_resume.get("contact_info") or {}
+
+    def is_contact_trusted(self, parsed_resume: Dict[str, Union[str, Dict]]) -> bool:
+        return (self.local_contact(parsed_resume).get("confidence") or 0) >= self.contact_confidence_threshold
 
-    def extract_and_parse(self, parsed_resume: Dict[str, Union[str, Dict]]) -> Dict:
+    def _merge_contact(self, parsed_resume: Dict[str, Union[str, Dict]], result: Dict) -> Dict:
+        """Use trusted local contact info as is; otherwise fill gaps in the LLM's answer from it"""
+        local = self.local_contact(parsed_resume)
+        llm_contact = result.get("contact_info") or {}
+        if self.is_contact_trusted(parsed_resume):
+            contact = dict(local)
+        else:
+            contact = dict(local, **{k: v for k, v in llm_contact.items() if v})
+            for field in CONTACT_FIELDS:
+                contact.setdefault(field, None)
+        return dict(result, contact_info=contact)
+
+    def _prepare_text(self, parsed_resume: Dict[str, Union[str, Dict]]) -> str:
+        """Text to send to the LLM; the header is left out when local contact info is trusted"""
+        experience_text = self.extract_experience_text(parsed_resume, format_output=True).strip()
+        if self.is_contact_trusted(parsed_resume):
+            return experience_text
         header_text = parsed_resume.get("sections", {}).get("HEADER", "")
-        experience_text = self.extract_experience_text(parsed_resume, format_output=True)
-        combined_text = f"{header_text.strip()}\n\n{experience_text.strip()}"
-
-        if not combined_text.strip():
-            return {
-                "name": None,
-                "email": None,
-                "phone": None,
-                "experience": []
-            }
-        return self.parse_contact_and_experience(combined_text)
+        return f"{header_text.strip()}\n\n{experience_text}".strip()
+
+    def parse_experience_locally(self, parsed_resume: Dict[str, Union[str, Dict]]) -> Dict:
+        """Rule-based experience, years and confidence, without an LLM call"""
+        return self.rule_parser.parse(self.extract_experience_text(parsed_resume))
+
+    def _plan(self, parsed_resume: Dict[str, Union[str, Dict]]) -> Tuple[str, Optional[Dict]]:
+        """Text still to send to the LLM ('' for none) and the local experience result, if it is used.
+
+        When the local parse is used, the LLM is only asked for contact info
+        from the header, and only if the local contact is not trusted.
+        """
+        if self.mode == "llm":
+            return self._prepare_text(parsed_resume), None
+        local = self.parse_experience_locally(parsed_resume)
+        if self.mode == "hybrid" and local["confidence"] < self.local_confidence_threshold:
+            return self._prepare_text(parsed_resume), None
+        if self.mode == "local" or self.is_contact_trusted(parsed_resume):
+            return "", local
+        return parsed_resume.get("sections", {}).get("HEADER", "").strip(), local
 
+    def _finalize(
+        self,
+        parsed_resume: Dict[str, Union[str, Dict]],
+        result: Dict,
+        local: Optional[Dict] = None
+    ) -> Dict:
+        """Merge contact info and attach the local experience (if used) and years of experience"""
+        if local is not None:
+            result = dict(
+                result,
+                experience=local["experience"],
+                experience_confidence=local["confidence"],
+                total_years=local["total_years"],
+                relevant_years=local["relevant_years"],
+                experience_source="local"
+            )
+        else:
+            result = dict(result, **self.rule_parser.years_of_experience(result.get("experience") or []))
+            result.setdefault("experience_source", "llm")
+        return self._merge_contact(parsed_resume, result)
+
+    def extract_and_parse(self, parsed_resume: Dict[str, Union[str, Dict]], use_cache: bool = True) -> Dict:
+        combined_text, local = self._plan(parsed_resume)
+
+        if not combined_text:
+            return self._finalize(parsed_resume, {"experience": []}, local)
+        result = self.parse_contact_and_experience(
+            combined_text,
+            include_contact=not self.is_contact_trusted(parsed_resume),
+            use_cache=use_cache,
+            include_experience=local is None
+        )
+        return self._finalize(parsed_resume, result, local)
+
+    async def extract_and_parse_async(
+        self,
+        parsed_resume: Dict[str, Union[str, Dict]],
+        timeout: Optional[float] = None,
+        use_cache: bool = True
+    ) -> Dict:
+        combined_text, local = self._plan(parsed_resume)
+
+        if not combined_text:
+            return self._finalize(parsed_resume, {"experience": []}, local)
+        result = await self.parse_contact_and_experience_async(
+            combined_text,
+            include_contact=not self.is_contact_trusted(parsed_resume),
+            timeout=timeout,
+            use_cache=use_cache,
+            include_experience=local is None
+        )
+        return self._finalize(parsed_resume, result, local)
+
+    def _error_result(self, parsed_resume: Dict[str, Union[str, Dict]], error: Exception) -> Dict:
+        # Local contact info still lets the candidate be identified when the LLM call fails
+        return self._finalize(parsed_resume, {"experience": [], "error": str(error)})
 
     def extract_and_parse_batch(self, parsed_resumes: List[Dict[str, Union[str, Dict]]]) -> List[Dict[str, Union[Dict, str]]]:
         results = []
@@ -130,5 +338,138 @@ class ExperienceExtractorAndParser:
                 result = self.extract_and_parse(resume)
                 results.append(result)
             except Exception as e:
-                results.append({"error": str(e)})
+                results.append(self._error_result(resume, e))
+        return results
+
+    async def extract_and_parse_batch_async(
+        self,
+        parsed_resumes: List[Dict[str, Union[str, Dict]]],
+        concurrency: int = 8,
+        timeout: Optional[float] = None,
+        use_cache: bool = True
+    ) -> List[Dict[str, Union[Dict, str]]]:
+        """Concurrent batch: at most `concurrency` LLM calls in flight, results in input order"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(resume: Dict) -> Dict:
+            async with semaphore:
+                try:
+                    return await self.extract_and_parse_async(resume, timeout=timeout, use_cache=use_cache)
+                except Exception as e:
+                    return self._error_result(resume, e)
+
+        return await asyncio.gather(*(run(resume) for resume in parsed_resumes))
+
+    def _pack(self, items: List[Tuple[int, str]], token_budget: int, max_per_call: int) -> List[List[Tuple[int, str]]]:
+        """Group (index, text) items in order so each group's prompt stays within token_budget"""
+        packs, current, used = [], [], 0
+        for index, text in items:
+            tokens = estimate_tokens(text) + PACK_ITEM_OVERHEAD_TOKENS
+            if current and (used + tokens > token_budget or len(current) >= max_per_call):
+                packs.append(current)
+                current, used = [], 0
+            current.append((index, text))
+            used += tokens
+        if current:
+            packs.append(current)
+        return packs
+
+    async def _scheduled_chat(self, messages: List[Dict[str, str]], timeout: Optional[float], use_cache: bool) -> str:
+        # Cached responses skip the scheduler, so a re-run does not spend the RPM/TPM budgets
+        if use_cache:
+            cached = self.client.cached_chat(messages, PROMPT_VERSION, temperature=0.2)
+            if cached is not None:
+                return cached
+        # Budget the prompt plus a structured answer of about the same size. The scheduler
+        # requeues failures itself, so the client does not retry; the lookup above already
+        # missed, so the call only stores its response
+        return await self.scheduler.submit(
+            lambda: self.client.achat(
+                messages,
+                temperature=0.2,
+                timeout=timeout or self.timeout,
+                prompt_version=PROMPT_VERSION,
+                use_cache=False,
+                retry=False,
+                retry_rate_limit=False
+            ),
+            tokens=sum(estimate_tokens(m["content"]) for m in messages) * 2
+        )
+
+    async def extract_and_parse_packed_async(
+        self,
+        parsed_resumes: List[Dict[str, Union[str, Dict]]],
+        token_budget: int = 6000,
+        max_per_call: int = 8,
+        timeout: Optional[float] = None,
+        use_cache: bool = True
+    ) -> List[Dict[str, Union[Dict, str]]]:
+        """Batch extraction with several resumes per LLM call, results in input order.
+
+        Resumes are packed in order into requests of at most `max_per_call`
+        resumes and about `token_budget` prompt tokens, tagged R1..Rn, and the
+        JSON array that comes back is split by tag. Only resumes that need the
+        same fields (contact and/or experience) share a pack, so each prompt
+        asks for exactly what the single-resume call would. Resumes whose
+        entry is missing or malformed (or whose whole pack failed) are retried
+        with a single-resume call. All calls go through the shared LLMScheduler.
+        """
+        results: List[Optional[Dict]] = [None] * len(parsed_resumes)
+        local_results: Dict[int, Dict] = {}
+        # (include_contact, include_experience) -> [(index, text)]
+        pending: Dict[Tuple[bool, bool], List[Tuple[int, str]]] = {}
+        for i, resume in enumerate(parsed_resumes):
+            combined_text, local = self._plan(resume)
+            if local is not None:
+                local_results[i] = local
+            if combined_text:
+                fields = (not self.is_contact_trusted(resume), local is None)
+                pending.setdefault(fields, []).append((i, combined_text))
+            else:
+                results[i] = self._finalize(resume, {"experience": []}, local)
+
+        async def run_single(index: int, combined_text: str):
+            resume = parsed_resumes[index]
+            include_contact = not self.is_contact_trusted(resume)
+            local = local_results.get(index)
+            try:
+                messages = self._build_messages(combined_text, include_contact, include_experience=local is None)
+                raw_output = await self._scheduled_chat(messages, timeout, use_cache)
+                result = self._parse_output(raw_output, messages, include_contact)
+                results[index] = self._finalize(resume, result, local)
+            except Exception as e:
+                results[index] = self._error_result(resume, e)
+
+        async def run_pack(pack: List[Tuple[int, str]], include_contact: bool, include_experience: bool):
+            if len(pack) == 1:
+                await run_single(*pack[0])
+                return
+            ids = [f"R{n}" for n in range(1, len(pack) + 1)]
+            entries = {}
+            try:
+                messages = self._build_packed_messages(
+                    [(item_id, text) for item_id, (_, text) in zip(ids, pack)], include_contact, include_experience
+                )
+                raw_output = await self._scheduled_chat(messages, timeout, use_cache)
+                entries = self._parse_packed_output(raw_output, messages, ids)
+            except Exception as e:
+                logger.warning("Packed extraction of %d resumes failed (%s); using single calls", len(pack), e)
+
+            fallback = []
+            for item_id, (index, combined_text) in zip(ids, pack):
+                if item_id in entries:
+                    resume = parsed_resumes[index]
+                    result = self._to_result(entries[item_id], include_contact)
+                    results[index] = self._finalize(resume, result, local_results.get(index))
+                else:
+                    fallback.append(run_single(index, combined_text))
+            if fallback:
+                logger.info("%d of %d packed resumes fell back to single calls", len(fallback), len(pack))
+                await asyncio.gather(*fallback)
+
+        await asyncio.gather(*(
+            run_pack(pack, *fields)
+            for fields, items in pending.items()
+            for pack in self._pack(items, token_budget, max_per_call)
+        ))
         return results
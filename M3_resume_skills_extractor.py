@@ -1,9 +1,13 @@
 import re
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
+
+from skill_taxonomy import SkillScanner
 
 
 class SkillExtractor:
-    def __init__(self):
+    def __init__(self, scanner: Optional[SkillScanner] = None):
+        # Taxonomy scan over every section, so skills used in experience and project bullets count too
+        self.scanner = scanner or SkillScanner()
         self.skill_keys = [
             # Standard variations
             'KEY COMPETENCIES', 'SKILLS', 'TECHNICAL SKILLS', 'CORE COMPETENCIES',
@@ -68,13 +72,24 @@ class SkillExtractor:
         raw_skills = self.extract_skills(parsed_data)
         return self.clean_skills(raw_skills)
 
+    def scan_skills(self, parsed_data: Dict[str, Union[str, Dict]]) -> Dict[str, Dict]:
+        """Canonical taxonomy skills found in any section, with counts and source sections"""
+        return self.scanner.scan(parsed_data.get('sections', {}), skill_sections=self.skill_keys)
+
     def extract_and_clean_batch(self, parsed_resumes: List[Dict[str, Union[str, Dict]]]) -> List[Dict[str, Union[List[str], str]]]:
-        """Batch skill extraction and cleaning"""
+        """Batch skill extraction and cleaning.
+
+        "skills" holds the skill-section entries plus every canonical skill the
+        taxonomy scan found elsewhere; "skill_mentions" has the scan details.
+        """
         results = []
         for resume in parsed_resumes:
             try:
                 skills = self.extract_and_clean(resume)
-                results.append({"skills": skills})
+                mentions = self.scan_skills(resume)
+                listed = set(skills)
+                skills.extend(sorted(skill for skill in mentions if skill not in listed))
+                results.append({"skills": skills, "skill_mentions": mentions})
             except Exception as e:
                 results.append({"error": str(e)})
         return results
@@ -1,4 +1,57 @@
-from typing import Dict, List, Union
+import re
+from typing import Dict, List, Optional, Union
+
+from experience_rules import find_date_ranges
+
+# Bare two-letter forms (MS, BE, BA...) only match in capitals and followed by degree context
+# ("MS in CS", "BE, Mechanical", "BS (2019)"), so "to be", "MS Office" or "BE responsible" do not count
+BARE = r"(?-i:{})(?=\s*(?:[,(|:–-]|$|in\b|of\b|\d))"
+
+# (pattern, canonical degree, level); levels: 1 school, 2 diploma/associate, 3 bachelor, 4 master, 5 doctorate.
+DEGREE_PATTERNS = [
+    (r"ph\.?\s?d|doctor(?:ate|\s+of\s+philosophy)|d\.?\s?phil", "PhD", 5),
+    (r"m\.?\s?tech|m\.\s?e\.|master\s+of\s+(?:technology|engineering)", "M.Tech", 4),
+    (r"m\.?\s?b\.?\s?a|master\s+of\s+business\s+administration", "MBA", 4),
+    (r"m\.?\s?c\.?\s?a|master\s+of\s+computer\s+applications?", "MCA", 4),
+    (rf"m\.?\s?sc|m\.\s?s\.|{BARE.format('MS')}|master\s+of\s+science", "M.Sc", 4),
+    (rf"m\.\s?a\.?|(?<!,\s){BARE.format('MA')}|master\s+of\s+arts", "MA", 4),
+    (r"m\.?\s?com|master\s+of\s+commerce", "M.Com", 4),
+    (r"masters?(?:'s)?(?:\s+degree)?|post\s*graduat(?:e|ion)|pgdm|pgd", "Master", 4),
+    (rf"b\.?\s?tech|b\.\s?e\.|{BARE.format('BE')}|bachelor\s+of\s+(?:technology|engineering)", "B.Tech", 3),
+    (r"b\.?\s?c\.?\s?a|bachelor\s+of\s+computer\s+applications?", "BCA", 3),
+    (r"b\.?\s?b\.?\s?a|bachelor\s+of\s+business\s+administration", "BBA", 3),
+    (rf"b\.?\s?sc|b\.\s?s\.|{BARE.format('BS')}|bachelor\s+of\s+science", "B.Sc", 3),
+    (rf"b\.\s?a\.?|{BARE.format('BA')}|bachelor\s+of\s+arts", "BA", 3),
+    (r"b\.?\s?com|bachelor\s+of\s+commerce", "B.Com", 3),
+    (r"bachelors?(?:'s)?(?:\s+degree)?|undergraduate|graduat(?:e|ion)", "Bachelor", 3),
+    (r"associate(?:'s)?\s+degree|diploma|polytechnic", "Diploma", 2),
+    (r"hsc|ssc|cbse|icse|12th|10th|xii|high\s+school|higher\s+secondary|secondary\s+school|intermediate|matriculation|a[\s-]levels?|gcse", "School", 1),
+]
+DEGREE_RE = re.compile(
+    "|".join(f"(?P<d{i}>(?<![\\w.]){pattern}(?![\\w]))" for i, (pattern, _, _) in enumerate(DEGREE_PATTERNS)),
+    re.IGNORECASE
+)
+MAX_DEGREE_LEVEL = 5
+
+INSTITUTION_RE = re.compile(
+    r"[^,|•;()\-–]*\b(?:universit(?:y|ies)|college|institute|school|academy|polytechnic|iit|nit|iiit|iim|bits|"
+    r"vidyalaya|vidyapeeth|mahavidyalaya)\b[^,|•;()\-–%]*",
+    re.IGNORECASE
+)
+# "... from Stanford" / "... at IIM Ahmedabad" when the name has no institution keyword
+FROM_INSTITUTION_RE = re.compile(r"\b(?:from|at)\s+(?P<name>[A-Z][^,|•;()\d%]*)")
+FIELD_RE = re.compile(
+    r"^[\s.]*(?:\(|[-–,:]\s*)?(?:(?:in|of)\s+)?(?P<field>[A-Za-z&/.\s-]{2,60}?)\s*(?=$|[,|()•;]|\s[-–]\s|\s(?:from|at)\s|\d)",
+    re.IGNORECASE
+)
+GPA_RE = re.compile(
+    r"(?:c?gpa|cpi|sgpa|grade)\s*[:\-]?\s*(?P<value>\d{1,2}(?:\.\d+)?)(?:\s*/\s*(?P<scale>\d{1,2}(?:\.\d+)?))?"
+    r"|(?P<value2>\d{1,2}(?:\.\d+)?)\s*/\s*(?P<scale2>10|4(?:\.0)?|5(?:\.0)?)\b",
+    re.IGNORECASE
+)
+PERCENT_RE = re.compile(r"(?P<value>\d{2}(?:\.\d+)?)\s*%")
+YEAR_RE = re.compile(r"(?<!\d)(?:19|20)\d{2}(?!\d)")
+
 
 class ResumeEducationExtractor:
     def __init__(self):
@@ -10,27 +63,150 @@ class ResumeEducationExtractor:
             'EDUCATIONAL QUALIFICATION', 'EDUCATION AND CERTIFICATIONS',
             'EDUCATION & CERTIFICATIONS', 'EDUCATION & CERTIFICATION'
         ]
+        # Keyword -> priority, so finding the section is one lookup per section name
+        self._keyword_priority = {keyword: i for i, keyword in enumerate(self.EDUCATION_KEYWORD_SETS)}
+
+    def find_section(self, parsed_resume: Dict[str, Union[str, Dict]]) -> str:
+        """Content of the highest-priority education section, or ''"""
+        best, content = None, ""
+        for section_name, section_content in parsed_resume.get("sections", {}).items():
+            priority = self._keyword_priority.get(section_name.upper())
+            if priority is not None and (best is None or priority < best):
+                best, content = priority, section_content
+        return content
 
     def extract(self, parsed_resume: Dict[str, Union[str, Dict]]) -> List[str]:
         """
         Extracts education lines from one parsed resume.
         """
-        for keyword in self.EDUCATION_KEYWORD_SETS:
-            for section_name, section_content in parsed_resume.get("sections", {}).items():
-                if section_name.upper() == keyword:
-                    return [line.strip() for line in section_content.split("\n") if line.strip()]
-        return []
+        return [line.strip() for line in self.find_section(parsed_resume).split("\n") if line.strip()]
+
+    @staticmethod
+    def _match_degree(line: str):
+        match = DEGREE_RE.search(line)
+        if not match:
+            return None
+        index = int(match.lastgroup[1:])
+        _, degree, level = DEGREE_PATTERNS[index]
+        return match, degree, level
+
+    @staticmethod
+    def _new_record(degree: Optional[str] = None, level: int = 0) -> Dict:
+        return {
+            "degree": degree,
+            "degree_level": level,
+            "degree_rank": round(level / MAX_DEGREE_LEVEL, 2),
+            "field": None,
+            "institution": None,
+            "start_year": None,
+            "end_year": None,
+            "gpa": None,
+            "gpa_scale": None,
+            "percentage": None,
+        }
+
+    @staticmethod
+    def _fill_details(record: Dict, line: str):
+        """Institution, years and grades found in line, for fields the record does not have yet"""
+        if record["institution"] is None:
+            match = INSTITUTION_RE.search(line)
+            if match:
+                # "Master of Science from Stanford University" -> "Stanford University"
+                name = re.split(r"\b(?:from|at)\s+", match.group())[-1]
+            else:
+                match = FROM_INSTITUTION_RE.search(line)
+                name = match.group("name") if match else None
+            if name:
+                record["institution"] = YEAR_RE.sub("", name).strip(" -–:")
+        if record["end_year"] is None:
+            ranges = find_date_ranges(line)
+            if ranges:
+                record["start_year"], record["end_year"] = ranges[0][2][0], ranges[0][3][0]
+            else:
+                years = [int(y) for y in YEAR_RE.findall(line)]
+                if years:
+                    record["end_year"] = max(years)
+                    if len(years) > 1:
+                        record["start_year"] = min(years)
+        if record["gpa"] is None and record["percentage"] is None:
+            match = GPA_RE.search(line)
+            if match:
+                value = float(match.group("value") or match.group("value2"))
+                scale = match.group("scale") or match.group("scale2")
+                record["gpa"] = value
+                record["gpa_scale"] = float(scale) if scale else (4.0 if value <= 4.0 else 10.0)
+            else:
+                match = PERCENT_RE.search(line)
+                if match and float(match.group("value")) <= 100:
+                    record["percentage"] = float(match.group("value"))
+
+    def parse_lines(self, lines: List[str]) -> List[Dict]:
+        """Structured records from education lines; a line naming a degree starts a new record"""
+        records = []
+        pending = []  # lines seen before the degree they belong to (e.g. institution first)
+        for line in lines:
+            found = self._match_degree(line)
+            if found is None:
+                current = records[-1] if records else None
+                # An institution line after a complete record starts the next one
+                if current is None or (current["institution"] and INSTITUTION_RE.search(line)):
+                    pending.append(line)
+                else:
+                    self._fill_details(current, line)
+                continue
+
+            match, degree, level = found
+            record = self._new_record(degree, level)
+            # A degree inside an institution name ("St. Xavier's High School, Mumbai") has
+            # no field after it, only the institution's location
+            institution = INSTITUTION_RE.search(line)
+            in_institution = institution is not None and institution.start() <= match.start() and match.end() <= institution.end()
+            field_match = None if in_institution else FIELD_RE.match(line[match.end():])
+            if field_match:
+                field = field_match.group("field").strip(" .-")
+                if field and not INSTITUTION_RE.fullmatch(field) and not re.match(r"(?:from|at)\b", field, re.IGNORECASE):
+                    record["field"] = field
+            for text in pending + [line]:
+                self._fill_details(record, text)
+            pending = []
+            records.append(record)
+        return records
+
+    def parse(self, parsed_resume: Dict[str, Union[str, Dict]]) -> List[Dict]:
+        return self.parse_lines(self.extract(parsed_resume))
+
+    @staticmethod
+    def normalized_grade(record: Dict) -> Optional[float]:
+        """GPA or percentage on a 0-1 scale"""
+        if record.get("gpa") is not None and record.get("gpa_scale"):
+            return min(1.0, record["gpa"] / record["gpa_scale"])
+        if record.get("percentage") is not None:
+            return record["percentage"] / 100
+        return None
 
     def extract_batch(self, parsed_resumes: List[Dict[str, Union[str, Dict]]]) -> List[Dict[str, Union[List[str], str]]]:
         """
         Batch extraction for a list of parsed resumes.
-        Returns a list of dicts with extracted education or error.
+        Returns a list of dicts with extracted education lines, structured
+        records and the highest degree with its level, rank and 0-1 grade,
+        or an error.
         """
         results = []
         for resume in parsed_resumes:
             try:
                 education_lines = self.extract(resume)
-                results.append({"education": education_lines})
+                records = self.parse_lines(education_lines)
+                top = max(records, key=lambda record: record["degree_level"], default=None)
+                highest = top["degree_level"] if top else 0
+                grade = self.normalized_grade(top) if top else None
+                results.append({
+                    "education": education_lines,
+                    "education_records": records,
+                    "highest_degree": top["degree"] if top else None,
+                    "highest_degree_level": highest,
+                    "highest_degree_rank": round(highest / MAX_DEGREE_LEVEL, 2),
+                    "highest_degree_grade": round(grade, 3) if grade is not None else None
+                })
             except Exception as e:
                 results.append({"error": str(e)})
         return results
@@ -1,9 +1,43 @@
 import re
-from typing import Dict, List, Union
+import zlib
+from typing import Dict, List, Optional, Set, Union
+
+from skill_taxonomy import SkillScanner
+from token_budget import truncate_to_tokens
+
+BULLET_RE = re.compile(r'^\s*(?:[-*•●▪■◦‣–—>➢✓]|\d{1,2}[.)])\s*')
+LINK_RE = re.compile(r'(?:https?://|www\.)\S+|\b(?:github|gitlab|bitbucket)\.(?:com|org)/\S+', re.IGNORECASE)
+TECH_LINE_RE = re.compile(
+    r'^\s*(?:tech(?:nolog(?:y|ies))?(?:\s+stack)?|tools(?:\s+used)?|stack|built\s+with|skills\s+used)\s*[:\-–]\s*(?P<tech>.+)$',
+    re.IGNORECASE
+)
+# "Title | Python, Flask" or "Title (React, Node.js)"
+TITLE_TECH_RE = re.compile(r'^(?P<title>[^|(]+?)\s*(?:\|\s*(?P<piped>[^|]+)|\((?P<paren>[^)]+)\))\s*$')
+WORD_RE = re.compile(r'\w+')
+# What may be left of a line besides its links for it to count as a links-only line ("GitHub: ...", "Demo - ...")
+LINK_LABEL_RE = re.compile(
+    r'^(?:(?:live\s+)?(?:links?|github|gitlab|demo|repo(?:sitory)?|url|code|source(?:\s+code)?)\s*[:\-–]?)?$',
+    re.IGNORECASE
+)
+
+# Longest line still treated as a project title rather than a description
+MAX_TITLE_WORDS = 12
 
 
 class ProjectsExtractor:
-    def __init__(self):
+    def __init__(
+        self,
+        scanner: Optional[SkillScanner] = None,
+        max_bullets: int = 6,
+        max_bullet_tokens: int = 50,
+        duplicate_threshold: float = 0.8
+    ):
+        self.scanner = scanner or SkillScanner()
+        # Per-project caps on what is kept for the scoring prompt
+        self.max_bullets = max_bullets
+        self.max_bullet_tokens = max_bullet_tokens
+        # Jaccard similarity of word shingles above which two projects are the same project
+        self.duplicate_threshold = duplicate_threshold
         self.project_keys = [
             # Standard variations
             'PROJECTS', 'PERSONAL PROJECTS', 'TECHNICAL PROJECTS', 'RESEARCH PROJECTS', 'RESEARCH EXPERIENCE', 
@@ -46,11 +80,145 @@ class ProjectsExtractor:
         seen = set()
         return [p for p in all_projects if not (p in seen or seen.add(p))]
 
-    def extract_and_clean(self, parsed_data: Dict[str, Union[str, Dict]]) -> List[str]:
-        """Extracts and cleans projects (if needed)."""
-        raw_projects = self.extract_projects(parsed_data)
-        # Add any cleaning logic here (e.g., lowercase, remove special chars)
-        return raw_projects
+    def _is_title_line(self, line: str) -> bool:
+        if BULLET_RE.match(line) or TECH_LINE_RE.match(line):
+            return False
+        return len(line.split()) <= MAX_TITLE_WORDS and not line.rstrip().endswith('.')
+
+    @staticmethod
+    def _line_links(line: str) -> List[str]:
+        """Links of a line holding nothing but links (and maybe a label), else []"""
+        links = LINK_RE.findall(line)
+        if not links or not LINK_LABEL_RE.match(LINK_RE.sub('', BULLET_RE.sub('', line)).strip(' |,;')):
+            return []
+        return links
+
+    @staticmethod
+    def _looks_like_title(line: str) -> bool:
+        """Most longer words capitalised ("Automated Trading Bot"), unlike a sentence ("Implemented auth with JWT")"""
+        words = [w for w in WORD_RE.findall(line) if len(w) > 3]
+        return not words or sum(w[0].isupper() for w in words) * 2 >= len(words)
+
+    def segment_projects(self, section_text: str) -> List[Dict[str, Union[str, List[str]]]]:
+        """Split one section into projects: a title line followed by its bullets or description lines.
+
+        A short line starts the next project once the current one has a
+        description; when that description is unbulleted, only if the line
+        also looks like a title. A bullet glyph on a line of its own (as PDF
+        extraction often leaves it) belongs to the line after it. Lines
+        holding only links belong to the current project (or the next one,
+        before any title) and never start a project themselves.
+        """
+        projects = []
+        current = None
+        pending_links = []
+        after_glyph = False
+        for raw_line in section_text.split('\n'):
+            line = raw_line.strip()
+            if not line:
+                continue
+            links = self._line_links(line)
+            if links:
+                (current["links"] if current is not None else pending_links).extend(links)
+                continue
+            bullet = BULLET_RE.match(line)
+            text = BULLET_RE.sub('', line).strip()
+            if bullet and not text:
+                after_glyph = True
+                continue
+            tech = TECH_LINE_RE.match(line)
+            if tech and current is not None:
+                current["tech_lines"].append(tech.group("tech"))
+                after_glyph = False
+                continue
+            starts_project = not after_glyph and self._is_title_line(line) and (
+                current is None
+                or (current["bullets"] and (current["marked"] or self._looks_like_title(line)))
+            )
+            if starts_project:
+                current = {"title": line, "bullets": [], "tech_lines": [], "links": pending_links, "marked": False}
+                pending_links = []
+                projects.append(current)
+                continue
+            if current is None:
+                current = {"title": "", "bullets": [], "tech_lines": [], "links": pending_links, "marked": False}
+                pending_links = []
+                projects.append(current)
+            current["bullets"].append(text)
+            current["marked"] = current["marked"] or bool(bullet) or after_glyph
+            after_glyph = False
+        return projects
+
+    def _tech_stack(self, project: Dict) -> List[str]:
+        explicit = []
+        title = project["title"]
+        match = TITLE_TECH_RE.match(title)
+        if match and (match.group("piped") or match.group("paren")):
+            explicit.append(match.group("piped") or match.group("paren"))
+            project["title"] = match.group("title").strip()
+        explicit.extend(project["tech_lines"])
+
+        stack: List[str] = []
+        # Listed technologies count even when ambiguous ("Go", "R"); free text only for clear aliases
+        for text, allow_ambiguous in [(line, True) for line in explicit] + [
+            (' '.join([project["title"], *project["bullets"]]), False)
+        ]:
+            for _, _, canonical in self.scanner.find(text, allow_ambiguous=allow_ambiguous):
+                if canonical not in stack:
+                    stack.append(canonical)
+        return stack
+
+    def _build_record(self, project: Dict) -> Dict[str, Union[str, List[str]]]:
+        links = []
+        for link in project.get("links", []) + LINK_RE.findall(' '.join([project["title"], *project["bullets"], *project["tech_lines"]])):
+            link = link.rstrip('.,;)')
+            if link not in links:
+                links.append(link)
+        # Links are kept separately so "github.com/..." is not read as text or as the git skill
+        project["title"] = LINK_RE.sub('', project["title"]).strip(' |-–:;')
+        project["bullets"] = [b for b in (LINK_RE.sub('', b).strip(' |-–;') for b in project["bullets"]) if b]
+        tech_stack = self._tech_stack(project)
+        bullets = [truncate_to_tokens(b, self.max_bullet_tokens) for b in project["bullets"]][:self.max_bullets]
+        return {"title": project["title"], "bullets": bullets, "tech_stack": tech_stack, "links": links}
+
+    @staticmethod
+    def _shingles(record: Dict, size: int = 3) -> Set[int]:
+        words = WORD_RE.findall(' '.join([record["title"], *record["bullets"]]).lower())
+        if len(words) < size:
+            return {zlib.crc32(' '.join(words).encode('utf-8'))} if words else set()
+        return {zlib.crc32(' '.join(words[i:i + size]).encode('utf-8')) for i in range(len(words) - size + 1)}
+
+    def dedupe(self, records: List[Dict]) -> List[Dict]:
+        """Collapse near-duplicate projects (e.g. listed under PROJECTS and RESEARCH EXPERIENCE).
+
+        The first copy is kept and absorbs the tech stack and links of later copies.
+        """
+        kept, kept_shingles = [], []
+        for record in records:
+            shingles = self._shingles(record)
+            duplicate_of = None
+            for index, other in enumerate(kept_shingles):
+                union = len(shingles | other)
+                if union and len(shingles & other) / union >= self.duplicate_threshold:
+                    duplicate_of = index
+                    break
+            if duplicate_of is None:
+                kept.append(record)
+                kept_shingles.append(shingles)
+                continue
+            original = kept[duplicate_of]
+            original["tech_stack"] += [t for t in record["tech_stack"] if t not in original["tech_stack"]]
+            original["links"] += [l for l in record["links"] if l not in original["links"]]
+        return kept
+
+    def extract_and_clean(self, parsed_data: Dict[str, Union[str, Dict]]) -> List[Dict[str, Union[str, List[str]]]]:
+        """Individual, deduplicated projects with title, capped bullets, tech stack and links"""
+        records = [
+            self._build_record(project)
+            for section_text in self.extract_projects(parsed_data)
+            for project in self.segment_projects(section_text)
+        ]
+        return self.dedupe([record for record in records if record["title"] or record["bullets"]])
 
     def extract_and_clean_batch(self, parsed_resumes: List[Dict[str, Union[str, Dict]]]) -> List[Dict[str, Union[List[str], str]]]:
         """Batch project extraction and cleaning"""
@@ -61,4 +229,4 @@ class ProjectsExtractor:
                 results.append({"projects": projects})  # Changed "skills" to "projects" for consistency
             except Exception as e:
                 results.append({"error": str(e)})
-        return results
\ No newline at end of file
+        return results
@@ -1,20 +1,25 @@
-import requests
 import json
-import os
+import logging
+from typing import Optional
+
+from llm_client import LLMClient, get_llm_client
+from token_budget import compact_text, estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Bump when the JD prompt changes so cached LLM responses are not reused
+PROMPT_VERSION = "2"
 
 class JDExtractorGroq:
-    def __init__(self):
-        self.api_key = os.getenv("GROQ_API_KEY")
-        if not self.api_key:
-            raise ValueError("Missing GROQ_API_KEY in environment variables")
-        self.api_url = "https://api.groq.com/openai/v1/chat/completions"
-        self.model = "meta-llama/llama-4-scout-17b-16e-instruct"
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+    def __init__(self, client: Optional[LLMClient] = None, max_jd_tokens: int = 1500):
+        self.client = client or get_llm_client()
+        # JD text beyond this (after deduplicating lines) is cut before it is sent
+        self.max_jd_tokens = max_jd_tokens
 
-    def extract(self, jd_text, temperature=0.3, max_tokens=1024):
+    def extract(self, jd_text, temperature=0.3, max_tokens=1024, use_cache=True):
+        compacted = compact_text(jd_text, self.max_jd_tokens)
+        logger.info("JD prompt text: %d tokens (%d before compaction)",
+                    estimate_tokens(compacted), estimate_tokens(jd_text))
         messages = [
             {
                 "role": "system",
@@ -30,26 +35,21 @@ class JDExtractorGroq:
             },
             {
                 "role": "user",
-                "content": f"Extract information from this job description:\n{jd_text}"
+                "content": f"Extract information from this job description:\n{compacted}"
             }
         ]
 
-        payload = {
-            "model": self.model,
-            "messages": messages,
+        # Extract the JSON string from the response
+        params = {
             "temperature": temperature,
             "max_tokens": max_tokens,
             "response_format": {"type": "json_object"}  # Forces the model to return JSON
         }
+        json_str = self.client.chat(messages, prompt_version=PROMPT_VERSION, use_cache=use_cache, **params)
 
-        response = requests.post(self.api_url, headers=self.headers, json=payload)
-        response.raise_for_status()
-        
-        # Extract the JSON string from the response
-        json_str = response.json()["choices"][0]["message"]["content"]
-        
         # Parse the JSON string into a Python dictionary
         try:
             return json.loads(json_str)  # Returns a dict
         except json.JSONDecodeError:
+            self.client.evict_cached(messages, PROMPT_VERSION, **params)
             return {"error": "Invalid JSON response", "raw_output": json_str}
\ No newline at end of file
@@ -1,22 +1,67 @@
-import httpx
 import json
+import logging
 import re
-import os
-import asyncio
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
+
+from caching import ScoreCache, content_hash
+from llm_client import LLMClient, get_llm_client
+from llm_scheduler import LLMScheduler, get_llm_scheduler
+from scoring_engine import WeightedScorer
+from token_budget import PromptCompactor, compact_json, estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Bump when the scoring prompt changes so cached LLM responses are not reused
+# (the score cache also fingerprints the prompt template itself)
+PROMPT_VERSION = "3"
+
+SYSTEM_MESSAGE = "You are an expert resume evaluator."
+
+# Token budgets per prompt field, in priority order (unused budget rolls over to the next field)
+RESUME_TOKEN_BUDGETS = {"experience": 900, "skills": 250, "projects": 450, "education": 150}
+JD_TOKEN_BUDGETS = {"skills": 250, "responsibilities": 400, "experience_reqs": 150, "education_reqs": 100}
+
+# Tokens budgeted for the score JSON the model writes back
+SCORE_OUTPUT_TOKENS = 400
 
 
 class ResumeJDScorerAsync:
-    def __init__(self):
-        self.api_key = os.getenv("GROQ_API_KEY")
-        if not self.api_key:
-            raise ValueError("Missing GROQ_API_KEY in environment variables")
-        self.api_url = "https://api.groq.com/openai/v1/chat/completions"
-        self.headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        self.model = "meta-llama/llama-4-scout-17b-16e-instruct"
+    def __init__(
+        self,
+        client: Optional[LLMClient] = None,
+        scheduler: Optional[LLMScheduler] = None,
+        resume_budgets: Optional[Dict[str, int]] = None,
+        jd_budgets: Optional[Dict[str, int]] = None,
+        engine: Optional[WeightedScorer] = None,
+        score_cache: Optional[ScoreCache] = None
+    ):
+        self.client = client or get_llm_client()
+        self.scheduler = scheduler or get_llm_scheduler()
+        self.resume_compactor = PromptCompactor(resume_budgets or RESUME_TOKEN_BUDGETS)
+        self.jd_compactor = PromptCompactor(jd_budgets or JD_TOKEN_BUDGETS)
+        # Final and adjusted scores are computed locally from the component scores
+        self.engine = engine or WeightedScorer()
+        # Scores already computed for a (resume, JD, model, prompt) are not sent to the LLM again
+        self.score_cache = score_cache
+        self.prompt_fingerprint = self._prompt_fingerprint()
+
+    def _prompt_fingerprint(self) -> str:
+        """Hash of everything about the prompt except the resume and JD content"""
+        template = self.build_prompt({}, {})
+        return content_hash([
+            PROMPT_VERSION, SYSTEM_MESSAGE, template,
+            self.resume_compactor.budgets, self.jd_compactor.budgets
+        ])[:16]
+
+    def score_cache_key(self, parsed_resume: Dict[str, Any], parsed_jd: Dict[str, Any]) -> Optional[str]:
+        if self.score_cache is None:
+            return None
+        return ScoreCache.key(
+            content_hash(self._extract_resume_dict(parsed_resume)),
+            content_hash(self._extract_jd_dict(parsed_jd)),
+            self.client.model,
+            self.prompt_fingerprint
+        )
 
     def _extract_resume_dict(self, parsed_resume: Dict[str, Any]) -> Dict[str, Any]:
         return {
@@ -44,9 +89,7 @@ Given a candidate's resume and a job description, return only the following stru
 - "skills_score": float (0.0 to 1.0)
 - "experience_score": float (0.0 to 1.0)
 - "project_relevance_score": float (0.0 to 1.0)
-- "final_score": float (calculated as: 35% experience, 45% skills, 10% education, 10% projects)
 - "domain_match_score": float (0.0 to 1.0) (semantic alignment of resume domain and job domain)
-- "adjusted_final_score": float (final_score * domain_match_score)
 - "missing_skills": list of strings (skills clearly required by the job but **not found semantically or explicitly** in the resume)
 
 ### Matching Rules:
@@ -60,31 +103,34 @@ Given a candidate's resume and a job description, return only the following stru
 Return only raw JSON. Do NOT use markdown, explanations, or backticks.
 
 ### Job Description JSON:
-{json.dumps(jd_json, indent=2)}
+{compact_json(jd_json)}
 
 ### Candidate Resume JSON:
-{json.dumps(resume_json, indent=2)}
+{compact_json(resume_json)}
 """
 
-    async def score_resume(self, client: httpx.AsyncClient, parsed_resume: Dict[str, Any], parsed_jd: Dict[str, Any]) -> Dict[str, Any]:
+    def build_messages(self, parsed_resume: Dict[str, Any], parsed_jd: Dict[str, Any]) -> List[Dict[str, str]]:
         resume_dict = self._extract_resume_dict(parsed_resume)
         jd_dict = self._extract_jd_dict(parsed_jd)
-        prompt = self.build_prompt(resume_dict, jd_dict)
-
-        body = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": "You are an expert resume evaluator."},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.2
-        }
+        compact_resume = self.resume_compactor.compact(resume_dict)
+        compact_jd = self.jd_compactor.compact(jd_dict)
+        prompt = self.build_prompt(compact_resume, compact_jd)
+        if logger.isEnabledFor(logging.INFO):
+            # The same prompt with the full, indent=2 JSON it used to embed
+            uncompacted = (
+                estimate_tokens(prompt)
+                - estimate_tokens(compact_json(compact_jd) + compact_json(compact_resume))
+                + estimate_tokens(json.dumps(jd_dict, indent=2) + json.dumps(resume_dict, indent=2))
+            )
+            logger.info("Scoring prompt for %s: %d tokens (%d without compaction)",
+                        parsed_resume.get("original_file_name", "resume"), estimate_tokens(prompt), uncompacted)
+        return [
+            {"role": "system", "content": SYSTEM_MESSAGE},
+            {"role": "user", "content": prompt}
+        ]
 
+    def _parse_score(self, messages: List[Dict[str, str]], content: str) -> Dict[str, Any]:
         try:
-            response = await client.post(self.api_url, headers=self.headers, json=body, timeout=60)
-            response.raise_for_status()
-            content = response.json()["choices"][0]["message"]["content"]
-
             cleaned = content.strip().strip("`")
             if cleaned.lower().startswith("json"):
                 cleaned = cleaned[4:].strip()
@@ -94,49 +140,193 @@ Return only raw JSON. Do NOT use markdown, explanations, or backticks.
                 return json.loads(json_match.group())
 
             raise ValueError("No valid JSON object found in LLM response.")
+        except ValueError:
+            self.client.evict_cached(messages, PROMPT_VERSION, temperature=0.2)
+            logger.debug("Unparseable scoring response:\n%s", content)
+            raise
+
+    async def _score_messages(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        # Only runs after the response cache missed (see _cached_score), so the call just stores
+        # its response. 429s and other failures are raised straight away, without client
+        # retries, so the scheduler can back off and requeue
+        content = await self.client.achat(
+            messages, temperature=0.2, timeout=60, prompt_version=PROMPT_VERSION,
+            use_cache=False, retry=False, retry_rate_limit=False
+        )
+        return self._parse_score(messages, content)
+
+    def _cached_score(self, messages: List[Dict[str, str]], key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Score from a cached LLM response, without going through the scheduler; None on a miss"""
+        content = self.client.cached_chat(messages, PROMPT_VERSION, temperature=0.2)
+        if content is None:
+            return None
+        try:
+            score = self._parse_score(messages, content)
+        except ValueError:
+            return None
+        if key:
+            self.score_cache.put(key, score)
+        return score
+
+    async def _score_and_store(self, messages: List[Dict[str, str]], key: Optional[str]) -> Dict[str, Any]:
+        score = await self._score_messages(messages)
+        if key:
+            self.score_cache.put(key, score)
+        return score
+
+    async def score_resume(
+        self,
+        parsed_resume: Dict[str, Any],
+        parsed_jd: Dict[str, Any],
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        key = self.score_cache_key(parsed_resume, parsed_jd)
+        cached = self.score_cache.get(key) if key and use_cache else None
+        if cached is not None:
+            return cached
+        messages = self.build_messages(parsed_resume, parsed_jd)
+        cached = self._cached_score(messages, key) if use_cache else None
+        if cached is not None:
+            return cached
+        try:
+            return await self.scheduler.submit(
+                lambda: self._score_and_store(messages, key),
+                tokens=estimate_tokens(messages[1]["content"]) + SCORE_OUTPUT_TOKENS
+            )
         except Exception as e:
-            print("Failed to score resume:", e)
-            print("Raw content:\n", content)
+            logger.warning("Failed to score resume: %s", e)
             return {"error": str(e)}
 
+    @staticmethod
+    def _as_score(result: Any) -> Dict[str, Any]:
+        if isinstance(result, Exception):
+            logger.warning("Failed to score resume: %s", result)
+            return {"error": str(result)}
+        return result
+
+    def _build_entry(self, resume: Dict[str, Any], score: Dict[str, Any], include_contact: bool) -> Dict[str, Any]:
+        contact = resume.get("contact_info", {}) or {}
+        name = contact.get("name") or contact.get("email") or "Unknown"
+
+        entry = {
+            "name": name.title(),
+            "skills_score": round(score.get("skills_score", 0.0) * 100, 2),
+            "experience_score": round(score.get("experience_score", 0.0) * 100, 2),
+            "education_score": round(score.get("education_score", 0.0) * 100, 2),
+            "project_score": round(score.get("project_relevance_score", 0.0) * 100, 2),
+            "domain_match_score": round(score.get("domain_match_score", 0.0) * 100, 2),
+            "missing_skills": score.get("missing_skills", []),
+            "original_file_name": resume.get("original_file_name", "Unknown")
+        }
+        if "error" in score:
+            entry["error"] = score["error"]
+
+        if include_contact:
+            entry["email"] = contact.get("email") or "N/A"
+            entry["phone"] = contact.get("phone") or "N/A"
+        return entry
+
+    def _scoring_jobs(self, parsed_resumes: List[Dict[str, Any]], parsed_jd: Dict[str, Any], use_cache: bool):
+        """(cached, pending, jobs, tokens): cached scores per resume (None on a miss),
+        and the indices, scheduler jobs and token estimates of the resumes to send to the LLM.
+        use_cache=False skips the lookup but still stores the fresh scores.
+        """
+        keys = [self.score_cache_key(resume, parsed_jd) for resume in parsed_resumes]
+        cached = [self.score_cache.get(key) if key and use_cache else None for key in keys]
+        all_messages = {i: self.build_messages(parsed_resumes[i], parsed_jd) for i, score in enumerate(cached) if score is None}
+        if use_cache:
+            # Cached LLM responses are parsed here rather than queued behind the scheduler's budgets
+            for i, messages in all_messages.items():
+                cached[i] = self._cached_score(messages, keys[i])
+        pending = [i for i, score in enumerate(cached) if score is None]
+        jobs = [lambda m=all_messages[i], k=keys[i]: self._score_and_store(m, k) for i in pending]
+        tokens = [estimate_tokens(all_messages[i][1]["content"]) + SCORE_OUTPUT_TOKENS for i in pending]
+        if len(pending) < len(parsed_resumes):
+            logger.info("Score cache: %d of %d resumes already scored", len(parsed_resumes) - len(pending), len(parsed_resumes))
+        return cached, pending, jobs, tokens
+
     async def score_resumes_batch(
         self,
         parsed_resumes: List[Dict[str, Any]],
         parsed_jd: Dict[str, Any],
-        include_contact: bool = False
+        include_contact: bool = False,
+        use_cache: bool = True,
+        weights: Optional[Dict[str, float]] = None
     ) -> List[Dict[str, Any]]:
-        async with httpx.AsyncClient() as client:
-            tasks = [
-                self.score_resume(client, resume, parsed_jd)
-                for resume in parsed_resumes
-            ]
-            raw_scores = await asyncio.gather(*tasks)
+        """Score every resume against one JD.
+
+        weights overrides the engine's component weights for this batch.
+        """
+        results, pending, jobs, tokens = self._scoring_jobs(parsed_resumes, parsed_jd, use_cache)
+        for index, result in zip(pending, await self.scheduler.run_batch(jobs, tokens)):
+            results[index] = result
 
-            scored_with_metadata = []
-            for resume, score in zip(parsed_resumes, raw_scores):
-                contact = resume.get("contact_info", {}) or {}
-                name = contact.get("name") or contact.get("email") or "Unknown"
+        scored_with_metadata = []
+        for resume, result in zip(parsed_resumes, results):
+            scored_with_metadata.append(self._build_entry(resume, self._as_score(result), include_contact))
 
-                entry = {
-                    "name": name.title(),
-                    "match_percent": round(score.get("adjusted_final_score", 0.0) * 100, 2)
-                        if isinstance(score.get("adjusted_final_score"), (int, float)) else "NaN",
-                    "skills_score": round(score.get("skills_score", 0.0) * 100, 2),
-                    "experience_score": round(score.get("experience_score", 0.0) * 100, 2),
-                    "education_score": round(score.get("education_score", 0.0) * 100, 2),
-                    "project_score": round(score.get("project_relevance_score", 0.0) * 100, 2),
-                    "domain_match_score": round(score.get("domain_match_score", 0.0) * 100, 2),
-                    "missing_skills": score.get("missing_skills", []),
-                    "original_file_name": resume.get("original_file_name", "Unknown")
-                }
+        return self.engine.apply(scored_with_metadata, weights)
 
-                if include_contact:
-                    entry["email"] = contact.get("email") or "N/A"
-                    entry["phone"] = contact.get("phone") or "N/A"
-                    
+    async def score_resumes_stream(
+        self,
+        parsed_resumes: List[Dict[str, Any]],
+        parsed_jd: Dict[str, Any],
+        include_contact: bool = False,
+        use_cache: bool = True,
+        weights: Optional[Dict[str, float]] = None
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Like score_resumes_batch, but yields (index, entry) as each resume is scored"""
+        cached, pending, jobs, tokens = self._scoring_jobs(parsed_resumes, parsed_jd, use_cache)
+        for index, score in enumerate(cached):
+            if score is not None:
+                entry = self._build_entry(parsed_resumes[index], score, include_contact)
+                yield index, self.engine.apply([entry], weights)[0]
+        async for job_index, result in self.scheduler.iter_completed(jobs, tokens):
+            index = pending[job_index]
+            entry = self._build_entry(parsed_resumes[index], self._as_score(result), include_contact)
+            yield index, self.engine.apply([entry], weights)[0]
 
+    async def score_resumes_matrix(
+        self,
+        parsed_resumes: List[Dict[str, Any]],
+        parsed_jds: List[Dict[str, Any]],
+        include_contact: bool = False,
+        use_cache: bool = True,
+        weights: Optional[List[Optional[Dict[str, float]]]] = None,
+        pairs: Optional[List[List[int]]] = None
+    ) -> List[List[Optional[Dict[str, Any]]]]:
+        """Score N resumes against M JDs in one scheduler batch.
 
-                scored_with_metadata.append(entry)
+        Returns one row per JD with an entry per resume (as from
+        score_resumes_batch). pairs optionally lists, per JD, the resume
+        indices to score; the other cells are None. weights is one weights
+        dict (or None) per JD.
+        """
+        selected = pairs if pairs is not None else [list(range(len(parsed_resumes)))] * len(parsed_jds)
+        weights = weights or [None] * len(parsed_jds)
 
-            return scored_with_metadata
+        # Every uncached (resume, JD) pair of every JD shares one batch
+        plans, owners, all_jobs, all_tokens = [], [], [], []
+        for j, parsed_jd in enumerate(parsed_jds):
+            cached, pending, jobs, tokens = self._scoring_jobs(
+                [parsed_resumes[i] for i in selected[j]], parsed_jd, use_cache
+            )
+            plans.append(cached)
+            owners.extend((j, position) for position in pending)
+            all_jobs.extend(jobs)
+            all_tokens.extend(tokens)
+        for (j, position), result in zip(owners, await self.scheduler.run_batch(all_jobs, all_tokens)):
+            plans[j][position] = result
 
+        matrix = []
+        for j, scores in enumerate(plans):
+            entries = [
+                self._build_entry(parsed_resumes[i], self._as_score(score), include_contact)
+                for i, score in zip(selected[j], scores)
+            ]
+            self.engine.apply(entries, weights[j])
+            row: List[Optional[Dict[str, Any]]] = [None] * len(parsed_resumes)
+            for i, entry in zip(selected[j], entries):
+                row[i] = entry
+            matrix.append(row)
+        return matrix
@@ -1,5 +1,7 @@
 from typing import List, Dict, Optional
 
+import numpy as np
+
 class ResumeRanker:
     def __init__(self, top_n: Optional[int] = None, descending: bool = True):
         """
@@ -14,9 +16,11 @@ class ResumeRanker:
         Rank resumes by match_percent and return top N if specified.
         Assumes contact info (email, phone) is already flattened.
         """
+        # Unscored resumes ("NaN") go last in either order
+        unscored = float("-inf") if self.descending else float("inf")
         ranked = sorted(
             resumes,
-            key=lambda x: x.get("match_percent", 0),
+            key=lambda x: x.get("match_percent", 0) if isinstance(x.get("match_percent", 0), (int, float)) else unscored,
             reverse=self.descending
         )
 
@@ -37,6 +41,19 @@ class ResumeRanker:
         return top_ranked
 
 
+    def best_fit(self, scores: List[List[Optional[float]]]) -> List[Optional[int]]:
+        """
+        Index of the best-scoring column (JD) for each row (candidate) of a
+        candidates x JDs score matrix; None where a row has no scores.
+        """
+        matrix = np.array([[np.nan if s is None else s for s in row] for row in scores], dtype=float)
+        if matrix.size == 0:
+            return [None] * len(scores)
+        scored = ~np.isnan(matrix).all(axis=1)
+        filled = np.where(np.isnan(matrix), -np.inf if self.descending else np.inf, matrix)
+        best = filled.argmax(axis=1) if self.descending else filled.argmin(axis=1)
+        return [int(j) if ok else None for j, ok in zip(best, scored)]
+
     def print_ranked(self, ranked_resumes: List[Dict]):
         """
         Print a readable view of ranked resumes with breakdown.
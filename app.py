@@ -1,8 +1,11 @@
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Body
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from typing import List
-import shutil
+from typing import Dict, List, Optional
+from io import BytesIO
+import asyncio
+import json
 import os
 import uuid
 import traceback
@@ -10,14 +13,22 @@ from pathlib import Path
 import threading
 
 # Module imports (renamed as per your pipeline)
+from caching import ParseCache, ScoreCache
+from ocr_engine import BatchTesseractOcr, TesseractOcr
+from llm_client import get_llm_client
+from llm_scheduler import get_llm_scheduler
 from M1_file_handling import ResumeParser
 from M2_resume_exp_extractor import ExperienceExtractorAndParser
 from M3_resume_skills_extractor import SkillExtractor
+from skill_matching import SkillMatcher
 from M4_resume_educ_extractor import ResumeEducationExtractor
 from M5_resume_projects import ProjectsExtractor
 from M6_jd_processor import JDExtractorGroq
+from jd_registry import JDRegistry
+from scoring_engine import normalize_weights
 from M7_scoring import ResumeJDScorerAsync
 from M8_ranking import ResumeRanker
+from prefilter import BM25Prefilter
 
 # FastAPI setup
 app = FastAPI()
@@ -26,18 +37,125 @@ app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 UPLOAD_DIR = "uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# Resume parsing mode: "process" (process pool), "thread" or "sequential"
+PARSE_MODE = os.getenv("RESUME_PARSE_MODE", "process")
+PARSE_WORKERS = int(os.getenv("RESUME_PARSE_WORKERS", "0")) or None
+
+# Parse cache: in-memory LRU, plus an on-disk tier when PARSE_CACHE_DIR is set
+parse_cache = ParseCache(
+    max_items=int(os.getenv("PARSE_CACHE_ITEMS", "512")),
+    disk_dir=os.getenv("PARSE_CACHE_DIR") or None,
+    max_disk_bytes=int(os.getenv("PARSE_CACHE_MAX_MB", "256")) * 1024 * 1024
+)
+
+# Score cache: (resume, JD, model, scoring prompt) -> scores, so re-runs only score new or changed pairs
+SCORE_CACHE_ITEMS = int(os.getenv("SCORE_CACHE_ITEMS", "4096"))
+score_cache = ScoreCache(
+    max_items=SCORE_CACHE_ITEMS,
+    disk_dir=os.getenv("SCORE_CACHE_DIR") or None,
+    max_disk_bytes=int(os.getenv("SCORE_CACHE_MAX_MB", "64")) * 1024 * 1024,
+    ttl=float(os.getenv("SCORE_CACHE_TTL", str(30 * 24 * 3600))) or None
+) if SCORE_CACHE_ITEMS > 0 else None
+
+# PDF budgets: pages/characters beyond these are skipped and the parse is flagged as truncated
+MAX_PDF_PAGES = int(os.getenv("RESUME_MAX_PAGES", "10")) or None
+MAX_RESUME_CHARS = int(os.getenv("RESUME_MAX_CHARS", "60000")) or None
+
+# OCR backend: "batch" runs many images per Tesseract process, "tesseract" one process per image
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", "2"))
+ocr_backend = (
+    TesseractOcr(workers=OCR_WORKERS)
+    if os.getenv("OCR_BACKEND", "batch") == "tesseract"
+    else BatchTesseractOcr(workers=OCR_WORKERS)
+)
+
+# Max concurrent experience-extraction LLM calls per request
+EXPERIENCE_CONCURRENCY = int(os.getenv("EXPERIENCE_CONCURRENCY", "8"))
+# llm, hybrid (rule-based parse when confident, LLM otherwise) or local (no LLM)
+EXPERIENCE_MODE = os.getenv("EXPERIENCE_MODE", "hybrid")
+# Pack several resumes into one experience-extraction call (0 = one resume per call)
+EXPERIENCE_PACK_TOKENS = int(os.getenv("EXPERIENCE_PACK_TOKENS", "6000"))
+EXPERIENCE_PACK_SIZE = int(os.getenv("EXPERIENCE_PACK_SIZE", "8"))
+
+# Registered JDs are parsed once and reused by jd_id; kept on disk when JD_REGISTRY_DIR is set
+JD_REGISTRY_DIR = os.getenv("JD_REGISTRY_DIR") or None
+JD_REGISTRY_ITEMS = int(os.getenv("JD_REGISTRY_ITEMS", "1000"))
+
+# Only the PREFILTER_FACTOR x top_n best resumes by local BM25 (at least PREFILTER_MIN)
+# go on to experience extraction and LLM scoring; 0 sends every resume
+PREFILTER_FACTOR = int(os.getenv("PREFILTER_FACTOR", "5"))
+PREFILTER_MIN = int(os.getenv("PREFILTER_MIN", "20"))
+
 # Module initializations
-resume_parser = ResumeParser()
-experience_parser = ExperienceExtractorAndParser()
+llm_client = get_llm_client()
+llm_scheduler = get_llm_scheduler()
+resume_parser = ResumeParser(
+    process_workers=PARSE_WORKERS,
+    cache=parse_cache,
+    max_pages=MAX_PDF_PAGES,
+    max_chars=MAX_RESUME_CHARS,
+    ocr_backend=ocr_backend,
+    phone_region=os.getenv("CONTACT_PHONE_REGION") or None
+)
+experience_parser = ExperienceExtractorAndParser(scheduler=llm_scheduler, mode=EXPERIENCE_MODE)
 skill_extractor = SkillExtractor()
+skill_matcher = SkillMatcher(scanner=skill_extractor.scanner)
 education_extractor = ResumeEducationExtractor()
-projects_extractor = ProjectsExtractor()
+projects_extractor = ProjectsExtractor(scanner=skill_extractor.scanner)
 jd_extractor = JDExtractorGroq()
-scorer = ResumeJDScorerAsync()
+jd_registry = JDRegistry(jd_extractor, directory=JD_REGISTRY_DIR, max_items=JD_REGISTRY_ITEMS)
+scorer = ResumeJDScorerAsync(scheduler=llm_scheduler, score_cache=score_cache)
 ranker = ResumeRanker()
+prefilter = BM25Prefilter(scanner=skill_extractor.scanner, skill_sections=skill_extractor.skill_keys)
 
 # Cache recent result
 last_results = []
+# Every scored entry of the last analysis, so it can be re-weighted without the LLM
+last_scored = {"jd_id": None, "top_n": None, "results": []}
+
+# Keeps fire-and-forget upload writes referenced until they finish
+_background_tasks = set()
+
+
+def parse_files(file_inputs):
+    if PARSE_MODE == "process":
+        return resume_parser.parse_resumes_process(file_inputs)
+    if PARSE_MODE == "thread":
+        return resume_parser.parse_resumes_parallel(file_inputs, max_workers=PARSE_WORKERS or 4)
+    return resume_parser.parse_resumes(file_inputs)
+
+
+def persist_upload(path, data):
+    with open(path, "wb") as buffer:
+        buffer.write(data)
+
+
+def schedule_persist(path, data):
+    """Write an upload to disk for the preview URL without blocking the request"""
+    task = asyncio.create_task(run_in_threadpool(persist_upload, path, data))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def delayed_cleanup(paths):
+    for path in paths:
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except Exception as e:
+            print(f"Error deleting {path}: {e}")
+
+
+def schedule_cleanup(paths):
+    # Uploads stay available for preview for 5 minutes
+    threading.Timer(300.0, delayed_cleanup, args=[paths]).start()
+
+
+@app.on_event("shutdown")
+async def shutdown_pools():
+    resume_parser.shutdown_process_pool()
+    llm_client.close()
+    await llm_client.aclose()
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -49,85 +167,477 @@ async def read_index():
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 
+@app.get("/cache/stats")
+async def cache_stats():
+    llm_cache = llm_client.cache
+    return {
+        "parse": parse_cache.stats(),
+        "llm": llm_cache.stats() if llm_cache else None,
+        "score": score_cache.stats() if score_cache else None
+    }
+
+
+@app.get("/llm/stats")
+async def llm_stats():
+    return dict(llm_client.stats(), scheduler=llm_scheduler.stats())
+
+
+@app.post("/jds")
+async def create_jd(jd_text: str = Form(...), use_cache: bool = Form(True)):
+    if not jd_text.strip():
+        raise HTTPException(status_code=400, detail="Job description is empty")
+    try:
+        return await run_in_threadpool(jd_registry.register, jd_text, use_cache)
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/jds")
+async def list_jds():
+    return jd_registry.list()
+
+
+@app.get("/jds/{jd_id}")
+async def get_jd(jd_id: str):
+    record = jd_registry.get(jd_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Unknown jd_id {jd_id}")
+    return record
+
+
+@app.put("/jds/{jd_id}/weights")
+async def set_jd_weights(jd_id: str, weights: Optional[Dict[str, float]] = Body(None)):
+    try:
+        record = jd_registry.set_weights(jd_id, weights)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Unknown jd_id {jd_id}")
+    return {"jd_id": jd_id, "weights": record["weights"] or scorer.engine.weights}
+
+
+def parse_weights(weights: Optional[str]) -> Optional[Dict[str, float]]:
+    """Score weights from a JSON form field"""
+    if not weights:
+        return None
+    try:
+        parsed = json.loads(weights)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="weights must be a JSON object")
+    if not isinstance(parsed, dict):
+        raise HTTPException(status_code=400, detail="weights must be a JSON object")
+    return parsed
+
+
+def resolve_weights(weights: Optional[str], jd_record) -> Optional[Dict[str, float]]:
+    """Request weights, else the JD's stored weights, else None (engine defaults)"""
+    try:
+        score_weights = parse_weights(weights) or jd_record.get("weights")
+        if score_weights is not None:
+            normalize_weights(score_weights)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return score_weights
+
+
+async def read_uploads(resume: List[UploadFile]):
+    """In-memory uploads to parse and their paths on disk; saving them for preview happens in the background"""
+    file_paths = []
+    uploads = []
+    for file in resume:
+        data = await file.read()
+        upload = BytesIO(data)
+        upload.filename = file.filename
+        uploads.append(upload)
+        filename = f"{uuid.uuid4()}_{file.filename}"
+        path = os.path.join(UPLOAD_DIR, filename)
+        schedule_persist(path, data)
+        file_paths.append(path)
+    return uploads, file_paths
+
+
+def shortlist_size(top_n: int) -> int:
+    return max(PREFILTER_FACTOR * top_n, PREFILTER_MIN) if PREFILTER_FACTOR > 0 else 0
+
+
+async def extract_resumes(parsed, file_paths, kept, use_cache: bool):
+    """Scorer input (M2-M5 components) for the parsed resumes at indices `kept`"""
+    parsed = [parsed[i] for i in kept]
+    if EXPERIENCE_PACK_TOKENS > 0:
+        experience_data = await experience_parser.extract_and_parse_packed_async(
+            parsed, token_budget=EXPERIENCE_PACK_TOKENS, max_per_call=EXPERIENCE_PACK_SIZE, use_cache=use_cache
+        )
+    else:
+        experience_data = await experience_parser.extract_and_parse_batch_async(
+            parsed, concurrency=EXPERIENCE_CONCURRENCY, use_cache=use_cache
+        )
+    skills_data = skill_extractor.extract_and_clean_batch(parsed)
+    education_data = education_extractor.extract_batch(parsed)
+    projects_data = projects_extractor.extract_and_clean_batch(parsed)
+
+    # Combine resume components
+    parsed_resumes = []
+    for i in range(len(parsed)):
+        contact_info = experience_data[i].get("contact_info", {})
+        parsed_resumes.append({
+            "skills": skills_data[i].get("skills", []),
+            "skill_mentions": skills_data[i].get("skill_mentions", {}),
+            # Structured records give the scorer compact input; raw lines when none were recognised
+            "education": [
+                {k: v for k, v in record.items() if v is not None}
+                for record in education_data[i].get("education_records", [])
+            ] or education_data[i].get("education", []),
+            "highest_degree": education_data[i].get("highest_degree"),
+            "highest_degree_rank": education_data[i].get("highest_degree_rank", 0.0),
+            "highest_degree_grade": education_data[i].get("highest_degree_grade"),
+            "experience": experience_data[i].get("experience", []),
+            "projects": projects_data[i].get("projects", []),
+            "contact_info": contact_info,
+            "original_file_name": os.path.basename(file_paths[kept[i]])
+        })
+    return parsed_resumes
+
+
+def result_extras(parsed_resumes, parsed_jd, file_paths, kept, prefilter_ranking):
+    """Name/email/phone, local skill coverage, highest degree and prefilter audit fields for each scored entry"""
+    # Local JD-skill coverage for the whole batch in one pass
+    skill_matches = skill_matcher.match_batch(
+        parsed_jd.get("skills", []), [resume["skills"] for resume in parsed_resumes]
+    )
+    extras = []
+    for i, match in enumerate(skill_matches):
+        extras.append({
+            "matched_skills": [m["skill"] for m in match["matched_skills"]],
+            "local_skills_score": round(match["skills_score"] * 100, 2),
+            # Locally parsed education, for filtering and audit next to the LLM education_score
+            "highest_degree": parsed_resumes[i]["highest_degree"],
+            "highest_degree_rank": parsed_resumes[i]["highest_degree_rank"],
+            "highest_degree_grade": parsed_resumes[i]["highest_degree_grade"],
+            **contact_fields(parsed_resumes[i], file_paths, kept[i]),
+            **prefilter_ranking[kept[i]]
+        })
+    return extras
+
+
+def contact_fields(parsed_resume, file_paths, index: int):
+    """Name/email/phone and file URL of the uploaded resume at `index`"""
+    contact = parsed_resume.get("contact_info", {})
+    return {
+        "name": (contact.get("name") or f"Resume {index+1}").title(),
+        "email": contact.get("email", ""),
+        "phone": contact.get("phone", ""),
+        "original_file_url": f"/uploads/{os.path.basename(file_paths[index])}"
+    }
+
+
+async def shortlist_resumes(uploads, parsed_jd, top_n: int):
+    """Parse the uploads and shortlist them by local BM25 before any LLM call.
+
+    Returns (parsed, kept, prefilter_ranking): every parsed resume, the
+    indices of the shortlisted ones and the prefilter fields of each.
+    """
+    # === Resume Processing ===
+    parsed = await run_in_threadpool(parse_files, uploads)
+
+    # === Prefilter: shortlist by local BM25 before any LLM call ===
+    prefilter_ranking = prefilter.rank([p.get("sections", {}) for p in parsed], parsed_jd)
+    kept = prefilter.shortlist(prefilter_ranking, shortlist_size(top_n))
+    return parsed, kept, prefilter_ranking
+
+
+async def prepare_resumes(uploads, file_paths, parsed_jd, top_n: int, use_cache: bool):
+    """Parse, shortlist and extract resumes for scoring.
+
+    Returns (parsed_resumes, extras): scorer input for each shortlisted resume
+    and the fields to add to its scored entry.
+    """
+    parsed, kept, prefilter_ranking = await shortlist_resumes(uploads, parsed_jd, top_n)
+    parsed_resumes = await extract_resumes(parsed, file_paths, kept, use_cache)
+    return parsed_resumes, result_extras(parsed_resumes, parsed_jd, file_paths, kept, prefilter_ranking)
+
+
+async def stream_scored(parsed, file_paths, kept, prefilter_ranking, parsed_jd, use_cache: bool, weights):
+    """Yield ("extracted", count) as each group of shortlisted resumes is extracted
+    and ("candidate", entry) as each of them is scored.
+
+    Groups are one experience pack (or one resume without packing), so the
+    first candidates are scored while later groups are still being extracted.
+    """
+    size = EXPERIENCE_PACK_SIZE if EXPERIENCE_PACK_TOKENS > 0 else 1
+    chunks = [kept[i:i + size] for i in range(0, len(kept), max(size, 1))]
+    queue = asyncio.Queue()
+
+    async def run(chunk):
+        try:
+            parsed_resumes = await extract_resumes(parsed, file_paths, chunk, use_cache)
+            extras = result_extras(parsed_resumes, parsed_jd, file_paths, chunk, prefilter_ranking)
+            await queue.put(("extracted", len(chunk)))
+            async for index, res in scorer.score_resumes_stream(
+                parsed_resumes, parsed_jd, include_contact=True, use_cache=use_cache, weights=weights
+            ):
+                res.update(extras[index])
+                await queue.put(("candidate", res))
+        except Exception as e:
+            await queue.put(("error", e))
+        finally:
+            await queue.put(None)
+
+    tasks = [asyncio.ensure_future(run(chunk)) for chunk in chunks]
+    try:
+        running = len(tasks)
+        while running:
+            item = await queue.get()
+            if item is None:
+                running -= 1
+                continue
+            kind, value = item
+            if kind == "error":
+                raise value
+            yield kind, value
+    finally:
+        # Stop the remaining extraction and scoring if the client went away or a group failed
+        for task in tasks:
+            task.cancel()
+
+
+async def resolve_jd(jd_text: Optional[str], jd_id: Optional[str], use_cache: bool):
+    """Registry record for jd_id, or for jd_text (parsed only the first time it is seen)"""
+    if jd_id:
+        record = jd_registry.get(jd_id)
+        if record is None:
+            raise HTTPException(status_code=404, detail=f"Unknown jd_id {jd_id}")
+        return record
+    if not jd_text or not jd_text.strip():
+        raise HTTPException(status_code=400, detail="Job description is empty")
+    return await run_in_threadpool(jd_registry.register, jd_text, use_cache)
+
+
+@app.post("/rescore")
+async def rescore_last(
+    weights: Optional[Dict[str, float]] = Body(None, embed=True),
+    top_n: Optional[int] = Body(None, embed=True)
+):
+    """Re-rank the last analysis with new weights; no LLM calls"""
+    global last_results
+    if not last_scored["results"]:
+        raise HTTPException(status_code=404, detail="No analysis to rescore")
+    if weights is None:
+        record = jd_registry.get(last_scored["jd_id"])
+        weights = record.get("weights") if record else None
+    results = [dict(res) for res in last_scored["results"]]
+    try:
+        scorer.engine.apply(results, weights)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    ranked = ResumeRanker(top_n=top_n or last_scored["top_n"]).rank(results)
+    last_results = ranked
+    return JSONResponse(content=ranked, headers={"X-JD-ID": last_scored["jd_id"]})
+
+
 @app.post("/analyze")
 async def analyze_resumes(
     resume: List[UploadFile] = File(...),
-    jd_text: str = Form(...),
-    top_n: int = Form(5)
+    jd_text: Optional[str] = Form(None),
+    jd_id: Optional[str] = Form(None),
+    top_n: int = Form(5),
+    use_cache: bool = Form(True),
+    weights: Optional[str] = Form(None)
 ):
     global last_results
     try:
         if not resume:
             raise HTTPException(status_code=400, detail="No files uploaded")
-        if not jd_text.strip():
-            raise HTTPException(status_code=400, detail="Job description is empty")
-
-        # Save uploaded files
-        file_paths = []
-        for file in resume:
-            filename = f"{uuid.uuid4()}_{file.filename}"
-            path = os.path.join(UPLOAD_DIR, filename)
-            with open(path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            file_paths.append(path)
-
-        # === JD Processing ===
-        parsed_jd = jd_extractor.extract(jd_text)
-
-        # === Resume Processing ===
-        parsed = resume_parser.parse_resumes(file_paths)
-        experience_data = experience_parser.extract_and_parse_batch(parsed)
-        skills_data = skill_extractor.extract_and_clean_batch(parsed)
-        education_data = education_extractor.extract_batch(parsed)
-        projects_data = projects_extractor.extract_and_clean_batch(parsed)
-
-        # Combine resume components
-        parsed_resumes = []
-        for i in range(len(parsed)):
-            contact_info = experience_data[i].get("contact_info", {})
-            parsed_resumes.append({
-                "skills": skills_data[i],
-                "education": education_data[i],
-                "experience": experience_data[i].get("experience", []),
-                "projects": projects_data[i],
-                "contact_info": contact_info,
-                "original_file_name": os.path.basename(file_paths[i])
-            })
+        jd_record = await resolve_jd(jd_text, jd_id, use_cache)
+        parsed_jd = jd_record["parsed"]
+        score_weights = resolve_weights(weights, jd_record)
 
+        uploads, file_paths = await read_uploads(resume)
+        parsed_resumes, extras = await prepare_resumes(uploads, file_paths, parsed_jd, top_n, use_cache)
 
         # === Scoring ===
-        results = await scorer.score_resumes_batch(parsed_resumes, parsed_jd, include_contact=True)
-
-        # Attach name/email/phone for ranking output
-        for i, res in enumerate(results):
-            contact = parsed_resumes[i].get("contact_info", {})
-            res.update({
-                "name": contact.get("name", f"Resume {i+1}").title(),
-                "email": contact.get("email", ""),
-                "phone": contact.get("phone", ""),
-                "original_file_url": f"/uploads/{os.path.basename(file_paths[i])}"
-            })
+        results = await scorer.score_resumes_batch(
+            parsed_resumes, parsed_jd, include_contact=True, use_cache=use_cache, weights=score_weights
+        )
+        for res, extra in zip(results, extras):
+            res.update(extra)
 
         # === Ranking ===
+        last_scored.update(jd_id=jd_record["jd_id"], top_n=top_n, results=[dict(res) for res in results])
         ranked = ResumeRanker(top_n=top_n).rank(results)
         last_results = ranked
 
-        # Cleanup
-        
+        schedule_cleanup(file_paths)
+
+        return JSONResponse(content=ranked, headers={"X-JD-ID": jd_record["jd_id"]})
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def stream_frame(event: str, data, stream_format: str) -> str:
+    if stream_format == "sse":
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    return json.dumps({"event": event, "data": data}) + "\n"
 
-        def delayed_cleanup(paths):
-            for path in paths:
-                try:
-                    if os.path.exists(path):
-                        os.remove(path)
-                except Exception as e:
-                    print(f"Error deleting {path}: {e}")
 
-        # Schedule file deletion after 10 seconds
-        threading.Timer(300.0, delayed_cleanup, args=[file_paths]).start()
+@app.post("/analyze/stream")
+async def analyze_resumes_stream(
+    resume: List[UploadFile] = File(...),
+    jd_text: Optional[str] = Form(None),
+    jd_id: Optional[str] = Form(None),
+    top_n: int = Form(5),
+    use_cache: bool = Form(True),
+    weights: Optional[str] = Form(None),
+    stream_format: str = Form("ndjson")
+):
+    """/analyze that streams progress and each candidate as soon as it is scored.
+
+    Events: "start" (JD and upload count) before any parsing, "shortlist"
+    (how many resumes passed the prefilter), "extracted" as each group of
+    them is extracted, then per candidate a "candidate" event and a "top"
+    event with the current top-N, and finally "done" with the ranked results
+    (or "error"). stream_format is "ndjson" (one JSON object per line) or
+    "sse" (Server-Sent Events).
+    """
+    if stream_format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="stream_format must be 'ndjson' or 'sse'")
+    try:
+        if not resume:
+            raise HTTPException(status_code=400, detail="No files uploaded")
+        jd_record = await resolve_jd(jd_text, jd_id, use_cache)
+        parsed_jd = jd_record["parsed"]
+        score_weights = resolve_weights(weights, jd_record)
+
+        uploads, file_paths = await read_uploads(resume)
+        schedule_cleanup(file_paths)
+    except HTTPException:
+        raise
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def events():
+        global last_results
+        yield stream_frame("start", {"jd_id": jd_record["jd_id"], "uploaded": len(file_paths)}, stream_format)
+        results = []
+        try:
+            parsed, kept, prefilter_ranking = await shortlist_resumes(uploads, parsed_jd, top_n)
+            yield stream_frame("shortlist", {"scoring": len(kept)}, stream_format)
+
+            extracted = 0
+            async for kind, value in stream_scored(
+                parsed, file_paths, kept, prefilter_ranking, parsed_jd, use_cache, score_weights
+            ):
+                if kind == "extracted":
+                    extracted += value
+                    yield stream_frame("extracted", {"extracted": extracted, "scoring": len(kept)}, stream_format)
+                    continue
+                results.append(value)
+                yield stream_frame("candidate", value, stream_format)
+                top = ResumeRanker(top_n=top_n).rank([dict(r) for r in results])
+                yield stream_frame("top", top, stream_format)
+
+            last_scored.update(jd_id=jd_record["jd_id"], top_n=top_n, results=[dict(res) for res in results])
+            ranked = ResumeRanker(top_n=top_n).rank(results)
+            last_results = ranked
+            yield stream_frame("done", ranked, stream_format)
+        except Exception as e:
+            traceback.print_exc()
+            yield stream_frame("error", {"detail": str(e)}, stream_format)
+
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        events(), media_type=media_type, headers={"X-JD-ID": jd_record["jd_id"], "Cache-Control": "no-cache"}
+    )
+
+
+@app.post("/analyze/matrix")
+async def analyze_matrix(
+    resume: List[UploadFile] = File(...),
+    jd_ids: List[str] = Form([]),
+    jd_texts: List[str] = Form([]),
+    top_n: int = Form(5),
+    use_cache: bool = Form(True)
+):
+    """Screen one upload against several JDs (repeat jd_ids / jd_texts fields).
+
+    Resumes are parsed and extracted once; a resume is scored against a JD
+    when the prefilter shortlists it for that JD. Returns the candidates x
+    JDs match_percent matrix (null where not scored), a top-N ranking per JD
+    and each candidate's best-fit JD.
+    """
+    try:
+        if not resume:
+            raise HTTPException(status_code=400, detail="No files uploaded")
+        if not jd_ids and not jd_texts:
+            raise HTTPException(status_code=400, detail="Provide at least one jd_ids or jd_texts field")
+        jd_records = {}
+        for jd_id in jd_ids:
+            record = await resolve_jd(None, jd_id, use_cache)
+            jd_records.setdefault(record["jd_id"], record)
+        for text in jd_texts:
+            record = await resolve_jd(text, None, use_cache)
+            jd_records.setdefault(record["jd_id"], record)
+        jd_records = list(jd_records.values())
+        parsed_jds = [record["parsed"] for record in jd_records]
+
+        uploads, file_paths = await read_uploads(resume)
+        parsed = await run_in_threadpool(parse_files, uploads)
+
+        # Per-JD shortlists; resumes are tokenized once for every JD, the union is
+        # extracted once and each JD scores its own shortlist
+        documents = [prefilter.document_terms(p.get("sections", {})) for p in parsed]
+        prefilter_rankings = [prefilter.rank_documents(documents, parsed_jd) for parsed_jd in parsed_jds]
+        shortlists = [prefilter.shortlist(ranking, shortlist_size(top_n)) for ranking in prefilter_rankings]
+        kept = sorted(set().union(*shortlists))
+        position = {index: i for i, index in enumerate(kept)}
+        parsed_resumes = await extract_resumes(parsed, file_paths, kept, use_cache)
+
+        # === Scoring: all (resume, JD) pairs share one scheduler batch ===
+        matrix = await scorer.score_resumes_matrix(
+            parsed_resumes, parsed_jds, include_contact=True, use_cache=use_cache,
+            weights=[record.get("weights") for record in jd_records],
+            pairs=[[position[index] for index in shortlist] for shortlist in shortlists]
+        )
+        for j, row in enumerate(matrix):
+            extras = result_extras(parsed_resumes, parsed_jds[j], file_paths, kept, prefilter_rankings[j])
+            for entry, extra in zip(row, extras):
+                if entry is not None:
+                    entry.update(extra)
+
+        # === Ranking ===
+        jds = [{"jd_id": record["jd_id"], "title": record["title"]} for record in jd_records]
+        candidates = [contact_fields(resume, file_paths, index) for resume, index in zip(parsed_resumes, kept)]
+        # candidates x JDs, None where a pair was not scored
+        scores = [
+            [row[i]["match_percent"] if row[i] is not None and isinstance(row[i]["match_percent"], (int, float)) else None
+             for row in matrix]
+            for i in range(len(parsed_resumes))
+        ]
+        best = ranker.best_fit(scores)
+        schedule_cleanup(file_paths)
 
-        return JSONResponse(content=ranked)
+        return JSONResponse(content={
+            "jds": jds,
+            "uploaded": len(file_paths),
+            "candidates": candidates,
+            "match_matrix": scores,
+            "rankings": [
+                dict(jd, ranked=ResumeRanker(top_n=top_n).rank([entry for entry in row if entry is not None]))
+                for jd, row in zip(jds, matrix)
+            ],
+            "best_fit": [
+                dict(candidate, **jds[j], match_percent=scores[i][j]) if j is not None else dict(candidate, jd_id=None)
+                for i, (candidate, j) in enumerate(zip(candidates, best))
+            ]
+        })
 
+    except HTTPException:
+        raise
     except Exception as e:
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,91 @@
+"""Benchmark ResumeParser.extract_sections against the old per-header regex loop.
+
+Usage: python benchmarks/bench_extract_sections.py [--lines 2000] [--repeat 5]
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from M1_file_handling import ResumeParser
+
+
+def legacy_extract_sections(section_headers, text):
+    sections = {}
+    current_section = "HEADER"
+    current_content = []
+
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        is_header = False
+        for header in section_headers:
+            pattern = r'^' + ''.join(f'{char}\\s*' for char in header) + r'\s*[:-]?\s*$'
+            if re.match(pattern, line, re.IGNORECASE):
+                if current_content:
+                    sections[current_section] = '\n'.join(current_content)
+                current_section = header
+                current_content = []
+                is_header = True
+                break
+        if not is_header:
+            current_content.append(line)
+    if current_content:
+        sections[current_section] = '\n'.join(current_content)
+    return sections
+
+
+def build_resume(section_headers, n_lines, seed=0):
+    rng = random.Random(seed)
+    body = [
+        "Developed REST APIs in Python and FastAPI serving 2M requests/day",
+        "Led a team of 4 engineers; reduced cloud spend by 30%",
+        "B.Tech in Computer Science, 2016 - 2020, GPA 8.4",
+        "Skills: Python, SQL, Docker, Kubernetes, AWS",
+        "• Built ETL pipelines with Airflow and Spark",
+    ]
+    lines = ["John Doe", "john.doe@example.com | +1 555 123 4567"]
+    while len(lines) < n_lines:
+        header = rng.choice(section_headers)
+        lines.append(' '.join(header) if rng.random() < 0.2 else header.title() + ':')
+        lines.extend(rng.choice(body) for _ in range(rng.randint(5, 15)))
+    return '\n'.join(lines[:n_lines])
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--lines', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    resume_parser = ResumeParser()
+    text = build_resume(resume_parser.section_headers, args.lines)
+
+    expected = legacy_extract_sections(resume_parser.section_headers, text)
+    if resume_parser.extract_sections(text) != expected:
+        raise SystemExit("extract_sections output differs from the legacy implementation")
+
+    legacy = timed(lambda: legacy_extract_sections(resume_parser.section_headers, text), args.repeat)
+    current = timed(lambda: resume_parser.extract_sections(text), args.repeat)
+    print(f"lines={args.lines} sections={len(expected)}")
+    print(f"legacy  : {legacy * 1000:9.2f} ms")
+    print(f"current : {current * 1000:9.2f} ms")
+    print(f"speedup : {legacy / current:9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark SkillScanner.scan throughput over synthetic resumes.
+
+Usage: python benchmarks/bench_skill_scanner.py [--resumes 2000] [--lines 60]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from M3_resume_skills_extractor import SkillExtractor
+
+
+def build_sections(n_lines, seed=0):
+    rng = random.Random(seed)
+    body = [
+        "Built microservices in Python/Django and Spring Boot deployed on AWS EKS",
+        "Led a team of 4 engineers; reduced cloud spend by 30% with Terraform",
+        "Designed Kafka-based ETL pipelines feeding Snowflake and Power BI dashboards",
+        "Mentored interns and ran sprint planning for the platform group",
+        "Improved p95 latency of the checkout service by 40% using Redis caching",
+    ]
+    return {
+        "SKILLS": "Python, Java, Go, K8s, ReactJS, Node JS, C++, C#, .NET, CI/CD, scikit-learn, PostgreSQL",
+        "EXPERIENCE": '\n'.join(rng.choice(body) for _ in range(n_lines)),
+        "PROJECTS": '\n'.join(rng.choice(body) for _ in range(n_lines // 3)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--resumes', type=int, default=2000)
+    parser.add_argument('--lines', type=int, default=60)
+    args = parser.parse_args()
+
+    extractor = SkillExtractor()
+    resumes = [{"sections": build_sections(args.lines, seed)} for seed in range(50)]
+    chars = sum(len(text) for resume in resumes for text in resume["sections"].values()) / len(resumes)
+
+    start = time.perf_counter()
+    for i in range(args.resumes):
+        extractor.scan_skills(resumes[i % len(resumes)])
+    elapsed = time.perf_counter() - start
+    print(f"resumes={args.resumes} avg_chars={chars:.0f}")
+    print(f"total   : {elapsed * 1000:9.2f} ms")
+    print(f"rate    : {args.resumes / elapsed:9.0f} resumes/s")
+
+
+if __name__ == '__main__':
+    main()
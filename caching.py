@@ -0,0 +1,255 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU mapping"""
+
+    def __init__(self, max_items: int = 256):
+        self.max_items = max_items
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: str, value: Any):
+        if self.max_items <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+
+    def pop(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """JSON-file store with a total size cap.
+
+    Each entry is one file named after its key. When the directory grows past
+    max_bytes the least recently used files (by mtime, refreshed on read) are
+    deleted first.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 256 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size = sum(p.stat().st_size for p in self.directory.glob('*.json'))
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            os.utime(path)
+            return value
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, value: Any):
+        data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with self._lock:
+            old_size = path.stat().st_size if path.exists() else 0
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._size += len(data) - old_size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def delete(self, key: str):
+        path = self._path(key)
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+                self._size -= size
+            except OSError:
+                pass
+
+    def _evict(self):
+        # Other processes may share the directory, so re-measure before evicting
+        entries = []
+        for path in self.directory.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if self._size <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                self._size -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        with self._lock:
+            for path in self.directory.glob('*.json'):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._size = 0
+
+
+class TieredCache:
+    """In-memory LRU in front of an optional DiskCache, with hit/miss counters.
+
+    Values are stored in an envelope with their expiry time; with ttl set
+    (seconds) entries older than that are treated as misses and dropped.
+    """
+
+    def __init__(
+        self,
+        max_items: int = 256,
+        disk_dir: Optional[Union[str, Path]] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        ttl: Optional[float] = None
+    ):
+        self.memory = LRUCache(max_items)
+        self.disk = DiskCache(disk_dir, max_disk_bytes) if disk_dir else None
+        self.ttl = ttl
+        self._counts = {'hits': 0, 'misses': 0, 'memory_hits': 0, 'disk_hits': 0, 'expired': 0}
+        self._count_lock = threading.Lock()
+
+    def _count(self, *names: str):
+        with self._count_lock:
+            for name in names:
+                self._counts[name] += 1
+
+    def _live(self, key: str, envelope: Any) -> bool:
+        if not isinstance(envelope, dict) or 'value' not in envelope:
+            return False
+        expires_at = envelope.get('expires_at')
+        if expires_at is not None and expires_at <= time.time():
+            self._count('expired')
+            self.delete(key)
+            return False
+        return True
+
+    def get(self, key: str) -> Optional[Any]:
+        envelope = self.memory.get(key)
+        if envelope is not None and self._live(key, envelope):
+            self._count('hits', 'memory_hits')
+            return envelope['value']
+        if self.disk is not None:
+            envelope = self.disk.get(key)
+            if envelope is not None and self._live(key, envelope):
+                self.memory.put(key, envelope)
+                self._count('hits', 'disk_hits')
+                return envelope['value']
+        self._count('misses')
+        return None
+
+    def put(self, key: str, value: Any):
+        envelope = {'expires_at': time.time() + self.ttl if self.ttl else None, 'value': value}
+        self.memory.put(key, envelope)
+        if self.disk is not None:
+            self.disk.put(key, envelope)
+
+    def delete(self, key: str):
+        self.memory.pop(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._count_lock:
+            return dict(self._counts, memory_items=len(self.memory))
+
+
+class ParseCache(TieredCache):
+    """Cache of extracted resume text and sections keyed on the raw file bytes.
+
+    Entries are dicts with 'text', 'truncated' and, once a full parse has
+    run, the parse 'result'.
+    """
+
+    @staticmethod
+    def key(content: Union[bytes, memoryview], parser_version: str) -> str:
+        digest = hashlib.sha256(content)
+        digest.update(b'\0' + parser_version.encode('utf-8'))
+        return digest.hexdigest()
+
+
+class LLMResponseCache(TieredCache):
+    """Cache of chat-completion responses keyed on a fingerprint of the request"""
+
+    @staticmethod
+    def key(
+        model: str,
+        temperature: float,
+        messages: List[Dict[str, str]],
+        prompt_version: str,
+        **params: Any
+    ) -> str:
+        fingerprint = json.dumps(
+            {
+                'model': model,
+                'temperature': temperature,
+                'messages': messages,
+                'prompt_version': prompt_version,
+                'params': params
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(',', ':')
+        )
+        return hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()
+
+
+def content_hash(value: Any) -> str:
+    """Stable hash of a JSON-serialisable value (dict key order does not matter)"""
+    canonical = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ScoreCache(TieredCache):
+    """Cache of parsed resume-vs-JD scores.
+
+    Keyed on content hashes of the resume's extracted components and of the
+    parsed JD, plus the model and a fingerprint of the scoring prompt, so a
+    changed prompt misses instead of returning stale scores.
+    """
+
+    @staticmethod
+    def key(resume_hash: str, jd_hash: str, model: str, prompt_fingerprint: str) -> str:
+        return content_hash([resume_hash, jd_hash, model, prompt_fingerprint])
@@ -0,0 +1,271 @@
+import re
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+PRESENT_WORDS = r'present|current(?:ly)?|now|today|ongoing|till\s+date|to\s+date|date'
+
+_MONTH = r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?'
+_DATE = rf"(?:{_MONTH}\s*,?\s*(?:\d{{4}}|['’]\d{{2}})|\d{{1,2}}\s*[/.]\s*\d{{4}}|(?:19|20)\d{{2}})"
+
+# "Jan 2020 – Present", "06/2018 to 08/2020", "2019-21", "March 2017 - Jun '19"; a two-digit
+# end followed by "%" or decimals is a score, not a year ("HSC 2016 - 85%", "2016 – 92.4%")
+DATE_RANGE_PATTERN = re.compile(
+    rf"(?<![\w/.])(?P<start>{_DATE})\s*(?:-+|–|—|to|till|until)\s*"
+    rf"(?P<end>{_DATE}|{PRESENT_WORDS}|\d{{2}}(?!\s*%|\.\d))(?![\w/])",
+    re.IGNORECASE
+)
+DATE_PATTERN = re.compile(rf"(?P<month>{_MONTH})?\s*,?\s*(?P<year>\d{{4}}|['’]\d{{2}})|(?P<num_month>\d{{1,2}})\s*[/.]\s*(?P<num_year>\d{{4}})", re.IGNORECASE)
+PRESENT_PATTERN = re.compile(rf'^(?:{PRESENT_WORDS})$', re.IGNORECASE)
+
+BULLET_PATTERN = re.compile(r'^\s*(?:[-*•●▪■◦‣–—>]|\d{1,2}[.)])\s*')
+FIELD_SPLIT_PATTERN = re.compile(r'\s*(?:\||•|·|\s[-–—]\s|@|\bat\b)\s*')
+EMPTY_BRACKETS_PATTERN = re.compile(r'\(\s*\)|\[\s*\]')
+
+TITLE_WORDS = {
+    'engineer', 'developer', 'manager', 'analyst', 'intern', 'internship', 'consultant', 'scientist',
+    'designer', 'lead', 'architect', 'specialist', 'associate', 'director', 'officer', 'administrator',
+    'coordinator', 'executive', 'assistant', 'head', 'president', 'founder', 'co-founder', 'researcher',
+    'teacher', 'trainee', 'programmer', 'tester', 'technician', 'accountant', 'representative',
+    'advisor', 'owner', 'vp', 'cto', 'ceo', 'cfo', 'partner', 'supervisor', 'instructor', 'professor',
+    'fellow', 'member', 'sde', 'swe', 'devops', 'administrator', 'editor', 'writer', 'strategist',
+    'recruiter', 'auditor', 'agent', 'clerk', 'nurse', 'volunteer', 'apprentice', 'principal'
+}
+# Legal suffixes mark a company even next to title words ("Software Engineering Services Pvt Ltd")
+COMPANY_SUFFIXES = {
+    'inc', 'inc.', 'ltd', 'ltd.', 'llc', 'llp', 'pvt', 'pvt.', 'limited', 'corp', 'corp.', 'corporation',
+    'co.', 'gmbh', 'plc', 'ag', 's.a.'
+}
+COMPANY_WORDS = COMPANY_SUFFIXES | {
+    'company', 'technologies', 'technology', 'solutions', 'labs', 'systems', 'services', 'software',
+    'group', 'consulting', 'university', 'institute', 'college', 'bank', 'hospital', 'agency', 'studio',
+    'studios', 'foundation', 'ventures', 'networks', 'industries'
+}
+LOCATION_WORDS = {'remote', 'hybrid', 'onsite', 'on-site', 'wfh'}
+# Titles that do not count towards relevant (professional) experience
+NON_RELEVANT_TITLE_WORDS = {'intern', 'internship', 'trainee', 'volunteer', 'apprentice', 'student'}
+
+# Longest line still treated as a job header rather than a responsibility
+MAX_HEADER_WORDS = 14
+# Latest end year accepted, relative to today (expected graduation dates lie a few years ahead)
+MAX_FUTURE_YEARS = 6
+
+
+def _year(text: str, reference: Optional[int] = None) -> int:
+    digits = text.lstrip("'’")
+    if len(digits) == 4:
+        return int(digits)
+    century = (reference // 100) * 100 if reference else 2000
+    return century + int(digits)
+
+
+def parse_date(text: str, today: Optional[date] = None) -> Optional[Tuple[int, int]]:
+    """Parse "Jan 2020", "06/2018", "2019" or "Present" into (year, month); None if unrecognised.
+
+    Year-only dates map to January, so "2019 - 2021" counts as two years.
+    """
+    text = (text or '').strip()
+    if not text:
+        return None
+    if PRESENT_PATTERN.match(text):
+        today = today or date.today()
+        return today.year, today.month
+    match = DATE_PATTERN.search(text)
+    if not match:
+        return None
+    if match.group('num_year'):
+        month = int(match.group('num_month'))
+        return (int(match.group('num_year')), month) if 1 <= month <= 12 else None
+    month_name = match.group('month')
+    month = MONTHS[month_name[:3].lower()] if month_name else 1
+    return _year(match.group('year')), month
+
+
+def find_date_ranges(text: str, today: Optional[date] = None) -> List[Tuple[str, str, Tuple[int, int], Tuple[int, int]]]:
+    """All date ranges in `text` as (start text, end text, (year, month), (year, month))"""
+    ranges = []
+    latest = (today or date.today()).year + MAX_FUTURE_YEARS
+    for match in DATE_RANGE_PATTERN.finditer(text):
+        start_text, end_text = match.group('start').strip(), match.group('end').strip()
+        start = parse_date(start_text, today)
+        if start is None:
+            continue
+        if re.fullmatch(r'\d{2}', end_text):
+            # "2019-21": the end year shares the start's century
+            end = (_year(end_text, start[0]), start[1])
+            end_text = str(end[0])
+        else:
+            end = parse_date(end_text, today)
+        if end is None or end < start or end[0] > latest:
+            continue
+        ranges.append((start_text, end_text, start, end))
+    return ranges
+
+
+def months_between(start: Tuple[int, int], end: Tuple[int, int]) -> int:
+    return (end[0] - start[0]) * 12 + end[1] - start[1]
+
+
+def merged_months(intervals: List[Tuple[Tuple[int, int], Tuple[int, int]]]) -> int:
+    """Total months covered by the intervals, counting overlapping jobs once"""
+    total = 0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += months_between(current_start, current_end)
+            current_start, current_end = start, end
+        elif end > current_end:
+            current_end = end
+    if current_end is not None:
+        total += months_between(current_start, current_end)
+    return total
+
+
+class RuleBasedExperienceParser:
+    """Offline parser for experience sections.
+
+    Splits the section into jobs at header lines that carry a date range,
+    takes job title, company and location from the fields around the dates
+    and treats bullet or long lines as responsibilities. Output follows the
+    LLM experience schema (job_title, company, duration {start, end},
+    location, responsibilities), plus total and relevant years and a
+    confidence score for deciding whether the LLM is still needed.
+    """
+
+    def __init__(self, today: Optional[date] = None):
+        self.today = today
+
+    @staticmethod
+    def _is_header_line(line: str) -> bool:
+        return not BULLET_PATTERN.match(line) and len(line.split()) <= MAX_HEADER_WORDS and not line.endswith('.')
+
+    @staticmethod
+    def _words(fragment: str) -> set:
+        return {word.strip(',()').lower() for word in fragment.split()}
+
+    def _fragments(self, line: str) -> List[str]:
+        fragments = []
+        for fragment in FIELD_SPLIT_PATTERN.split(line):
+            fragment = EMPTY_BRACKETS_PATTERN.sub('', fragment).strip(' ,;:()[]')
+            if not fragment:
+                continue
+            # "Data Intern, Initech Labs" holds two fields; "Pune, India" is one location
+            if ',' in fragment and self._words(fragment) & (TITLE_WORDS | COMPANY_WORDS):
+                fragments.extend(part.strip() for part in fragment.split(',') if part.strip())
+            else:
+                fragments.append(fragment)
+        return fragments
+
+    def _classify_fields(self, header_lines: List[str]) -> Dict[str, str]:
+        fields = {'job_title': '', 'company': '', 'location': ''}
+        others = []
+        for line in header_lines:
+            for fragment in self._fragments(line):
+                words = self._words(fragment)
+                if not fields['location'] and (words & LOCATION_WORDS or (',' in fragment and not words & (TITLE_WORDS | COMPANY_WORDS))):
+                    fields['location'] = fragment
+                elif not fields['company'] and words & COMPANY_SUFFIXES:
+                    fields['company'] = fragment
+                elif not fields['job_title'] and words & TITLE_WORDS:
+                    fields['job_title'] = fragment
+                elif not fields['company'] and words & COMPANY_WORDS:
+                    fields['company'] = fragment
+                else:
+                    others.append(fragment)
+        for field in ('company', 'job_title'):
+            if not fields[field] and others:
+                fields[field] = others.pop(0)
+        return fields
+
+    def _build_entry(self, header_lines: List[str], body_lines: List[str]) -> Tuple[Dict, Optional[Tuple]]:
+        interval = None
+        duration = {'start': '', 'end': ''}
+        cleaned = []
+        for line in header_lines:
+            ranges = find_date_ranges(line, self.today)
+            if ranges and interval is None:
+                start_text, end_text, start, end = ranges[0]
+                duration = {'start': start_text, 'end': end_text}
+                interval = (start, end)
+            line = DATE_RANGE_PATTERN.sub(' ', line).strip(' ,|-–—')
+            if line:
+                cleaned.append(line)
+        entry = dict(self._classify_fields(cleaned), duration=duration)
+        entry['responsibilities'] = [BULLET_PATTERN.sub('', line).strip() for line in body_lines]
+        return entry, interval
+
+    def _segment(self, lines: List[str]) -> List[Tuple[List[str], List[str]]]:
+        """Group lines into (header lines, body lines) per job, one job per dated header line"""
+        header_line = [self._is_header_line(line) for line in lines]
+        dated = [i for i, line in enumerate(lines) if header_line[i] and DATE_RANGE_PATTERN.search(line)]
+        jobs = []
+        previous_end = 0
+        for k, date_index in enumerate(dated):
+            # Title and company sit on up to two header lines right above the dates
+            start = date_index
+            while start > max(previous_end, date_index - 2) and header_line[start - 1]:
+                start -= 1
+            if jobs:
+                jobs[-1][1].extend(lines[previous_end:start])
+            end = date_index + 1
+            next_date = dated[k + 1] if k + 1 < len(dated) else len(lines)
+            # A short line right after the dates (often company or location) still belongs to the header
+            if end < next_date - 1 and header_line[end] and len(lines[end].split()) <= 6:
+                end += 1
+            jobs.append((lines[start:end], []))
+            previous_end = end
+        if jobs:
+            jobs[-1][1].extend(lines[previous_end:])
+        return jobs
+
+    def parse(self, text: str) -> Dict:
+        lines = [line.strip() for line in (text or '').split('\n') if line.strip()]
+        experience = []
+        intervals = []
+        for header_lines, body_lines in self._segment(lines):
+            if not header_lines:
+                continue
+            entry, interval = self._build_entry(header_lines, body_lines)
+            if not (entry['job_title'] or entry['company']):
+                continue
+            experience.append(entry)
+            intervals.append(interval)
+
+        scores = [
+            0.5 * (interval is not None) + 0.3 * bool(entry['job_title']) + 0.2 * bool(entry['company'])
+            for entry, interval in zip(experience, intervals)
+        ]
+        result = {
+            'experience': experience,
+            'confidence': round(sum(scores) / len(scores), 2) if scores else 0.0
+        }
+        result.update(self.years_of_experience(experience))
+        return result
+
+    def years_of_experience(self, experience: List[Dict]) -> Dict[str, float]:
+        """Total and relevant years across entries, overlaps counted once.
+
+        Works on LLM output too, as long as duration start/end are dates
+        parse_date understands. Relevant years leave out internships,
+        trainee and volunteer roles.
+        """
+        total, relevant = [], []
+        for entry in experience:
+            duration = entry.get('duration') or {}
+            if not isinstance(duration, dict):
+                continue
+            start = parse_date(str(duration.get('start') or ''), self.today)
+            end = parse_date(str(duration.get('end') or ''), self.today)
+            if start is None or end is None or end < start:
+                continue
+            total.append((start, end))
+            if not self._words(str(entry.get('job_title') or '')) & NON_RELEVANT_TITLE_WORDS:
+                relevant.append((start, end))
+        return {
+            'total_years': round(merged_months(total) / 12, 1),
+            'relevant_years': round(merged_months(relevant) / 12, 1)
+        }
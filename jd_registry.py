@@ -0,0 +1,143 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from M6_jd_processor import PROMPT_VERSION, JDExtractorGroq
+from scoring_engine import normalize_weights
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_jd_text(text: str) -> str:
+    """Unicode-normalised, lowercased JD text with whitespace collapsed"""
+    return ' '.join(unicodedata.normalize('NFKC', text).lower().split())
+
+
+def jd_id_for(text: str) -> str:
+    return hashlib.sha256(normalize_jd_text(text).encode('utf-8')).hexdigest()[:16]
+
+
+class JDRegistry:
+    """Parsed job descriptions keyed by a hash of their normalised text.
+
+    Registering the same JD again (even with different whitespace or case)
+    returns the stored record without another LLM call, unless the JD
+    prompt version changed since it was parsed or the earlier parse failed.
+    With `directory` set, records are also kept as JSON files and reloaded
+    on start.
+    """
+
+    def __init__(
+        self,
+        extractor: Optional[JDExtractorGroq] = None,
+        directory: Optional[Union[str, Path]] = None,
+        max_items: int = 1000
+    ):
+        self.extractor = extractor or JDExtractorGroq()
+        self.directory = Path(directory) if directory else None
+        self.max_items = max_items
+        self._records: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._load()
+
+    def _load(self):
+        paths = sorted(self.directory.glob('*.json'), key=lambda p: p.stat().st_mtime)
+        for path in paths[-self.max_items:]:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    record = json.load(f)
+                self._records[record['jd_id']] = record
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("Skipping unreadable JD record %s: %s", path, e)
+
+    def _save(self, record: Dict[str, Any]):
+        if self.directory is None:
+            return
+        path = self.directory / f"{record['jd_id']}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _store(self, record: Dict[str, Any]):
+        with self._lock:
+            self._records[record['jd_id']] = record
+            self._records.move_to_end(record['jd_id'])
+            while len(self._records) > self.max_items:
+                old_id, _ = self._records.popitem(last=False)
+                if self.directory is not None:
+                    (self.directory / f"{old_id}.json").unlink(missing_ok=True)
+        self._save(record)
+
+    @staticmethod
+    def _is_current(record: Dict[str, Any]) -> bool:
+        return record.get('prompt_version') == PROMPT_VERSION and 'error' not in record['parsed']
+
+    def register(self, jd_text: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Return the record for jd_text, parsing it only if it is new or stale.
+
+        use_cache=False forces a fresh parse.
+        """
+        jd_id = jd_id_for(jd_text)
+        existing = self.get(jd_id)
+        if existing is not None and use_cache and self._is_current(existing):
+            return existing
+
+        parsed = self.extractor.extract(jd_text, use_cache=use_cache)
+        title = next((line.strip() for line in jd_text.splitlines() if line.strip()), '')[:120]
+        record = {
+            'jd_id': jd_id,
+            'title': title,
+            'text': jd_text,
+            'parsed': parsed,
+            'prompt_version': PROMPT_VERSION,
+            'weights': existing.get('weights') if existing else None,
+            'created_at': existing['created_at'] if existing else time.time(),
+            'updated_at': time.time()
+        }
+        self._store(record)
+        return record
+
+    def set_weights(self, jd_id: str, weights: Optional[Dict[str, float]]) -> Optional[Dict[str, Any]]:
+        """Store score weights for a JD (None restores the defaults); None if jd_id is unknown.
+
+        Raises ValueError for invalid weights.
+        """
+        existing = self.get(jd_id)
+        if existing is None:
+            return None
+        record = dict(
+            existing,
+            weights=normalize_weights(weights) if weights is not None else None,
+            updated_at=time.time()
+        )
+        self._store(record)
+        return record
+
+    def get(self, jd_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._records.get(jd_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Summaries of stored JDs, newest first"""
+        with self._lock:
+            records = list(self._records.values())
+        return [
+            {
+                'jd_id': record['jd_id'],
+                'title': record['title'],
+                'skills': len(record['parsed'].get('skills') or []),
+                'created_at': record['created_at'],
+                'updated_at': record['updated_at']
+            }
+            for record in reversed(records)
+        ]
@@ -0,0 +1,355 @@
+import asyncio
+import importlib.util
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+from caching import LLMResponseCache
+
+load_dotenv()  # Optional: only if using .env
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_URL = "https://api.groq.com/openai/v1/chat/completions"
+DEFAULT_MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class LLMError(Exception):
+    def __init__(self, message: str, status_code: Optional[int] = None, body: str = ""):
+        super().__init__(message)
+        self.status_code = status_code
+        self.body = body
+
+
+class RateLimitError(LLMError):
+    def __init__(self, message: str, retry_after: Optional[float] = None, body: str = ""):
+        super().__init__(message, status_code=429, body=body)
+        self.retry_after = retry_after
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class LLMClient:
+    """Chat-completions client shared by the resume, JD and scoring modules.
+
+    One pooled keep-alive connection set per mode (sync and async), optional
+    HTTP/2 (on by default when the h2 package is installed), retries with
+    jittered exponential backoff on 429/5xx and transport errors, and
+    per-call latency statistics. Model, endpoint and key come from the
+    arguments or the LLM_MODEL, LLM_API_URL and GROQ_API_KEY variables.
+
+    With a response cache, calls that pass a prompt_version are answered from
+    the cache when the same model, parameters and messages were sent before.
+    use_cache=False skips the lookup but stores the fresh response (a refresh);
+    cache_bypass turns the cache off entirely.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: Optional[str] = None,
+        model: Optional[str] = None,
+        timeout: float = 60.0,
+        connect_timeout: float = 10.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        max_connections: int = 32,
+        http2: Optional[bool] = None,
+        cache: Optional[LLMResponseCache] = None,
+        cache_bypass: bool = False
+    ):
+        self.api_key = api_key or os.getenv("GROQ_API_KEY")
+        if not self.api_key:
+            raise ValueError("Missing GROQ_API_KEY in environment variables")
+        self.api_url = api_url or os.getenv("LLM_API_URL") or DEFAULT_API_URL
+        self.model = model or os.getenv("LLM_MODEL") or DEFAULT_MODEL
+        self.headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=60.0
+        )
+        self.http2 = importlib.util.find_spec("h2") is not None if http2 is None else http2
+        self.cache = cache
+        self.cache_bypass = cache_bypass
+
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop = None
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=1000)
+        self._counts = {"calls": 0, "errors": 0, "retries": 0}
+
+    # --- connection pools ---
+
+    def _sync_client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(http2=self.http2, limits=self.limits, timeout=self.timeout)
+            return self._client
+
+    async def _get_async_client(self) -> httpx.AsyncClient:
+        # An AsyncClient is bound to the event loop it was first used in
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            old_client, old_loop = self._async_client, self._async_loop
+            self._async_client = httpx.AsyncClient(http2=self.http2, limits=self.limits, timeout=self.timeout)
+            self._async_loop = loop
+            if old_client is not None:
+                await self._close_async_client(old_client, old_loop)
+        return self._async_client
+
+    @staticmethod
+    async def _close_async_client(client: httpx.AsyncClient, loop):
+        """Close a client left over from another event loop, on that loop when it still runs"""
+        try:
+            if loop is not None and loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            else:
+                await client.aclose()
+        except Exception as e:
+            logger.debug("Could not close AsyncClient from a previous event loop: %s", e)
+
+    def close(self):
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self):
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+
+    # --- request helpers ---
+
+    def build_body(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.2,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, str]] = None,
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        body = {"model": model or self.model, "messages": messages, "temperature": temperature}
+        if max_tokens is not None:
+            body["max_tokens"] = max_tokens
+        if response_format is not None:
+            body["response_format"] = response_format
+        return body
+
+    def _timeout(self, timeout: Optional[float]):
+        return httpx.Timeout(timeout, connect=self.timeout.connect) if timeout else self.timeout
+
+    def _backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        return max(delay, retry_after or 0.0)
+
+    def _check(self, response: httpx.Response):
+        if response.status_code == 429:
+            raise RateLimitError(
+                f"LLM API rate limited: {response.text}", retry_after=_retry_after(response), body=response.text
+            )
+        if response.status_code != 200:
+            raise LLMError(
+                f"LLM API error {response.status_code}: {response.text}",
+                status_code=response.status_code,
+                body=response.text
+            )
+
+    def _should_retry(self, error: Exception, retry_rate_limit: bool = True) -> bool:
+        if isinstance(error, (httpx.TransportError, httpx.TimeoutException)):
+            return True
+        if isinstance(error, RateLimitError):
+            return retry_rate_limit
+        return isinstance(error, LLMError) and error.status_code in RETRY_STATUS_CODES
+
+    def _record(self, started: float, attempts: int, failed: bool):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._counts["calls"] += 1
+            self._counts["retries"] += attempts - 1
+            if failed:
+                self._counts["errors"] += 1
+            self._latencies.append(elapsed_ms)
+        logger.info("LLM call %s in %.0f ms (%d attempt%s)",
+                    "failed" if failed else "ok", elapsed_ms, attempts, "" if attempts == 1 else "s")
+
+    def _cache_key(self, body: Dict[str, Any], prompt_version: Optional[str]) -> Optional[str]:
+        if self.cache is None or prompt_version is None or self.cache_bypass:
+            return None
+        params = {k: v for k, v in body.items() if k not in ("model", "temperature", "messages")}
+        return LLMResponseCache.key(body["model"], body["temperature"], body["messages"], prompt_version, **params)
+
+    def evict_cached(self, messages: List[Dict[str, str]], prompt_version: str, **kwargs):
+        """Drop a cached response, e.g. one the caller could not parse"""
+        key = self._cache_key(self.build_body(messages, **kwargs), prompt_version)
+        if key:
+            self.cache.delete(key)
+
+    # --- public API ---
+
+    def cached_chat(self, messages: List[Dict[str, str]], prompt_version: str, **kwargs) -> Optional[str]:
+        """Content of the cached response to this request, or None; never calls the API.
+
+        Lets a scheduler answer cache hits without charging them to its budgets.
+        """
+        key = self._cache_key(self.build_body(messages, **kwargs), prompt_version)
+        data = self.cache.get(key) if key else None
+        return data["choices"][0]["message"]["content"] if data is not None else None
+
+    def complete(
+        self,
+        messages: List[Dict[str, str]],
+        retry: bool = True,
+        timeout: Optional[float] = None,
+        prompt_version: Optional[str] = None,
+        use_cache: bool = True,
+        retry_rate_limit: bool = True,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """POST a chat completion and return the decoded response JSON.
+
+        Extra keyword arguments (temperature, max_tokens, response_format,
+        model) go to build_body. With retry_rate_limit=False a 429 is raised
+        as RateLimitError right away so a scheduler can handle it.
+        """
+        body = self.build_body(messages, **kwargs)
+        key = self._cache_key(body, prompt_version)
+        if key and use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        client = self._sync_client()
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = client.post(self.api_url, headers=self.headers, json=body, timeout=self._timeout(timeout))
+                self._check(response)
+                data = response.json()
+                self._record(started, attempt, failed=False)
+                if key:
+                    self.cache.put(key, data)
+                return data
+            except Exception as e:
+                if not retry or attempt > self.max_retries or not self._should_retry(e, retry_rate_limit):
+                    self._record(started, attempt, failed=True)
+                    raise
+                time.sleep(self._backoff(attempt - 1, getattr(e, "retry_after", None)))
+
+    async def acomplete(
+        self,
+        messages: List[Dict[str, str]],
+        retry: bool = True,
+        timeout: Optional[float] = None,
+        prompt_version: Optional[str] = None,
+        use_cache: bool = True,
+        retry_rate_limit: bool = True,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Async version of complete"""
+        body = self.build_body(messages, **kwargs)
+        key = self._cache_key(body, prompt_version)
+        if key and use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        client = await self._get_async_client()
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await client.post(
+                    self.api_url, headers=self.headers, json=body, timeout=self._timeout(timeout)
+                )
+                self._check(response)
+                data = response.json()
+                self._record(started, attempt, failed=False)
+                if key:
+                    self.cache.put(key, data)
+                return data
+            except Exception as e:
+                if not retry or attempt > self.max_retries or not self._should_retry(e, retry_rate_limit):
+                    self._record(started, attempt, failed=True)
+                    raise
+                await asyncio.sleep(self._backoff(attempt - 1, getattr(e, "retry_after", None)))
+
+    def chat(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        """Return the assistant message content of a chat completion"""
+        return self.complete(messages, **kwargs)["choices"][0]["message"]["content"]
+
+    async def achat(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        return (await self.acomplete(messages, **kwargs))["choices"][0]["message"]["content"]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            recent = list(self._latencies)
+            counts = dict(self._counts)
+        if self.cache is not None:
+            counts["cache"] = self.cache.stats()
+        latencies = sorted(recent)
+        if latencies:
+            counts.update(
+                avg_ms=round(sum(latencies) / len(latencies), 1),
+                p50_ms=round(latencies[len(latencies) // 2], 1),
+                p95_ms=round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1),
+                last_ms=round(recent[-1], 1)
+            )
+        return counts
+
+
+_shared_client: Optional[LLMClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_llm_client() -> LLMClient:
+    """Process-wide LLMClient, created on first use from the environment.
+
+    The response cache is configured with LLM_CACHE_ITEMS (0 disables it),
+    LLM_CACHE_DIR (on-disk tier), LLM_CACHE_MAX_MB, LLM_CACHE_TTL (seconds)
+    and LLM_CACHE_BYPASS.
+    """
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            max_items = int(os.getenv("LLM_CACHE_ITEMS", "1024"))
+            cache = LLMResponseCache(
+                max_items=max_items,
+                disk_dir=os.getenv("LLM_CACHE_DIR") or None,
+                max_disk_bytes=int(os.getenv("LLM_CACHE_MAX_MB", "256")) * 1024 * 1024,
+                ttl=float(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600))) or None
+            ) if max_items > 0 else None
+            _shared_client = LLMClient(
+                cache=cache,
+                cache_bypass=os.getenv("LLM_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+            )
+        return _shared_client
@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+import httpx
+
+from llm_client import LLMError, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+TRANSIENT_STATUS_CODES = {500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Refills `rate_per_minute` units per minute up to `capacity`"""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float):
+        # Requests larger than the bucket wait for a full bucket instead of forever
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+class LLMScheduler:
+    """Runs LLM jobs within requests-per-minute and tokens-per-minute budgets.
+
+    In-flight concurrency adapts AIMD-style: it grows by about one slot per
+    window of successful calls and halves on every 429. A 429 also pauses all
+    new calls for its Retry-After (or `rate_limit_pause` seconds). Jobs that
+    hit a 429 or a transient error are requeued behind waiting jobs, up to
+    `max_attempts` tries, instead of being dropped. When `latency_target` is
+    set, concurrency also backs off while the average call latency is above it.
+
+    One scheduler is meant to be shared by every batch in the process, since
+    the provider's limits are per API key.
+    """
+
+    def __init__(
+        self,
+        rpm: float = 30,
+        tpm: float = 30000,
+        initial_concurrency: int = 4,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        max_attempts: int = 5,
+        rate_limit_pause: float = 2.0,
+        latency_target: Optional[float] = None
+    ):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.limit = float(max(min_concurrency, min(initial_concurrency, max_concurrency)))
+        self.max_attempts = max_attempts
+        self.rate_limit_pause = rate_limit_pause
+        self.latency_target = latency_target
+
+        self._in_flight = 0
+        self._resume_at = 0.0
+        self._latency_ewma: Optional[float] = None
+        self._condition: Optional[asyncio.Condition] = None
+        self._counts = {"completed": 0, "failed": 0, "rate_limited": 0, "requeued": 0}
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def _acquire(self, tokens: int):
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            while (pause := self._resume_at - time.monotonic()) > 0:
+                await asyncio.sleep(pause)
+            await self.requests.acquire(1)
+            await self.tokens.acquire(tokens)
+        except BaseException:
+            await self._release()
+            raise
+
+    async def _release(self):
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight -= 1
+            condition.notify_all()
+
+    def _on_success(self, latency: float):
+        self._counts["completed"] += 1
+        self._latency_ewma = latency if self._latency_ewma is None else 0.8 * self._latency_ewma + 0.2 * latency
+        if self.latency_target is not None and self._latency_ewma > self.latency_target:
+            self.limit = max(self.min_concurrency, self.limit - 1 / self.limit)
+        else:
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+
+    def _on_rate_limited(self, retry_after: Optional[float]):
+        self._counts["rate_limited"] += 1
+        self.limit = max(self.min_concurrency, self.limit / 2)
+        pause = retry_after if retry_after is not None else self.rate_limit_pause
+        self._resume_at = max(self._resume_at, time.monotonic() + pause)
+        logger.warning("LLM rate limited; concurrency now %d, pausing %.1fs", int(self.limit), pause)
+
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        if isinstance(error, (httpx.TransportError, httpx.TimeoutException)):
+            return True
+        return isinstance(error, LLMError) and error.status_code in TRANSIENT_STATUS_CODES
+
+    async def submit(self, job: Callable[[], Awaitable[T]], tokens: int = 0) -> T:
+        """Run one job under the budgets, requeueing it on 429s and transient errors"""
+        attempt = 0
+        while True:
+            attempt += 1
+            await self._acquire(tokens)
+            started = time.monotonic()
+            backoff = None
+            try:
+                result = await job()
+            except RateLimitError as e:
+                self._on_rate_limited(e.retry_after)
+                if attempt >= self.max_attempts:
+                    self._counts["failed"] += 1
+                    raise
+                self._counts["requeued"] += 1
+                continue
+            except Exception as e:
+                if not self._is_transient(e) or attempt >= self.max_attempts:
+                    self._counts["failed"] += 1
+                    raise
+                self._counts["requeued"] += 1
+                backoff = min(self.rate_limit_pause * attempt, 30.0)
+            finally:
+                await self._release()
+            if backoff is not None:
+                await asyncio.sleep(backoff)
+                continue
+            self._on_success(time.monotonic() - started)
+            return result
+
+    async def run_batch(
+        self,
+        jobs: List[Callable[[], Awaitable[T]]],
+        tokens: Optional[List[int]] = None
+    ) -> List[Union[T, Exception]]:
+        """Submit all jobs; results (or the final exception) come back in input order"""
+        tokens = tokens or [0] * len(jobs)
+        return await asyncio.gather(
+            *(self.submit(job, n) for job, n in zip(jobs, tokens)),
+            return_exceptions=True
+        )
+
+    async def iter_completed(
+        self,
+        jobs: List[Callable[[], Awaitable[T]]],
+        tokens: Optional[List[int]] = None
+    ) -> AsyncIterator[Tuple[int, Union[T, Exception]]]:
+        """Submit all jobs; yield (index, result or final exception) as each one finishes"""
+        tokens = tokens or [0] * len(jobs)
+
+        async def indexed(index: int, job, n: int):
+            try:
+                return index, await self.submit(job, n)
+            except Exception as e:
+                return index, e
+
+        tasks = [asyncio.ensure_future(indexed(i, job, n)) for i, (job, n) in enumerate(zip(jobs, tokens))]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer went away (e.g. the client disconnected): stop the remaining calls
+            for task in tasks:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(
+            self._counts,
+            concurrency=int(self.limit),
+            in_flight=self._in_flight,
+            latency_ewma_ms=round(self._latency_ewma * 1000, 1) if self._latency_ewma is not None else None
+        )
+
+
+_shared_scheduler: Optional[LLMScheduler] = None
+_shared_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Process-wide LLMScheduler, created on first use from the environment.
+
+    Budgets come from LLM_RPM and LLM_TPM, concurrency bounds from
+    LLM_CONCURRENCY and LLM_MAX_CONCURRENCY, and LLM_LATENCY_TARGET (seconds)
+    optionally caps concurrency by latency.
+    """
+    global _shared_scheduler
+    with _shared_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = LLMScheduler(
+                rpm=float(os.getenv("LLM_RPM", "30")),
+                tpm=float(os.getenv("LLM_TPM", "30000")),
+                initial_concurrency=int(os.getenv("LLM_CONCURRENCY", "4")),
+                max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "32")),
+                latency_target=float(os.getenv("LLM_LATENCY_TARGET", "0")) or None
+            )
+        return _shared_scheduler
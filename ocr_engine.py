@@ -0,0 +1,167 @@
+import logging
+import os
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pytesseract
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+class OcrBackend:
+    """Base OCR backend: preprocesses images and returns their text in input order.
+
+    Subclasses implement _recognize for the images that survive preprocessing.
+    Blank images are skipped and come back as ''.
+    """
+
+    def __init__(self, lang: str = "eng", max_side: int = 2500, blank_ink_ratio: float = 0.002):
+        self.lang = lang
+        # Phone photos are often 4000px+; Tesseract gains nothing beyond ~300 DPI A4
+        self.max_side = max_side
+        # Share of dark pixels below which a page is treated as blank
+        self.blank_ink_ratio = blank_ink_ratio
+
+    def preprocess(self, image: Image.Image) -> Optional[Image.Image]:
+        """Grayscale and downscale an image; None if it is blank"""
+        gray = image if image.mode == "L" else image.convert("L")
+        width, height = gray.size
+        longest = max(width, height)
+        if longest > self.max_side:
+            scale = self.max_side / longest
+            gray = gray.resize((max(1, round(width * scale)), max(1, round(height * scale))), Image.LANCZOS)
+        histogram = gray.histogram()
+        dark = sum(histogram[:128])
+        if dark <= self.blank_ink_ratio * sum(histogram):
+            return None
+        return gray
+
+    def recognize(self, images: List[Image.Image]) -> List[str]:
+        texts, _ = self.recognize_timed(images)
+        return texts
+
+    def recognize_timed(self, images: List[Image.Image]) -> Tuple[List[str], List[Dict]]:
+        """Return texts plus per-image timings in milliseconds.
+
+        Each timing dict has preprocess_ms, ocr_ms and skipped. Backends that OCR
+        a batch in one call report the batch time split evenly across its images.
+        """
+        texts = [''] * len(images)
+        timings = []
+        prepared = []
+        for i, image in enumerate(images):
+            start = time.perf_counter()
+            processed = self.preprocess(image)
+            timings.append({
+                'preprocess_ms': (time.perf_counter() - start) * 1000,
+                'ocr_ms': 0.0,
+                'skipped': processed is None
+            })
+            if processed is not None:
+                prepared.append((i, processed))
+
+        if prepared:
+            results = self._recognize([image for _, image in prepared])
+            for (i, _), (text, ocr_ms) in zip(prepared, results):
+                texts[i] = text
+                timings[i]['ocr_ms'] = ocr_ms
+
+        logger.debug(
+            "%s OCRed %d/%d images in %.1f ms",
+            type(self).__name__, len(prepared), len(images), sum(t['ocr_ms'] for t in timings)
+        )
+        return texts, timings
+
+    def _recognize(self, images: List[Image.Image]) -> List[Tuple[str, float]]:
+        raise NotImplementedError
+
+
+class TesseractOcr(OcrBackend):
+    """One pytesseract call (one Tesseract process) per image, run in a bounded thread pool"""
+
+    def __init__(self, workers: int = 4, **kwargs):
+        super().__init__(**kwargs)
+        self.workers = workers
+
+    def _recognize_one(self, image: Image.Image) -> Tuple[str, float]:
+        start = time.perf_counter()
+        text = pytesseract.image_to_string(image, lang=self.lang)
+        return text, (time.perf_counter() - start) * 1000
+
+    def _recognize(self, images: List[Image.Image]) -> List[Tuple[str, float]]:
+        if len(images) == 1 or self.workers <= 1:
+            return [self._recognize_one(image) for image in images]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(images))) as executor:
+            return list(executor.map(self._recognize_one, images))
+
+
+class BatchTesseractOcr(OcrBackend):
+    """Many images per Tesseract process via an image list file.
+
+    Tesseract loads its language data once per invocation and separates the
+    pages of a multi-image run with a form feed, so a batch costs one process
+    start instead of one per image. Large batches are split into up to
+    `workers` chunks that run in parallel, each pinned to one OpenMP thread.
+    Falls back to per-image OCR when a batch's output cannot be split cleanly.
+    """
+
+    def __init__(self, workers: int = 2, max_batch: int = 64, timeout: Optional[float] = 300, **kwargs):
+        super().__init__(**kwargs)
+        self.workers = workers
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self._fallback = TesseractOcr(workers=workers, **kwargs)
+
+    def _run_batch(self, images: List[Image.Image]) -> List[Tuple[str, float]]:
+        start = time.perf_counter()
+        with tempfile.TemporaryDirectory(prefix="ocr_batch_") as tmp:
+            tmp_dir = Path(tmp)
+            image_paths = []
+            for i, image in enumerate(images):
+                path = tmp_dir / f"{i:05d}.png"
+                image.save(path, format="PNG")
+                image_paths.append(str(path))
+            list_file = tmp_dir / "images.txt"
+            list_file.write_text("\n".join(image_paths) + "\n", encoding="utf-8")
+
+            env = dict(os.environ, OMP_THREAD_LIMIT="1") if self.workers > 1 else None
+            completed = subprocess.run(
+                [pytesseract.pytesseract.tesseract_cmd, str(list_file), "stdout", "-l", self.lang],
+                capture_output=True,
+                timeout=self.timeout,
+                env=env
+            )
+        if completed.returncode != 0:
+            raise RuntimeError(f"Tesseract failed: {completed.stderr.decode(errors='replace').strip()}")
+
+        pages = completed.stdout.decode("utf-8", errors="replace").split("\f")
+        if pages and not pages[-1].strip():
+            pages.pop()
+        if len(pages) != len(images):
+            raise ValueError(f"Tesseract returned {len(pages)} pages for {len(images)} images")
+
+        per_image_ms = (time.perf_counter() - start) * 1000 / len(images)
+        return [(page.strip("\n"), per_image_ms) for page in pages]
+
+    def _recognize_chunk(self, images: List[Image.Image]) -> List[Tuple[str, float]]:
+        if len(images) == 1:
+            return self._fallback._recognize(images)
+        try:
+            return self._run_batch(images)
+        except (OSError, RuntimeError, ValueError, subprocess.TimeoutExpired) as e:
+            logger.warning("Batched OCR failed (%s); falling back to per-image OCR", e)
+            return self._fallback._recognize(images)
+
+    def _recognize(self, images: List[Image.Image]) -> List[Tuple[str, float]]:
+        n_chunks = max(min(self.workers, len(images)), -(-len(images) // self.max_batch))
+        size = -(-len(images) // n_chunks)
+        chunks = [images[i:i + size] for i in range(0, len(images), size)]
+        if len(chunks) == 1:
+            return self._recognize_chunk(chunks[0])
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(chunks))) as executor:
+            return [result for chunk in executor.map(self._recognize_chunk, chunks) for result in chunk]
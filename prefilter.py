@@ -0,0 +1,129 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from skill_taxonomy import SkillScanner, tokenize
+
+# Common words in JD responsibilities that say nothing about fit
+STOPWORDS = frozenset("""
+a an and are as at be by for from in into is it of on or our the to with will you your we
+work working ability able strong good excellent experience years year team teams using use
+""".split())
+
+
+class BM25Prefilter:
+    """Cheap local ranking of resumes against a parsed JD, used to shortlist
+    candidates before LLM scoring.
+
+    The query is the JD's skills (weighted by `skill_weight`) and
+    responsibilities; documents are the terms of all resume sections. Taxonomy
+    skills are also indexed as one term per canonical name, so "K8s" in a
+    resume matches "Kubernetes" in the JD; as in SkillExtractor.scan_skills,
+    ambiguous aliases ("React", "Spark") only count inside `skill_sections`.
+    Only the query terms are counted, so scoring is one candidates x
+    query-terms array operation whatever the vocabulary size.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.5,
+        b: float = 0.75,
+        skill_weight: float = 2.0,
+        scanner: Optional[SkillScanner] = None,
+        skill_sections: Iterable[str] = ()
+    ):
+        self.k1 = k1
+        self.b = b
+        self.skill_weight = skill_weight
+        self.scanner = scanner or SkillScanner()
+        self.skill_sections = {name.upper() for name in skill_sections}
+
+    def terms(self, text: str, allow_ambiguous: bool = False) -> List[str]:
+        """Word tokens of text plus a "skill:<canonical>" term per taxonomy skill found"""
+        skills = self.scanner.find(text, allow_ambiguous=allow_ambiguous)
+        return tokenize(text) + [f"skill:{canonical}" for _, _, canonical in skills]
+
+    def document_terms(self, sections: Mapping[str, str]) -> List[str]:
+        """Terms of all sections of one resume, each section tokenized on its own"""
+        terms = []
+        for name, text in (sections or {}).items():
+            if isinstance(text, str) and text:
+                terms.extend(self.terms(text, allow_ambiguous=str(name).upper() in self.skill_sections))
+        return terms
+
+    @staticmethod
+    def _as_list(value: Any) -> List[str]:
+        if isinstance(value, str):
+            return [value]
+        return [str(item) for item in value or []]
+
+    def query_terms(self, parsed_jd: Mapping[str, Any]) -> Counter:
+        """Query term -> weight"""
+        terms = Counter()
+        for skill in self._as_list(parsed_jd.get("skills")):
+            # A known skill is queried by its canonical term and, at half weight, by its
+            # words, so a resume the taxonomy misses can still match; anything else by its words
+            canonical = [f"skill:{name}" for _, _, name in self.scanner.find(skill, allow_ambiguous=True)]
+            for token in canonical:
+                terms[token] += self.skill_weight
+            for token in tokenize(skill):
+                if token not in STOPWORDS:
+                    terms[token] += self.skill_weight / 2 if canonical else self.skill_weight
+        for line in self._as_list(parsed_jd.get("responsibilities")):
+            for token in tokenize(line):
+                if token not in STOPWORDS and len(token) > 1:
+                    terms[token] += 1.0
+        return terms
+
+    def score(self, documents: Sequence[Sequence[str]], query: Mapping[str, float]) -> np.ndarray:
+        """BM25 score of each document (a list of terms) for the weighted query"""
+        terms = list(query)
+        if not documents or not terms:
+            return np.zeros(len(documents))
+        column = {term: j for j, term in enumerate(terms)}
+        tf = np.zeros((len(documents), len(terms)))
+        lengths = np.zeros(len(documents))
+        for i, tokens in enumerate(documents):
+            lengths[i] = len(tokens)
+            for token, count in Counter(tokens).items():
+                j = column.get(token)
+                if j is not None:
+                    tf[i, j] = count
+        n = len(documents)
+        df = (tf > 0).sum(axis=0)
+        idf = np.log(1 + (n - df + 0.5) / (df + 0.5))
+        average = lengths.mean() or 1.0
+        norm = self.k1 * (1 - self.b + self.b * lengths / average)
+        weights = np.asarray([query[term] for term in terms])
+        return (tf * (self.k1 + 1) / (tf + norm[:, None]) * idf * weights).sum(axis=1)
+
+    def rank(self, sections: Sequence[Mapping[str, str]], parsed_jd: Mapping[str, Any]) -> List[Dict[str, Any]]:
+        """Prefilter score and 1-based rank per resume, in input order.
+
+        When nothing scores above zero (an empty query, e.g. a failed JD parse,
+        or no resume matching any term) the ranks are None: there is nothing
+        to shortlist by.
+        """
+        return self.rank_documents([self.document_terms(s) for s in sections], parsed_jd)
+
+    def rank_documents(self, documents: Sequence[Sequence[str]], parsed_jd: Mapping[str, Any]) -> List[Dict[str, Any]]:
+        """rank() for resumes already turned into terms by document_terms, e.g. to rank them for several JDs"""
+        scores = self.score(documents, self.query_terms(parsed_jd))
+        if not (scores > 0).any():
+            return [{"prefilter_score": 0.0, "prefilter_rank": None} for _ in scores]
+        order = np.argsort(-scores, kind="stable")
+        ranks = np.empty(len(scores), dtype=np.int64)
+        ranks[order] = np.arange(1, len(scores) + 1)
+        return [
+            {"prefilter_score": round(float(score), 3), "prefilter_rank": int(rank)}
+            for score, rank in zip(scores, ranks)
+        ]
+
+    @staticmethod
+    def shortlist(ranking: Sequence[Mapping[str, Any]], size: int) -> List[int]:
+        """Indices (in input order) of the `size` best-ranked resumes; all of them if size <= 0 or unranked"""
+        return [
+            i for i, entry in enumerate(ranking)
+            if size <= 0 or entry["prefilter_rank"] is None or entry["prefilter_rank"] <= size
+        ]
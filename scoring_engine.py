@@ -0,0 +1,96 @@
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Weight of each component in the final score; weights are normalised to sum to 1
+DEFAULT_WEIGHTS = {"experience": 0.35, "skills": 0.45, "education": 0.10, "projects": 0.10}
+
+# Field of a scored entry (0-100) holding each weighted component
+COMPONENT_FIELDS = {
+    "experience": "experience_score",
+    "skills": "skills_score",
+    "education": "education_score",
+    "projects": "project_score",
+}
+DOMAIN_FIELD = "domain_match_score"
+
+
+def normalize_weights(weights: Optional[Mapping[str, float]] = None) -> Dict[str, float]:
+    """Weights merged over DEFAULT_WEIGHTS and scaled to sum to 1.
+
+    Raises ValueError for unknown components, negative or non-numeric weights,
+    or weights that are all zero.
+    """
+    merged = dict(DEFAULT_WEIGHTS)
+    for name, value in (weights or {}).items():
+        if name not in COMPONENT_FIELDS:
+            raise ValueError(f"Unknown score component {name!r}; expected one of {', '.join(COMPONENT_FIELDS)}")
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not np.isfinite(value) or value < 0:
+            raise ValueError(f"Weight for {name!r} must be a non-negative number")
+        merged[name] = float(value)
+    total = sum(merged.values())
+    if total <= 0:
+        raise ValueError("At least one weight must be positive")
+    return {name: round(value / total, 6) for name, value in merged.items()}
+
+
+class WeightedScorer:
+    """Final and domain-adjusted scores for a batch of scored candidates.
+
+    The LLM only returns component scores; the weighted sum is done here as
+    one matrix-vector product, so re-weighting a batch needs no LLM call.
+    Entries with an "error" (or no numeric components) get NaN.
+    """
+
+    def __init__(self, weights: Optional[Mapping[str, float]] = None, apply_domain_match: bool = True):
+        self.weights = normalize_weights(weights)
+        self.apply_domain_match = apply_domain_match
+
+    def component_matrix(self, entries: Sequence[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """(candidates x components, domain) arrays on a 0-100 scale, NaN where unavailable"""
+        components = np.full((len(entries), len(COMPONENT_FIELDS)), np.nan)
+        domain = np.full(len(entries), np.nan)
+        for i, entry in enumerate(entries):
+            if "error" in entry:
+                continue
+            for j, field in enumerate(COMPONENT_FIELDS.values()):
+                value = entry.get(field)
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    components[i, j] = value
+            value = entry.get(DOMAIN_FIELD)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                domain[i] = value
+        return components, domain
+
+    def score(
+        self,
+        entries: Sequence[Dict[str, Any]],
+        weights: Optional[Mapping[str, float]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(final, adjusted) score arrays (0-100) for entries.
+
+        A missing component counts as 0; an entry with no components at all
+        scores NaN. Without a domain score the adjusted score equals the final one.
+        """
+        weights = normalize_weights(weights) if weights is not None else self.weights
+        components, domain = self.component_matrix(entries)
+        vector = np.asarray([weights[name] for name in COMPONENT_FIELDS])
+        scored = ~np.isnan(components).all(axis=1)
+        final = np.where(scored, np.nan_to_num(components) @ vector, np.nan)
+        if not self.apply_domain_match:
+            return final, final.copy()
+        adjusted = final * np.where(np.isnan(domain), 100.0, domain) / 100
+        return final, adjusted
+
+    def apply(
+        self,
+        entries: List[Dict[str, Any]],
+        weights: Optional[Mapping[str, float]] = None
+    ) -> List[Dict[str, Any]]:
+        """Set final_score and match_percent on each entry in place ("NaN" when unscored)"""
+        final, adjusted = self.score(entries, weights)
+        for entry, final_score, adjusted_score in zip(entries, final, adjusted):
+            scored = not np.isnan(adjusted_score)
+            entry["final_score"] = round(float(final_score), 2) if scored else "NaN"
+            entry["match_percent"] = round(float(adjusted_score), 2) if scored else "NaN"
+        return entries
@@ -0,0 +1,145 @@
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from skill_taxonomy import SkillScanner, tokenize
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+class SkillMatcher:
+    """Batch skill matching between one JD and many candidates, without the LLM.
+
+    Every distinct skill string is mapped to its taxonomy canonical name when
+    it is exactly one known alias ("K8s" -> "kubernetes"), then turned into an
+    L2-normalised TF-IDF vector of padded character n-grams. One sparse
+    product gives the similarity of every candidate skill to every JD skill;
+    a segmented max over each candidate's rows gives the candidates x JD-skills
+    matrix. JD skills whose best similarity reaches `threshold` are matched.
+    """
+
+    def __init__(
+        self,
+        ngram_range: Tuple[int, int] = (2, 4),
+        threshold: float = 0.6,
+        scanner: Optional[SkillScanner] = None
+    ):
+        self.ngram_range = ngram_range
+        self.threshold = threshold
+        self.scanner = scanner or SkillScanner()
+
+    def normalize(self, skill: str) -> str:
+        text = WHITESPACE_RE.sub(' ', str(skill).lower()).strip()
+        matches = self.scanner.find(text, allow_ambiguous=True)
+        if len(matches) == 1 and matches[0][0] == 0 and matches[0][1] == len(tokenize(text)):
+            return matches[0][2]
+        return text
+
+    def _ngrams(self, text: str) -> Counter:
+        padded = f" {text} "
+        low, high = self.ngram_range
+        return Counter(
+            padded[i:i + n]
+            for n in range(low, high + 1)
+            for i in range(max(1, len(padded) - n + 1))
+        )
+
+    def vectorize(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        """Rows of L2-normalised TF-IDF char n-gram vectors (IDF over `texts`)"""
+        vocabulary: Dict[str, int] = {}
+        indices, data, indptr = [], [], [0]
+        for text in texts:
+            for gram, count in self._ngrams(text).items():
+                indices.append(vocabulary.setdefault(gram, len(vocabulary)))
+                data.append(count)
+            indptr.append(len(indices))
+        matrix = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int64), np.asarray(indptr)),
+            shape=(len(texts), len(vocabulary))
+        )
+        document_frequency = np.bincount(matrix.indices, minlength=len(vocabulary))
+        idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1.0
+        matrix = matrix @ sparse.diags(idf)
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix)
+
+    def similarity_matrix(
+        self,
+        jd_skills: Sequence[str],
+        candidate_skills: Sequence[Sequence[str]]
+    ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """Best similarity of each candidate to each JD skill.
+
+        Returns (similarity, best, distinct): candidates x JD-skills arrays of
+        the best cosine similarity and the index into `distinct` (the
+        normalised skill strings) of the candidate skill that achieved it
+        (-1 for candidates without skills).
+        """
+        position: Dict[str, int] = {}
+        distinct: List[str] = []
+
+        def index_of(skill: str) -> int:
+            key = self.normalize(skill)
+            if key not in position:
+                position[key] = len(distinct)
+                distinct.append(key)
+            return position[key]
+
+        jd_rows = np.asarray([index_of(s) for s in jd_skills], dtype=np.int64)
+        candidate_rows = [[index_of(s) for s in skills if str(s).strip()] for skills in candidate_skills]
+        n_candidates, n_jd = len(candidate_rows), len(jd_rows)
+        similarity = np.zeros((n_candidates, n_jd))
+        best = np.full((n_candidates, n_jd), -1, dtype=np.int64)
+        flat = np.asarray([row for rows in candidate_rows for row in rows], dtype=np.int64)
+        if not n_jd or not len(flat):
+            return similarity, best, distinct
+
+        vectors = self.vectorize(distinct)
+        # All candidate skills against all JD skills in one sparse product
+        pair_scores = (vectors[flat] @ vectors[jd_rows].T).toarray()
+
+        lengths = np.asarray([len(rows) for rows in candidate_rows])
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        has_skills = lengths > 0
+        similarity[has_skills] = np.maximum.reduceat(pair_scores, offsets[has_skills], axis=0)
+
+        # Row of the best candidate skill per (candidate, JD skill): first row reaching the segment max
+        owner = np.repeat(np.arange(n_candidates), lengths)
+        is_best = np.isclose(pair_scores, similarity[owner])
+        for j in range(n_jd):
+            rows = np.flatnonzero(is_best[:, j])
+            candidates, first = np.unique(owner[rows], return_index=True)
+            best[candidates, j] = flat[rows[first]]
+        return similarity, best, distinct
+
+    def match_batch(
+        self,
+        jd_skills: Sequence[str],
+        candidate_skills: Sequence[Sequence[str]]
+    ) -> List[Dict]:
+        """Matched and missing JD skills and a 0-1 skills score per candidate.
+
+        The score is the mean over JD skills of the best similarity, counting
+        skills below the threshold as 0.
+        """
+        jd_skills = [str(s).strip() for s in jd_skills if str(s).strip()]
+        similarity, best, distinct = self.similarity_matrix(jd_skills, candidate_skills)
+        matched_mask = similarity >= self.threshold
+        scores = np.where(matched_mask, similarity, 0.0).mean(axis=1) if jd_skills else np.zeros(len(candidate_skills))
+
+        results = []
+        for i in range(len(candidate_skills)):
+            matched = [
+                {"skill": jd_skills[j], "matched_by": distinct[best[i, j]], "similarity": round(float(similarity[i, j]), 3)}
+                for j in np.flatnonzero(matched_mask[i])
+            ]
+            results.append({
+                "skills_score": round(float(scores[i]), 4),
+                "matched_skills": matched,
+                "missing_skills": [jd_skills[j] for j in np.flatnonzero(~matched_mask[i])]
+            })
+        return results
@@ -0,0 +1,322 @@
+import json
+import re
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+# Canonical skill name -> aliases (the canonical name itself always matches)
+SKILL_TAXONOMY: Dict[str, List[str]] = {
+    # Languages
+    'python': ['python3', 'py'],
+    'java': ['core java', 'java8', 'java 8', 'java 11', 'java 17'],
+    'javascript': ['js', 'es6', 'ecmascript', 'vanilla js'],
+    'typescript': ['ts'],
+    'c': [],
+    'c++': ['cpp', 'cplusplus'],
+    'c#': ['csharp', 'c sharp'],
+    'go': ['golang'],
+    'rust': [],
+    'ruby': [],
+    'php': [],
+    'kotlin': [],
+    'swift': [],
+    'scala': [],
+    'r': ['r programming', 'rstudio'],
+    'matlab': [],
+    'perl': [],
+    'dart': [],
+    'bash': ['shell scripting', 'shell script', 'bash scripting', 'unix shell'],
+    'powershell': [],
+    'sql': ['structured query language'],
+    'pl/sql': ['plsql'],
+    't-sql': ['tsql'],
+    'html': ['html5'],
+    'css': ['css3'],
+    'sass': ['scss'],
+    'solidity': [],
+    'haskell': [],
+    'elixir': [],
+    'lua': [],
+    'vba': [],
+    'cobol': [],
+    'fortran': [],
+    # Frontend
+    'react': ['react.js', 'reactjs', 'react js'],
+    'react native': [],
+    'angular': ['angularjs', 'angular.js', 'angular js'],
+    'vue': ['vue.js', 'vuejs', 'vue js'],
+    'next.js': ['nextjs', 'next js'],
+    'nuxt.js': ['nuxtjs', 'nuxt'],
+    'svelte': [],
+    'redux': [],
+    'jquery': [],
+    'bootstrap': [],
+    'tailwind css': ['tailwind', 'tailwindcss'],
+    'material ui': ['mui', 'material-ui'],
+    'webpack': [],
+    'vite': [],
+    'flutter': [],
+    # Backend
+    'node.js': ['nodejs', 'node js', 'node'],
+    'express': ['express.js', 'expressjs'],
+    'nestjs': ['nest.js'],
+    'django': [],
+    'django rest framework': ['drf'],
+    'flask': [],
+    'fastapi': ['fast api'],
+    'spring': ['spring framework'],
+    'spring boot': ['springboot'],
+    'hibernate': [],
+    '.net': ['dotnet', 'dot net', '.net core', 'asp.net', 'asp.net core'],
+    'ruby on rails': ['rails', 'ror'],
+    'laravel': [],
+    'graphql': [],
+    'rest api': ['rest apis', 'restful', 'restful api', 'restful apis', 'rest', 'restful services'],
+    'grpc': [],
+    'microservices': ['microservice', 'micro services', 'microservices architecture'],
+    'celery': [],
+    'rabbitmq': ['rabbit mq'],
+    'kafka': ['apache kafka'],
+    'websockets': ['websocket', 'socket.io'],
+    # Data stores
+    'postgresql': ['postgres', 'psql'],
+    'mysql': [],
+    'sqlite': [],
+    'oracle': ['oracle db', 'oracle database'],
+    'sql server': ['mssql', 'ms sql', 'microsoft sql server'],
+    'mongodb': ['mongo', 'mongo db'],
+    'redis': [],
+    'cassandra': ['apache cassandra'],
+    'dynamodb': ['dynamo db'],
+    'elasticsearch': ['elastic search', 'elk', 'opensearch'],
+    'neo4j': [],
+    'snowflake': [],
+    'bigquery': ['big query'],
+    'redshift': ['amazon redshift'],
+    'firebase': [],
+    # Cloud and DevOps
+    'aws': ['amazon web services'],
+    'azure': ['microsoft azure'],
+    'gcp': ['google cloud', 'google cloud platform'],
+    'ec2': ['aws ec2'],
+    's3': ['aws s3', 'amazon s3'],
+    'lambda': ['aws lambda'],
+    'docker': ['dockerfile', 'docker compose', 'docker-compose'],
+    'kubernetes': ['k8s', 'kubectl', 'eks', 'aks', 'gke'],
+    'helm': [],
+    'terraform': [],
+    'ansible': [],
+    'jenkins': [],
+    'github actions': [],
+    'gitlab ci': ['gitlab ci/cd', 'gitlab-ci'],
+    'ci/cd': ['cicd', 'ci cd', 'continuous integration', 'continuous delivery', 'continuous deployment'],
+    'git': ['github', 'gitlab', 'bitbucket'],
+    'linux': ['ubuntu', 'centos', 'red hat', 'rhel', 'unix'],
+    'nginx': [],
+    'prometheus': [],
+    'grafana': [],
+    'airflow': ['apache airflow'],
+    # Data and ML
+    'machine learning': ['ml'],
+    'deep learning': ['dl'],
+    'natural language processing': ['nlp'],
+    'computer vision': ['cv', 'opencv'],
+    'data analysis': ['data analytics'],
+    'data visualization': ['data viz'],
+    'statistics': ['statistical analysis', 'statistical modeling'],
+    'pandas': [],
+    'numpy': [],
+    'scipy': [],
+    'scikit-learn': ['sklearn', 'scikit learn'],
+    'tensorflow': ['tf', 'tensor flow'],
+    'keras': [],
+    'pytorch': ['torch'],
+    'hugging face': ['huggingface', 'transformers'],
+    'llm': ['llms', 'large language models', 'large language model', 'generative ai', 'genai', 'gen ai'],
+    'langchain': [],
+    'xgboost': [],
+    'spark': ['apache spark', 'pyspark', 'spark sql'],
+    'hadoop': ['hdfs', 'mapreduce', 'hive'],
+    'databricks': [],
+    'etl': ['elt', 'data pipelines', 'data pipeline'],
+    'power bi': ['powerbi'],
+    'tableau': [],
+    'excel': ['ms excel', 'microsoft excel', 'advanced excel', 'vlookup', 'pivot tables'],
+    'matplotlib': [],
+    'seaborn': [],
+    'jupyter': ['jupyter notebook', 'jupyter notebooks'],
+    # Testing and practices
+    'unit testing': ['unit tests'],
+    'pytest': [],
+    'junit': [],
+    'selenium': [],
+    'cypress': [],
+    'jest': [],
+    'agile': ['scrum', 'kanban', 'sprint planning'],
+    'jira': [],
+    'tdd': ['test driven development', 'test-driven development'],
+    'oop': ['object oriented programming', 'object-oriented programming', 'object oriented design'],
+    'data structures': ['data structures and algorithms', 'dsa'],
+    'algorithms': [],
+    'system design': [],
+    # Mobile and other
+    'android': ['android sdk'],
+    'ios': [],
+    'unity': [],
+    'figma': [],
+    'photoshop': ['adobe photoshop'],
+    'autocad': [],
+    'salesforce': [],
+    'sap': [],
+    'blockchain': [],
+    'cybersecurity': ['cyber security', 'information security', 'infosec'],
+    # Soft skills
+    'communication': ['communication skills', 'verbal communication', 'written communication'],
+    'leadership': ['team leadership', 'team lead'],
+    'project management': ['pmp'],
+    'problem solving': ['problem-solving'],
+    'teamwork': ['team player', 'collaboration'],
+    'time management': [],
+}
+
+# Aliases that are ordinary words or single letters elsewhere ("go", "r", "rest", "node"):
+# they only count inside skill sections
+AMBIGUOUS_ALIASES: Set[str] = {
+    'c', 'r', 'go', 'swift', 'ruby', 'spring', 'express', 'node', 'rest', 'react', 'oracle', 'lambda',
+    'unity', 'dl', 'cv', 'tf', 'ts', 'torch', 'communication', 'leadership', 'collaboration', 'teamwork',
+    'helm', 'jest', 'hive', 'elt', 'transformers', 'algorithms', 'statistics', 'rails'
+}
+
+# Lowercase runs of letters/digits with trailing + or # ("c++", "c#") and a leading dot
+# (".net"). "/" and "-" split words, so "Python/Django" finds both and "ci/cd" matches as two tokens
+TOKEN_RE = re.compile(r"\.?[a-z0-9]+[+#]*")
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+class SkillScanner:
+    """Finds taxonomy skills anywhere in a resume with a token-level Aho-Corasick automaton.
+
+    Every alias is tokenized with the same tokenizer as the text, so matches
+    always start and end on word boundaries and multi-word aliases ("spring
+    boot", "google cloud platform") match across any whitespace or line
+    break. All aliases are matched in one pass over each section; where
+    matches overlap, the longest one starting earliest wins.
+    """
+
+    def __init__(
+        self,
+        taxonomy: Optional[Dict[str, List[str]]] = None,
+        ambiguous: Optional[Set[str]] = None
+    ):
+        self.taxonomy = taxonomy if taxonomy is not None else SKILL_TAXONOMY
+        self.ambiguous = ambiguous if ambiguous is not None else AMBIGUOUS_ALIASES
+        self._build()
+
+    @classmethod
+    def from_json(cls, path: Union[str, Path], extend_default: bool = True) -> "SkillScanner":
+        """Load {canonical: [aliases]} from a JSON file, optionally on top of the built-in taxonomy"""
+        with open(path, 'r', encoding='utf-8') as f:
+            extra = json.load(f)
+        taxonomy = {k: list(v) for k, v in SKILL_TAXONOMY.items()} if extend_default else {}
+        for canonical, aliases in extra.items():
+            taxonomy.setdefault(canonical.lower(), []).extend(a.lower() for a in aliases)
+        return cls(taxonomy)
+
+    def _build(self):
+        # goto[state][token] -> state; output[state] = (tokens, canonical, ambiguous) of the pattern ending there
+        self._goto: List[Dict[str, int]] = [{}]
+        self._output: List[Optional[Tuple[int, str, bool]]] = [None]
+        self._vocabulary: Set[str] = set()
+        for canonical, aliases in self.taxonomy.items():
+            for alias in [canonical, *aliases]:
+                tokens = tokenize(alias)
+                if not tokens:
+                    continue
+                state = 0
+                for token in tokens:
+                    self._vocabulary.add(token)
+                    next_state = self._goto[state].get(token)
+                    if next_state is None:
+                        next_state = len(self._goto)
+                        self._goto[state][token] = next_state
+                        self._goto.append({})
+                        self._output.append(None)
+                    state = next_state
+                if self._output[state] is None:
+                    self._output[state] = (len(tokens), canonical, alias in self.ambiguous)
+
+        # Failure links and dictionary-suffix links (nearest shorter pattern that also ends here), breadth first
+        self._fail = [0] * len(self._goto)
+        self._dict_link = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                self._dict_link[child] = target if self._output[target] is not None else self._dict_link[target]
+
+    def find(self, text: str, allow_ambiguous: bool = False) -> List[Tuple[int, int, str]]:
+        """Non-overlapping (start token, end token, canonical) matches in text order"""
+        goto, fail, output, dict_link = self._goto, self._fail, self._output, self._dict_link
+        root = goto[0]
+        vocabulary = self._vocabulary
+        candidates = []
+        state = 0
+        for position, token in enumerate(TOKEN_RE.findall(text.lower())):
+            if token[0] == '.' and token not in vocabulary:
+                # "experience.Java" or "(.Net)": only known dotted words keep their dot
+                token = token[1:]
+            if not state:
+                # Most words are not the start of any alias
+                state = root.get(token, 0)
+                if not state:
+                    continue
+            else:
+                while state and token not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(token, 0)
+            match_state = state if output[state] is not None else dict_link[state]
+            while match_state:
+                length, canonical, ambiguous = output[match_state]
+                if allow_ambiguous or not ambiguous:
+                    candidates.append((position + 1 - length, position + 1, canonical))
+                match_state = dict_link[match_state]
+
+        # Leftmost-longest selection among overlapping matches
+        candidates.sort(key=lambda m: (m[0], m[0] - m[1]))
+        matches = []
+        covered_until = 0
+        for start, end, canonical in candidates:
+            if start >= covered_until:
+                matches.append((start, end, canonical))
+                covered_until = end
+        return matches
+
+    def scan(
+        self,
+        sections: Dict[str, str],
+        skill_sections: Iterable[str] = ()
+    ) -> Dict[str, Dict[str, Union[int, List[str]]]]:
+        """Canonical skill -> {"count", "sections"} over all sections.
+
+        Ambiguous aliases only count inside `skill_sections`.
+        """
+        skill_sections = {name.upper() for name in skill_sections}
+        found: Dict[str, Dict[str, Union[int, List[str]]]] = {}
+        for section_name, text in sections.items():
+            if not isinstance(text, str) or not text:
+                continue
+            for _, _, canonical in self.find(text, allow_ambiguous=section_name.upper() in skill_sections):
+                entry = found.setdefault(canonical, {"count": 0, "sections": []})
+                entry["count"] += 1
+                if section_name not in entry["sections"]:
+                    entry["sections"].append(section_name)
+        return found
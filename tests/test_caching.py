@@ -0,0 +1,51 @@
+from caching import LLMResponseCache, ParseCache, ScoreCache, TieredCache, content_hash
+
+
+def test_memory_and_disk_tiers(tmp_path):
+    cache = TieredCache(max_items=1, disk_dir=tmp_path)
+    cache.put("a", {"text": "one"})
+    cache.put("b", {"text": "two"})  # evicts "a" from memory, not from disk
+    assert cache.get("a") == {"text": "one"}
+    assert cache.get("missing") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["disk_hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_disk_entries_survive_a_new_cache(tmp_path):
+    TieredCache(disk_dir=tmp_path).put("key", [1, 2, 3])
+    assert TieredCache(disk_dir=tmp_path).get("key") == [1, 2, 3]
+
+
+def test_parse_key_changes_with_parser_version():
+    assert ParseCache.key(b"resume", "4") != ParseCache.key(b"resume", "5")
+    assert ParseCache.key(b"resume", "5") == ParseCache.key(memoryview(b"resume"), "5")
+
+
+def test_expired_entries_are_misses(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("caching.time.time", lambda: now[0])
+    cache = TieredCache(disk_dir=tmp_path, ttl=60)
+    cache.put("key", "value")
+    now[0] += 59
+    assert cache.get("key") == "value"
+    now[0] += 2
+    assert cache.get("key") is None
+    assert cache.stats()["expired"] == 1
+    # Expired entries are dropped from disk as well
+    assert TieredCache(disk_dir=tmp_path).get("key") is None
+
+
+def test_llm_response_key_changes_with_prompt_version():
+    messages = [{"role": "user", "content": "hi"}]
+    assert LLMResponseCache.key("m", 0.0, messages, "1") != LLMResponseCache.key("m", 0.0, messages, "2")
+    assert LLMResponseCache.key("m", 0.0, messages, "1") != LLMResponseCache.key("m", 0.0, messages, "1", max_tokens=10)
+
+
+def test_content_hash_ignores_key_order():
+    assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+    assert content_hash({"a": 1}) != content_hash({"a": 2})
+
+
+def test_score_key_changes_with_prompt_fingerprint():
+    assert ScoreCache.key("r", "j", "m", "p1") != ScoreCache.key("r", "j", "m", "p2")
+    assert ScoreCache.key("r", "j", "m", "p1") != ScoreCache.key("r", "j", "other-model", "p1")
@@ -0,0 +1,62 @@
+import pytest
+
+from M4_resume_educ_extractor import ResumeEducationExtractor
+
+
+@pytest.mark.parametrize("line", [
+    "MS Office, Excel, Tableau",
+    "BE responsible for lab equipment",
+    "Boston, MA 2014",
+    "Able to be a team player",
+])
+def test_bare_abbreviation_without_degree_context_is_not_a_degree(line):
+    assert ResumeEducationExtractor().parse_lines([line]) == []
+
+
+@pytest.mark.parametrize("line, degree", [
+    ("MS in Computer Science, Stanford University 2019", "M.Sc"),
+    ("BE - Mechanical, Pune University", "B.Tech"),
+    ("BS (2015)", "B.Sc"),
+])
+def test_bare_abbreviation_with_degree_context_is_a_degree(line, degree):
+    records = ResumeEducationExtractor().parse_lines([line])
+    assert [r["degree"] for r in records] == [degree]
+
+
+def test_batch_reports_highest_degree_rank_and_grade():
+    resume = {"sections": {"EDUCATION": (
+        "B.Tech in Computer Science, IIT Delhi 2015 - 2019, CGPA 8.2/10\n"
+        "M.Tech in Data Science, IIT Bombay 2019 - 2021, CGPA 9.0/10"
+    )}}
+    result = ResumeEducationExtractor().extract_batch([resume])[0]
+    assert result["highest_degree_level"] > 3
+    assert result["highest_degree_rank"] == round(result["highest_degree_level"] / 5, 2)
+    assert result["highest_degree_grade"] == 0.9
+
+
+def test_batch_without_education_has_no_degree():
+    result = ResumeEducationExtractor().extract_batch([{"sections": {}}])[0]
+    assert result["highest_degree"] is None
+    assert result["highest_degree_rank"] == 0.0
+    assert result["highest_degree_grade"] is None
+
+
+@pytest.mark.parametrize("line, end_year, percentage", [
+    ("HSC 2016 - 85%", 2016, 85.0),
+    ("SSC 2013 – 91%", 2013, 91.0),
+    ("Class XII (CBSE) 2016 – 92.4%", 2016, 92.4),
+])
+def test_percentage_after_year_is_not_a_short_end_year(line, end_year, percentage):
+    record = ResumeEducationExtractor().parse_lines([line])[0]
+    assert (record["end_year"], record["percentage"]) == (end_year, percentage)
+
+
+def test_short_end_year_still_parses():
+    record = ResumeEducationExtractor().parse_lines(["B.Tech 2019-21"])[0]
+    assert (record["start_year"], record["end_year"]) == (2019, 2021)
+
+
+def test_city_after_school_name_is_not_the_field():
+    record = ResumeEducationExtractor().parse_lines(["St. Xavier's High School, Mumbai"])[0]
+    assert record["field"] is None
+    assert record["institution"] == "St. Xavier's High School"
@@ -0,0 +1,73 @@
+import asyncio
+import json
+
+from M2_resume_exp_extractor import ExperienceExtractorAndParser
+
+
+class RecordingClient:
+    def __init__(self):
+        self.prompts = []
+
+    async def achat(self, messages, **kwargs):
+        self.prompts.append(messages)
+        ids = [line.split()[2] for line in messages[1]["content"].splitlines() if line.startswith("=== RESUME")]
+        return json.dumps([{"id": item_id, "experience": []} for item_id in ids] or {"experience": []})
+
+    def cached_chat(self, *args, **kwargs):
+        return None
+
+    def evict_cached(self, *args, **kwargs):
+        pass
+
+
+class DirectScheduler:
+    async def submit(self, job, tokens=0):
+        return await job()
+
+
+def resume(name, confidence, experience="Software Engineer, Acme Inc  Jan 2019 - Present\nBuilt APIs"):
+    return {
+        "sections": {"HEADER": f"{name}\n{name.lower()}@example.com", "EXPERIENCE": experience},
+        "contact_info": {"name": name, "email": f"{name.lower()}@example.com", "confidence": confidence},
+    }
+
+
+def test_packs_only_resumes_needing_the_same_fields():
+    client = RecordingClient()
+    extractor = ExperienceExtractorAndParser(client=client, scheduler=DirectScheduler(), mode="llm")
+    resumes = [resume("Ann", 1.0), resume("Bob", 0.3), resume("Cid", 1.0), resume("Dee", 0.3)]
+    asyncio.run(extractor.extract_and_parse_packed_async(resumes))
+
+    assert len(client.prompts) == 2
+    for messages in client.prompts:
+        system, user = messages[0]["content"], messages[1]["content"]
+        # Trusted resumes are sent without their header and never asked for contact fields
+        assert "ann@example.com" not in user and "cid@example.com" not in user
+        assert ("- name (" in system) == ("bob@example.com" in user and "dee@example.com" in user)
+
+
+def test_header_only_resumes_are_not_asked_for_experience():
+    client = RecordingClient()
+    extractor = ExperienceExtractorAndParser(
+        client=client, scheduler=DirectScheduler(), mode="hybrid", local_confidence_threshold=0.0
+    )
+    asyncio.run(extractor.extract_and_parse_packed_async([resume("Bob", 0.3), resume("Dee", 0.3)]))
+
+    assert len(client.prompts) == 1
+    system = client.prompts[0][0]["content"]
+    assert "- name (" in system
+    assert "experience" not in system
+
+
+def test_cached_responses_skip_the_scheduler():
+    class CachedClient(RecordingClient):
+        def cached_chat(self, messages, *args, **kwargs):
+            return json.dumps({"experience": []})
+
+    class FailingScheduler:
+        async def submit(self, job, tokens=0):
+            raise AssertionError("cached response was scheduled")
+
+    extractor = ExperienceExtractorAndParser(client=CachedClient(), scheduler=FailingScheduler(), mode="llm")
+    results = asyncio.run(extractor.extract_and_parse_packed_async([resume("Bob", 0.3)]))
+    assert "error" not in results[0]
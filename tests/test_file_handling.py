@@ -0,0 +1,53 @@
+from io import BytesIO
+
+from docx import Document
+
+from M1_file_handling import ResumeParser
+
+
+def make_docx(text: str, filename: str = "resume.docx") -> BytesIO:
+    document = Document()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    buffer = BytesIO()
+    document.save(buffer)
+    buffer.seek(0)
+    buffer.filename = filename
+    return buffer
+
+
+def test_process_pool_does_not_fork():
+    parser = ResumeParser(process_workers=2)
+    try:
+        uploads = [make_docx(f"Jane Doe\nSKILLS\nPython {i}", f"r{i}.docx") for i in range(2)]
+        results = parser.parse_resumes_process(uploads)
+        assert [r["sections"]["SKILLS"] for r in results] == ["Python 0", "Python 1"]
+        assert parser._process_pool._mp_context.get_start_method() != "fork"
+    finally:
+        parser.shutdown_process_pool()
+
+
+def test_headline_under_single_word_name_is_not_the_name():
+    contact = ResumeParser().extract_contact_info("PRIYANKA\nData Analyst\npriya@example.com | +91 98765 43210")
+    assert contact["name"] == "PRIYANKA"
+    # Email and phone alone do not make the contact trusted
+    assert contact["confidence"] < 0.8
+
+
+def test_full_name_on_first_line_is_trusted():
+    contact = ResumeParser().extract_contact_info("Priyanka Sharma\nData Analyst\npriya@example.com | +91 98765 43210")
+    assert contact["name"] == "Priyanka Sharma"
+    assert contact["confidence"] >= 0.8
+
+
+def test_name_is_not_taken_from_a_section():
+    contact = ResumeParser().extract_contact_info("SKILLS\nPython Django\nJohn Smith")
+    assert contact["name"] is None
+
+
+def test_phone_followed_by_line_starting_with_digits():
+    contact = ResumeParser().extract_contact_info(
+        "Priyanka Sharma\npriya@example.com\nMobile: 9876543210\n2018 - 2022 B.Tech, IIT Delhi"
+    )
+    assert contact["phone"] is not None
+    assert "".join(ch for ch in contact["phone"] if ch.isdigit()).endswith("9876543210")
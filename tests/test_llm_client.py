@@ -0,0 +1,28 @@
+import asyncio
+
+from caching import LLMResponseCache
+from llm_client import LLMClient
+
+
+def test_async_client_from_previous_loop_is_closed():
+    client = LLMClient(api_key="test")
+
+    async def get():
+        return await client._get_async_client()
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+    assert second is not first
+    assert first.is_closed
+    assert not second.is_closed
+    asyncio.run(client.aclose())
+
+
+def test_cached_chat_answers_only_from_the_cache():
+    client = LLMClient(api_key="test", cache=LLMResponseCache())
+    messages = [{"role": "user", "content": "hi"}]
+    assert client.cached_chat(messages, "1") is None
+    key = client._cache_key(client.build_body(messages), "1")
+    client.cache.put(key, {"choices": [{"message": {"content": "hello"}}]})
+    assert client.cached_chat(messages, "1") == "hello"
+    assert client.cached_chat(messages, "2") is None
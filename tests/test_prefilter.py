@@ -0,0 +1,57 @@
+from M3_resume_skills_extractor import SkillExtractor
+from prefilter import BM25Prefilter
+
+
+def make_prefilter():
+    extractor = SkillExtractor()
+    return BM25Prefilter(scanner=extractor.scanner, skill_sections=extractor.skill_keys)
+
+
+def test_ambiguous_skills_match_in_skill_sections():
+    ranking = make_prefilter().rank(
+        [{"SKILLS": "React, Spark, Flask"}, {"SKILLS": "Cooking"}],
+        {"skills": ["React", "Spark", "Flask"]}
+    )
+    assert ranking[0]["prefilter_score"] > 0
+    assert ranking[1]["prefilter_score"] == 0
+    assert [r["prefilter_rank"] for r in ranking] == [1, 2]
+
+
+def test_raw_skill_words_match_without_skill_sections():
+    # Without skill sections ambiguous aliases are not indexed, but their words still are
+    ranking = BM25Prefilter().rank(
+        [{"SKILLS": "React, Spark, Flask"}, {"SKILLS": "Cooking"}],
+        {"skills": ["React", "Spark", "Flask"]}
+    )
+    assert ranking[0]["prefilter_score"] > ranking[1]["prefilter_score"]
+
+
+def test_alias_matches_canonical_skill():
+    ranking = make_prefilter().rank(
+        [{"EXPERIENCE": "Cooking and baking"}, {"EXPERIENCE": "Deployed services on K8s"}],
+        {"skills": ["Kubernetes"]}
+    )
+    assert [r["prefilter_rank"] for r in ranking] == [2, 1]
+
+
+def test_shortlist_keeps_best_ranked_in_input_order():
+    ranking = [{"prefilter_rank": 3}, {"prefilter_rank": 1}, {"prefilter_rank": 2}]
+    assert BM25Prefilter.shortlist(ranking, 2) == [1, 2]
+    assert BM25Prefilter.shortlist(ranking, 0) == [0, 1, 2]
+
+
+def test_nothing_is_dropped_without_a_usable_query():
+    prefilter = make_prefilter()
+    sections = [{"SKILLS": f"Skill {i}"} for i in range(30)]
+    for parsed_jd in ({"error": "JD parse failed"}, {"skills": [], "responsibilities": []}, {"skills": ["Haskell"]}):
+        ranking = prefilter.rank(sections, parsed_jd)
+        assert all(entry["prefilter_rank"] is None for entry in ranking)
+        assert prefilter.shortlist(ranking, 20) == list(range(30))
+
+
+def test_documents_tokenized_once_rank_for_several_jds():
+    prefilter = make_prefilter()
+    sections = [{"SKILLS": "React, Flask"}, {"EXPERIENCE": "Deployed services on K8s"}]
+    documents = [prefilter.document_terms(s) for s in sections]
+    for parsed_jd in ({"skills": ["Flask"]}, {"skills": ["Kubernetes"]}):
+        assert prefilter.rank_documents(documents, parsed_jd) == prefilter.rank(sections, parsed_jd)
@@ -0,0 +1,53 @@
+from M5_resume_projects import ProjectsExtractor
+
+SECTION = """Resume Screener
+- Ranked resumes against job descriptions with FastAPI and NumPy
+https://github.com/jane/resume-screener
+Chat App (React, Node.js)
+GitHub: github.com/jane/chat-app
+- Real-time chat with WebSockets"""
+
+
+def test_link_lines_attach_to_current_project():
+    records = ProjectsExtractor().extract_and_clean({"sections": {"PROJECTS": SECTION}})
+    assert [r["title"] for r in records] == ["Resume Screener", "Chat App"]
+    assert records[0]["links"] == ["https://github.com/jane/resume-screener"]
+    assert records[1]["links"] == ["github.com/jane/chat-app"]
+    assert records[1]["bullets"] == ["Real-time chat with WebSockets"]
+
+
+def test_url_is_never_a_project_title():
+    section = "https://github.com/jane/tool\nCLI Tool\n- Parses logs in Go"
+    projects = ProjectsExtractor().segment_projects(section)
+    assert [p["title"] for p in projects] == ["CLI Tool"]
+    assert projects[0]["links"] == ["https://github.com/jane/tool"]
+
+
+def test_unbulleted_description_lines_stay_in_their_project():
+    section = (
+        "Auth Service\n"
+        "Implemented auth with JWT tokens\n"
+        "Added rate limiting to the login API\n"
+        "Expense Tracker\n"
+        "Tracked monthly spending with charts"
+    )
+    projects = ProjectsExtractor().segment_projects(section)
+    assert [p["title"] for p in projects] == ["Auth Service", "Expense Tracker"]
+    assert projects[0]["bullets"] == ["Implemented auth with JWT tokens", "Added rate limiting to the login API"]
+
+
+def test_bullet_glyph_on_its_own_line_belongs_to_the_next_line():
+    section = (
+        "Auth Service\n"
+        "•\n"
+        "Implemented auth with JWT tokens\n"
+        "•\n"
+        "Short summary line\n"
+        "Expense Tracker\n"
+        "•\n"
+        "Tracked monthly spending"
+    )
+    projects = ProjectsExtractor().segment_projects(section)
+    assert [p["title"] for p in projects] == ["Auth Service", "Expense Tracker"]
+    assert projects[0]["bullets"] == ["Implemented auth with JWT tokens", "Short summary line"]
+    assert projects[1]["bullets"] == ["Tracked monthly spending"]
@@ -0,0 +1,59 @@
+import asyncio
+import json
+
+from M7_scoring import ResumeJDScorerAsync
+
+SCORE = {
+    "skills_score": 0.8, "experience_score": 0.6, "education_score": 1.0,
+    "project_relevance_score": 0.5, "domain_match_score": 1.0, "missing_skills": []
+}
+
+
+class FakeClient:
+    model = "test-model"
+
+    def __init__(self, cached):
+        self.cached = cached
+        self.calls = []
+
+    def cached_chat(self, messages, prompt_version, **kwargs):
+        return json.dumps(SCORE) if self.cached else None
+
+    async def achat(self, messages, **kwargs):
+        self.calls.append(kwargs)
+        return json.dumps(SCORE)
+
+    def evict_cached(self, *args, **kwargs):
+        pass
+
+
+class CountingScheduler:
+    def __init__(self):
+        self.submitted = 0
+
+    async def submit(self, job, tokens=0):
+        self.submitted += 1
+        return await job()
+
+    async def run_batch(self, jobs, tokens=None):
+        return [await self.submit(job) for job in jobs]
+
+
+RESUME = {"skills": ["Python"], "experience": [], "education": [], "projects": [], "contact_info": {"name": "Ann"}}
+JD = {"skills": ["Python"], "responsibilities": ["Build APIs"]}
+
+
+def test_cached_responses_skip_the_scheduler():
+    scheduler = CountingScheduler()
+    scorer = ResumeJDScorerAsync(client=FakeClient(cached=True), scheduler=scheduler)
+    results = asyncio.run(scorer.score_resumes_batch([RESUME] * 3, JD))
+    assert scheduler.submitted == 0
+    assert all(r["skills_score"] == 80.0 for r in results)
+
+
+def test_uncached_calls_are_scheduled_without_client_retries():
+    client, scheduler = FakeClient(cached=False), CountingScheduler()
+    scorer = ResumeJDScorerAsync(client=client, scheduler=scheduler)
+    asyncio.run(scorer.score_resumes_batch([RESUME] * 2, JD))
+    assert scheduler.submitted == 2
+    assert all(call["retry"] is False and call["use_cache"] is False for call in client.calls)
@@ -0,0 +1,61 @@
+import math
+
+import pytest
+
+from scoring_engine import DEFAULT_WEIGHTS, WeightedScorer, normalize_weights
+
+ENTRY = {"experience_score": 80, "skills_score": 60, "education_score": 100, "project_score": 40}
+
+
+def test_normalize_weights_merges_defaults_and_sums_to_one():
+    weights = normalize_weights({"skills": 0.9})
+    assert set(weights) == set(DEFAULT_WEIGHTS)
+    assert math.isclose(sum(weights.values()), 1.0, abs_tol=1e-5)
+    assert weights["skills"] > weights["experience"]
+
+
+@pytest.mark.parametrize("weights", [
+    {"salary": 1.0},
+    {"skills": -1.0},
+    {"skills": "high"},
+    {"skills": True},
+    {"skills": float("nan")},
+    {name: 0 for name in DEFAULT_WEIGHTS},
+])
+def test_normalize_weights_rejects_invalid(weights):
+    with pytest.raises(ValueError):
+        normalize_weights(weights)
+
+
+def test_weighted_sum_and_domain_adjustment():
+    weights = {"experience": 1, "skills": 1, "education": 0, "projects": 0}
+    entries = [dict(ENTRY), dict(ENTRY, domain_match_score=50)]
+    WeightedScorer(weights).apply(entries)
+    assert entries[0]["final_score"] == entries[0]["match_percent"] == 70.0
+    assert entries[1]["final_score"] == 70.0
+    assert entries[1]["match_percent"] == 35.0
+
+
+def test_weights_per_call_override_the_default():
+    scorer = WeightedScorer()
+    final, _ = scorer.score([ENTRY], {"experience": 0, "skills": 0, "education": 1, "projects": 0})
+    assert final[0] == 100.0
+
+
+def test_missing_component_counts_as_zero():
+    final, _ = WeightedScorer({"experience": 1, "skills": 1, "education": 0, "projects": 0}).score(
+        [{"skills_score": 60}]
+    )
+    assert final[0] == 30.0
+
+
+def test_unscored_entries_are_nan():
+    entries = [{"error": "LLM failed", "skills_score": 90}, {"name": "no scores"}, dict(ENTRY)]
+    WeightedScorer().apply(entries)
+    assert entries[0]["match_percent"] == entries[1]["match_percent"] == "NaN"
+    assert isinstance(entries[2]["match_percent"], float)
+
+
+def test_without_domain_match_adjusted_equals_final():
+    final, adjusted = WeightedScorer(apply_domain_match=False).score([dict(ENTRY, domain_match_score=10)])
+    assert adjusted[0] == final[0]
@@ -0,0 +1,18 @@
+from skill_taxonomy import SkillScanner
+
+
+def canonical(found):
+    return {name for _, _, name in found}
+
+
+def test_tool_names_count_in_prose():
+    found = SkillScanner().find("Built ETL pipelines in Airflow and Spark, served with Flask and tracked in Git")
+    assert {"airflow", "spark", "flask", "git"} <= canonical(found)
+
+
+def test_ordinary_words_only_count_in_skill_sections():
+    scanner = SkillScanner()
+    sections = {"EXPERIENCE": "Helped the team react to the rest of the incidents", "SKILLS": "Go, React"}
+    skills = scanner.scan(sections, skill_sections=["SKILLS"])
+    assert skills["react"]["sections"] == ["SKILLS"]
+    assert "rest" not in canonical(scanner.find(sections["EXPERIENCE"]))
@@ -0,0 +1,133 @@
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+BULLET_PREFIX_RE = re.compile(r'^\s*(?:[-*•●▪■◦‣–—>]|\d{1,2}[.)])\s*')
+WHITESPACE_RE = re.compile(r'\s+')
+NORMALIZE_RE = re.compile(r'[^\w+#]+')
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting (about 4 characters per token for English text)"""
+    return len(text) // 4 + 1
+
+
+def compact_json(value: Any) -> str:
+    """JSON without indentation or spaces after separators"""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to about max_tokens, at a word boundary, marking the cut with an ellipsis"""
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    space = cut.rfind(' ')
+    if space > max_chars // 2:
+        cut = cut[:space]
+    return cut.rstrip(' ,;:.') + '…'
+
+
+def compact_items(items: List[str], max_tokens: int, max_item_tokens: Optional[int] = None) -> List[str]:
+    """Strip bullets and extra whitespace, drop duplicates, cap each item and the total.
+
+    Items are kept in order until the budget runs out (the one that overflows
+    it is truncated); multi-line items are split into one item per line first.
+    """
+    compacted = []
+    seen = set()
+    used = 0
+    for item in items:
+        for line in str(item).split('\n'):
+            line = WHITESPACE_RE.sub(' ', BULLET_PREFIX_RE.sub('', line)).strip()
+            if not line:
+                continue
+            key = NORMALIZE_RE.sub(' ', line.lower()).strip()
+            if key in seen:
+                continue
+            seen.add(key)
+            if max_item_tokens:
+                line = truncate_to_tokens(line, max_item_tokens)
+            cost = estimate_tokens(line) + 1
+            if used + cost > max_tokens:
+                # The item that overflows is cut to the budget that is left
+                if max_tokens - used > 10:
+                    compacted.append(truncate_to_tokens(line, max_tokens - used - 1))
+                return compacted
+            compacted.append(line)
+            used += cost
+    return compacted
+
+
+def compact_text(text: str, max_tokens: int, max_item_tokens: Optional[int] = None) -> str:
+    """compact_items over the lines of a text block"""
+    return '\n'.join(compact_items(text.split('\n'), max_tokens, max_item_tokens))
+
+
+class PromptCompactor:
+    """Shrinks a dict of prompt fields to per-field token budgets.
+
+    `budgets` maps field names to token budgets in priority order: fields
+    are compacted in that order and any budget a field leaves unused rolls
+    over to the next one. Strings and lists of strings are deduplicated and
+    truncated line by line; lists of dicts (e.g. experience entries) keep
+    whole entries in order, with their string lists compacted, until the
+    budget is spent. Fields without a budget are passed through.
+    """
+
+    def __init__(self, budgets: Dict[str, int], max_item_tokens: int = 60):
+        self.budgets = budgets
+        self.max_item_tokens = max_item_tokens
+
+    def _compact_entry(self, entry: Dict[str, Any], budget: int) -> Dict[str, Any]:
+        compacted = {}
+        for key, value in entry.items():
+            if value in (None, '', [], {}):
+                continue
+            if isinstance(value, list) and all(isinstance(v, str) for v in value):
+                value = compact_items(value, budget, self.max_item_tokens)
+            elif isinstance(value, str):
+                value = truncate_to_tokens(WHITESPACE_RE.sub(' ', value).strip(), self.max_item_tokens)
+            compacted[key] = value
+        return compacted
+
+    def _compact_value(self, value: Any, budget: int) -> Any:
+        if isinstance(value, str):
+            return compact_text(value, budget, self.max_item_tokens)
+        if not isinstance(value, list):
+            return value
+        if all(isinstance(v, str) for v in value):
+            return compact_items(value, budget, self.max_item_tokens)
+
+        kept = []
+        remaining = budget
+        for index, entry in enumerate(value):
+            if not isinstance(entry, dict):
+                entry = {'text': str(entry)}
+            # Each entry's lists get a fair share of what is left, so one long entry can't crowd out the rest
+            compacted = self._compact_entry(entry, remaining // (len(value) - index))
+            cost = estimate_tokens(compact_json(compacted))
+            if cost > remaining:
+                # Whatever budget is left goes to a shortened version of this entry
+                header_cost = estimate_tokens(compact_json({k: v for k, v in compacted.items() if not isinstance(v, list)}))
+                if remaining - header_cost > 20:
+                    kept.append(self._compact_entry(entry, remaining - header_cost))
+                break
+            kept.append(compacted)
+            remaining -= cost
+        return kept
+
+    def compact(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        compacted = dict(fields)
+        carry = 0
+        for name, budget in self.budgets.items():
+            if name not in fields:
+                carry += budget
+                continue
+            available = budget + carry
+            value = self._compact_value(fields[name], available)
+            compacted[name] = value
+            used = estimate_tokens(value if isinstance(value, str) else compact_json(value))
+            carry = max(0, available - used)
+        return compacted